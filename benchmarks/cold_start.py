@@ -0,0 +1,95 @@
+"""Cold-start benchmark of the Lambda app.
+
+Every run starts a fresh interpreter that imports `lambda_function` the way the Lambda runtime does, with
+Secrets Manager replaced by a local stand-in that simulates the network round trip, then builds the clients
+the first requests need. It reports the cumulative import time of the app modules and of their heaviest
+dependencies (from `python -X importtime`), and the time and round trips spent initialising.
+
+    $ python benchmarks/cold_start.py --runs 5 --secrets-latency-ms 30
+"""
+import argparse
+import json
+import os
+import statistics
+
+from stand_ins import run_with_importtime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+REPORTED_MODULES = [
+    'lambda_function', 'flask_asgi', 'app', 'config', 'mangum', 'flask', 'flask_limiter', 'botocore', 'boto3',
+    'numpy', 'openai', 'pydantic',
+]
+
+DRIVER = """
+import json, sys, time
+sys.path.insert(0, {benchmarks_dir!r})
+started = time.perf_counter()
+from stand_ins import StandInSecretsManager, use_lambda_dir
+use_lambda_dir(bundle_first={bundle_first!r})
+import config
+secrets_manager = StandInSecretsManager(latency={latency!r})
+config.secrets._client = secrets_manager
+import lambda_function
+import app
+imported = time.perf_counter()
+init = {{'secrets': {{'round_trips': secrets_manager.round_trips, 'seconds': config.secrets.fetch_seconds}}}}
+for name in ('client', 's3_client'):
+    lazy = getattr(app, name)
+    lazy.get()
+    init[name] = lazy.build_seconds
+print(json.dumps({{'import_seconds': imported - started, 'init': init}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Cumulative import time in seconds of every top-level module, from `-X importtime` output."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name.isidentifier() and total.strip().isdigit():
+            cumulative[name] = int(total) / 1e6
+    return cumulative
+
+
+def run_once(latency, bundle_first):
+    driver = DRIVER.format(benchmarks_dir=BENCHMARKS_DIR, latency=latency, bundle_first=bundle_first)
+    completed = run_with_importtime(driver)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Cold start run failed:\n{completed.stderr[-3000:]}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['modules'] = parse_importtime(completed.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--secrets-latency-ms', type=float, default=30.0)
+    parser.add_argument('--installed-packages', action='store_true',
+                        help="prefer the interpreter's installed packages over the bundled ones")
+    args = parser.parse_args()
+
+    runs = [run_once(args.secrets_latency_ms / 1000, not args.installed_packages) for _ in range(args.runs)]
+
+    def median_ms(values):
+        values = [value for value in values if value is not None]
+        return f"{statistics.median(values) * 1000:8.1f} ms" if values else "       - "
+
+    print(f"Cold start over {args.runs} runs (median)")
+    print(f"  {'import lambda_function, secrets included':40} {median_ms(run['import_seconds'] for run in runs)}")
+    print("Cumulative import time per module, lazy imports on first use included")
+    for module in REPORTED_MODULES:
+        print(f"  {module:40} {median_ms(run['modules'].get(module) for run in runs)}")
+    print("Initialisation")
+    print(f"  {'secrets (round trips: %d)' % runs[0]['init']['secrets']['round_trips']:40} "
+          f"{median_ms(run['init']['secrets']['seconds'] for run in runs)}")
+    print(f"  {'OpenAI client, on first use':40} {median_ms(run['init']['client'] for run in runs)}")
+    print(f"  {'S3 client, on first use':40} {median_ms(run['init']['s3_client'] for run in runs)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Per-request overhead benchmark of the Lambda entry points.
+
+Invokes the app with function URL events, the way the Lambda runtime does once the container is warm, through
+Mangum and `flask_asgi.asgi_app` (WsgiToAsgi on an event loop and a worker thread) and through the direct WSGI
+handler of lambda_function.py, and calls the Flask app on a ready-made environ as the baseline the adapters
+add to. Rate limits are switched off so every request reaches its view.
+
+    $ python benchmarks/lambda_adapter.py --requests 2000
+"""
+import argparse
+import base64
+import statistics
+import time
+
+from stand_ins import StandInSecretsManager, StandInS3, use_lambda_dir
+
+
+def function_url_event(method, path, body=b''):
+    return {
+        'version': '2.0', 'rawPath': path, 'rawQueryString': '',
+        'headers': {'host': 'abc.lambda-url.us-east-1.on.aws', 'user-agent': 'benchmark',
+                    'x-forwarded-proto': 'https', 'x-forwarded-port': '443', 'content-type': 'application/json',
+                    'content-length': str(len(body))},
+        'requestContext': {'http': {'method': method, 'path': path, 'sourceIp': '203.0.113.7'}},
+        'body': base64.b64encode(body).decode(), 'isBase64Encoded': True,
+    }
+
+
+def time_calls(call, requests):
+    """Median seconds of `call` over `requests` calls, after a few warm-up ones."""
+    for _ in range(20):
+        call()
+    durations = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--installed-packages', action='store_true',
+                        help="prefer the interpreter's installed packages over the bundled ones")
+    args = parser.parse_args()
+
+    use_lambda_dir(bundle_first=not args.installed_packages)
+    import config
+    config.secrets._client = StandInSecretsManager(latency=0)
+    # Sessions are saved to S3 by the deployed app
+    config.build_s3_client = StandInS3
+    import lambda_function
+    from app import app, limiter
+    from wsgi_lambda import build_environ
+    limiter.enabled = False
+
+    requests = [
+        ("GET /api/index_status", function_url_event('GET', '/api/index_status')),
+        ("POST /api/clear_session", function_url_event('POST', '/api/clear_session', b'{}')),
+        ("GET / (HTML page)", function_url_event('GET', '/')),
+    ]
+    print(f"Median time per request over {args.requests} warm invocations")
+    print(f"  {'request':26} {'Flask alone':>12} {'Mangum + ASGI':>14} {'direct WSGI':>12} {'saved':>10}")
+    for name, event in requests:
+        lambda_handler = lambda_function.wsgi_handler.infer(event, None)
+        scope, body = lambda_handler.scope, lambda_handler.body
+
+        def flask_alone():
+            b"".join(app(build_environ(scope, body), lambda status, headers, exc_info=None: None))
+
+        baseline = time_calls(flask_alone, args.requests)
+        mangum = time_calls(lambda: lambda_function.asgi_handler(event, None), args.requests)
+        direct = time_calls(lambda: lambda_function.handler(event, None), args.requests)
+        print(f"  {name:26} {baseline * 1e6:>9.0f} us {mangum * 1e6:>11.0f} us {direct * 1e6:>9.0f} us "
+              f"{(mangum - direct) * 1e6:>7.0f} us")
+
+
+if __name__ == '__main__':
+    main()
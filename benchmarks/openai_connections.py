@@ -0,0 +1,89 @@
+"""Connection reuse benchmark of the OpenAI clients.
+
+Sends chat completions to a local stand-in of the API, which delays the first request of every new
+connection to stand in for the TCP and TLS handshakes, with a pause between requests like the one
+between the invocations of a warm container. It compares a client built per request, a client with the
+SDK's default pool, whose idle connections expire after 5 seconds, and the sync and async clients built
+by config.py, and reports the new connections and the median time per request of each.
+
+    $ python benchmarks/openai_connections.py --requests 4 --idle-seconds 6 --handshake-ms 60
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from stand_ins import StandInOpenAIServer, StandInSecretsManager, use_lambda_dir
+
+MESSAGES = [{"role": "user", "content": "Who is the manager?"}]
+
+
+def time_requests(server, requests, idle_seconds, complete):
+    """Run `complete` once per request with a pause in between; return the seconds and connections they took."""
+    connections = server.connections
+    durations = []
+    for position in range(requests):
+        if position:
+            time.sleep(idle_seconds)
+        started = time.perf_counter()
+        complete()
+        durations.append(time.perf_counter() - started)
+    return durations, server.connections - connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=4)
+    parser.add_argument('--idle-seconds', type=float, default=6.0,
+                        help="pause between requests; above 5 s, the SDK's default pool has closed the connection")
+    parser.add_argument('--handshake-ms', type=float, default=60.0)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--installed-packages', action='store_true',
+                        help="prefer the interpreter's installed packages over the bundled ones")
+    args = parser.parse_args()
+
+    use_lambda_dir(bundle_first=not args.installed_packages)
+    import config
+    from openai import OpenAI
+    config.secrets._client = StandInSecretsManager(latency=0)
+
+    with StandInOpenAIServer(args.handshake_ms / 1000, args.latency_ms / 1000) as server:
+        os.environ['OPENAI_BASE_URL'] = server.base_url
+
+        def per_request():
+            with OpenAI(api_key="stand-in") as client:
+                client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        default_client = OpenAI(api_key="stand-in")
+        sync_client = config.build_openai_client()
+        async_client = config.build_async_openai_client()
+        # Mangum runs every invocation of a container on the same event loop
+        loop = asyncio.new_event_loop()
+
+        scenarios = [
+            ("client per request", per_request),
+            ("default pool, 5 s keep-alive", lambda: default_client.chat.completions.create(
+                model="gpt-4o-mini", messages=MESSAGES)),
+            ("OpenAI, configured pool", lambda: sync_client.chat.completions.create(
+                model="gpt-4o-mini", messages=MESSAGES)),
+            ("AsyncOpenAI, configured pool", lambda: loop.run_until_complete(async_client.chat.completions.create(
+                model="gpt-4o-mini", messages=MESSAGES))),
+        ]
+        results = [(name, *time_requests(server, args.requests, args.idle_seconds, complete))
+                   for name, complete in scenarios]
+        loop.run_until_complete(async_client.close())
+        loop.close()
+
+    print(f"{args.requests} completions {args.idle_seconds:g} s apart, {args.handshake_ms:g} ms handshake, "
+          f"{args.latency_ms:g} ms latency, keep-alive {config.OPENAI_KEEPALIVE_SECONDS:g} s")
+    print(f"  {'client':32} {'connections':>11} {'first':>10} {'median of the rest':>20}")
+    baseline = statistics.median(results[0][1][1:] or results[0][1])
+    for name, durations, connections in results:
+        rest = statistics.median(durations[1:] or durations)
+        print(f"  {name:32} {connections:>11} {durations[0] * 1000:>7.1f} ms {rest * 1000:>17.1f} ms"
+              f"   saves {(baseline - rest) * 1000:5.1f} ms per warm request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Microbenchmark of the in-memory rate limit storages.
+
+Hits fixed-window and moving-window limits for many client addresses, the way Flask-Limiter does for every
+request, with limits' MemoryStorage and rate_limits.HeapMemoryStorage. It reports the time per hit, the CPU
+time of the whole process, which includes the expiry timer threads MemoryStorage starts, and the number of
+threads each storage started.
+
+    $ python benchmarks/rate_limit_storage.py --hits 20000 --clients 500
+"""
+import argparse
+import threading
+import time
+
+from stand_ins import use_lambda_dir
+
+
+class CountedTimer(threading.Timer):
+    started = 0
+
+    def start(self):
+        CountedTimer.started += 1
+        super().start()
+
+
+def run(storage_class, strategy_class, items, hits, clients):
+    """Hit the limits `hits` times over `clients` identities; return wall seconds, CPU seconds and threads."""
+    CountedTimer.started = 0
+    storage = storage_class()
+    limiter = strategy_class(storage)
+    wall, cpu = time.perf_counter(), time.process_time()
+    for position in range(hits):
+        identity = f"10.0.{position % clients // 256}.{position % 256}"
+        for item in items:
+            if not limiter.hit(item, identity, 'message'):
+                break
+    wall = time.perf_counter() - wall
+    # Let the last timer run, as it would between two warm invocations
+    time.sleep(0.05)
+    cpu = time.process_time() - cpu
+    storage.reset()
+    return wall, cpu, CountedTimer.started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hits', type=int, default=20000)
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--installed-packages', action='store_true',
+                        help="prefer the interpreter's installed packages over the bundled ones")
+    args = parser.parse_args()
+
+    use_lambda_dir(bundle_first=not args.installed_packages)
+    threading.Timer = CountedTimer
+    from limits import parse_many
+    from limits.storage import MemoryStorage
+    from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+    from rate_limits import HeapMemoryStorage
+
+    # The message route's limits with the app's defaults
+    items = parse_many("30 per day;100 per day;10 per hour")
+    print(f"{args.hits} hits over {args.clients} clients, limits {'; '.join(str(item) for item in items)}")
+    print(f"  {'strategy':14} {'storage':18} {'per hit':>10} {'process CPU':>12} {'threads':>8}")
+    for strategy_class in (FixedWindowRateLimiter, MovingWindowRateLimiter):
+        for storage_class in (MemoryStorage, HeapMemoryStorage):
+            wall, cpu, threads = run(storage_class, strategy_class, items, args.hits, args.clients)
+            print(f"  {strategy_class.__name__[:-len('RateLimiter')]:14} {storage_class.__name__:18} "
+                  f"{wall / args.hits * 1e6:>7.2f} us {cpu * 1000:>9.1f} ms {threads:>8}")
+
+
+if __name__ == '__main__':
+    main()
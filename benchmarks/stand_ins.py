@@ -0,0 +1,178 @@
+"""Local stand-ins for the AWS services the Lambda app talks to, so it can be imported and exercised offline."""
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from botocore.exceptions import ClientError
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+LAMBDA_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), 'lambda')
+
+
+def use_lambda_dir(bundle_first=True):
+    """Make the Lambda modules importable and give them the environment they expect.
+
+    Like the Lambda runtime, the bundled packages win over installed ones by default. The bundle holds
+    binary wheels for the deployment runtime, so an interpreter of another version may need
+    `bundle_first=False` to fall back to its own installed packages.
+    """
+    if LAMBDA_DIR not in sys.path:
+        if bundle_first:
+            sys.path.insert(0, LAMBDA_DIR)
+        else:
+            sys.path.append(LAMBDA_DIR)
+    os.environ.setdefault('BUCKET_NAME', 'benchmark-bucket')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+
+def run_with_importtime(driver):
+    """Run a driver script in a fresh interpreter under `python -X importtime`.
+
+    It runs from the benchmarks directory so the CDK app.py at the repository root cannot shadow the Lambda one.
+    """
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', driver], capture_output=True, text=True,
+                          cwd=BENCHMARKS_DIR)
+
+
+class StandInSecretsManager:
+    """Secrets Manager stand-in answering every secret id after a simulated network round trip.
+
+    Secrets are returned the way Secrets Manager describes them, with a full ARN ending in a random suffix,
+    whether they were requested by name, by partial ARN or by full ARN.
+    """
+
+    ARN_PREFIX = "arn:aws:secretsmanager:us-east-1:123456789012:secret:"
+    ARN_SUFFIX = "-AbCdEf"
+
+    def __init__(self, latency=0.03):
+        self.latency = latency
+        self.round_trips = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        time.sleep(self.latency)
+
+    def _secret(self, secret_id):
+        name = secret_id[len(self.ARN_PREFIX):] if secret_id.startswith(self.ARN_PREFIX) else secret_id
+        if name.endswith(self.ARN_SUFFIX):
+            name = name[:-len(self.ARN_SUFFIX)]
+        return {'ARN': f"{self.ARN_PREFIX}{name}{self.ARN_SUFFIX}", 'Name': name, 'SecretString': f"stand-in-{name}"}
+
+    def get_secret_value(self, SecretId):
+        self._round_trip()
+        return self._secret(SecretId)
+
+    def batch_get_secret_value(self, SecretIdList):
+        self._round_trip()
+        return {'SecretValues': [self._secret(secret_id) for secret_id in SecretIdList], 'Errors': []}
+
+
+class StandInS3:
+    """In-memory S3 stand-in for the object calls the app makes, with a simulated latency per request."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.objects = {}
+        self.requests = 0
+
+    def _request(self):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _etag(self, Key):
+        return f'"{hashlib.md5(self.objects[Key]).hexdigest()}"'
+
+    def _missing(self, operation):
+        return ClientError({'Error': {'Code': 'NoSuchKey'}, 'ResponseMetadata': {'HTTPStatusCode': 404}}, operation)
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._request()
+        self.objects[Key] = Body if isinstance(Body, bytes) else Body.read()
+        return {'ETag': self._etag(Key)}
+
+    def get_object(self, Bucket, Key, Range=None, **kwargs):
+        self._request()
+        if Key not in self.objects:
+            raise self._missing('GetObject')
+        data = self.objects[Key]
+        if Range:
+            start, end = Range.split('=', 1)[1].split('-')
+            data = data[int(start):int(end) + 1]
+        return {'Body': io.BytesIO(data), 'ContentLength': len(data), 'ETag': self._etag(Key)}
+
+    def head_object(self, Bucket, Key, **kwargs):
+        self._request()
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': '404'}, 'ResponseMetadata': {'HTTPStatusCode': 404}}, 'HeadObject')
+        return {'ContentLength': len(self.objects[Key]), 'ETag': self._etag(Key)}
+
+    def delete_object(self, Bucket, Key, **kwargs):
+        self._request()
+        self.objects.pop(Key, None)
+
+
+STAND_IN_COMPLETION = {
+    'id': 'chatcmpl-stand-in',
+    'object': 'chat.completion',
+    'created': 0,
+    'model': 'gpt-4o-mini',
+    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'Stand-in answer.'},
+                 'finish_reason': 'stop'}],
+}
+
+
+class StandInOpenAIServer:
+    """Local stand-in of the OpenAI chat completions endpoint, over plain HTTP on a background thread.
+
+    Every new connection waits `handshake` seconds before its first request is read, standing in for the
+    TCP and TLS handshakes with the API, and every completion takes `latency` seconds. Connections are
+    counted, so a benchmark can tell how many handshakes its client paid for.
+    """
+
+    def __init__(self, handshake=0.06, latency=0.02):
+        self.handshake = handshake
+        self.latency = latency
+        self.connections = 0
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                with stand_in._lock:
+                    stand_in.connections += 1
+                time.sleep(stand_in.handshake)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                time.sleep(stand_in.latency)
+                body = json.dumps(STAND_IN_COMPLETION).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
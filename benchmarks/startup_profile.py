@@ -0,0 +1,120 @@
+"""Startup import profile of the Lambda bundle, checked against a budget.
+
+Imports `lambda_function` in a fresh interpreter under `python -X importtime`, with local stand-ins for
+Secrets Manager and S3, and aggregates the self import time of every module into its top-level package.
+Exits with status 1 when the total or any package exceeds its budget in `startup_budget.json`; a package
+budget of 0 means the package must not be imported at startup at all.
+
+The bundle's compiled extensions are built for the function's Python 3.9 and are not committed, so CI profiles
+the bundled package versions installed into a Python 3.9 interpreter instead. `--no-deps` installs exactly the
+bundled set, as pip resolved it when the bundle was built:
+
+    $ python benchmarks/startup_profile.py --bundled-requirements > bundled-requirements.txt
+    $ pip install --no-deps -r bundled-requirements.txt
+    $ python benchmarks/startup_profile.py --installed-packages
+"""
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+from stand_ins import run_with_importtime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+LAMBDA_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), 'lambda')
+DEFAULT_BUDGET = os.path.join(BENCHMARKS_DIR, 'startup_budget.json')
+
+DRIVER = """
+import sys
+sys.path.insert(0, {benchmarks_dir!r})
+from stand_ins import StandInSecretsManager, StandInS3, use_lambda_dir
+use_lambda_dir(bundle_first={bundle_first!r})
+import config
+config.secrets._client = StandInSecretsManager(latency=0)
+config.build_s3_client = StandInS3
+import lambda_function
+"""
+
+
+def parse_self_times(stderr):
+    """(module, self seconds) pairs from `-X importtime` output."""
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():
+            yield name.strip(), int(self_time) / 1e6
+
+
+def aggregate_by_package(self_times):
+    """Sum self import times per top-level package, so a package's total covers all its submodules."""
+    packages = defaultdict(float)
+    for module, seconds in self_times:
+        packages[module.split('.')[0]] += seconds
+    return dict(packages)
+
+
+def bundled_requirements(lambda_dir=LAMBDA_DIR):
+    """Pinned requirements of the package versions vendored into the bundle, read from their metadata directories."""
+    return sorted(name[:-len('.dist-info')].replace('-', '==', 1)
+                  for name in os.listdir(lambda_dir) if name.endswith('.dist-info'))
+
+
+def profile_startup(bundle_first=True):
+    driver = DRIVER.format(benchmarks_dir=BENCHMARKS_DIR, bundle_first=bundle_first)
+    completed = run_with_importtime(driver)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing lambda_function failed:\n{completed.stderr[-3000:]}")
+    return aggregate_by_package(parse_self_times(completed.stderr))
+
+
+def check_budget(packages, budget):
+    """Return a message for every budget the profile exceeds."""
+    violations = []
+    total_ms = sum(packages.values()) * 1000
+    if total_ms > budget['total_ms']:
+        violations.append(f"total startup imports take {total_ms:.1f} ms, budget is {budget['total_ms']} ms")
+    for package, limit_ms in budget.get('packages_ms', {}).items():
+        if package not in packages:
+            continue
+        package_ms = packages[package] * 1000
+        if limit_ms == 0:
+            violations.append(f"{package} is imported at startup ({package_ms:.1f} ms) but must be imported lazily")
+        elif package_ms > limit_ms:
+            violations.append(f"{package} imports take {package_ms:.1f} ms, budget is {limit_ms} ms")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', default=DEFAULT_BUDGET)
+    parser.add_argument('--top', type=int, default=20, help="number of packages to list")
+    parser.add_argument('--installed-packages', action='store_true',
+                        help="prefer the interpreter's installed packages over the bundled ones")
+    parser.add_argument('--bundled-requirements', action='store_true',
+                        help="print the bundled package versions as pinned requirements and exit")
+    args = parser.parse_args()
+
+    if args.bundled_requirements:
+        print('\n'.join(bundled_requirements()))
+        return
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+
+    packages = profile_startup(bundle_first=not args.installed_packages)
+
+    print(f"Startup imports of lambda_function: {sum(packages.values()) * 1000:.1f} ms "
+          f"in {len(packages)} top-level packages")
+    for package, seconds in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {package:30} {seconds * 1000:8.1f} ms")
+
+    violations = check_budget(packages, budget)
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}")
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+import ast
+import compileall
+import functools
+import importlib.util
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+
+import jsii
+from aws_cdk import ILocalBundling
+
+# Directories and files the function never reads at runtime
+STRIPPED_DIRS = {'tests', 'test', 'bin', '__pycache__'}
+STRIPPED_SUFFIXES = ('.dist-info', '.egg-info')
+STRIPPED_FILE_SUFFIXES = ('.pyc', '.pyi')
+# Packages imported by name at runtime, which tracing import statements cannot see:
+# boto3 registers its S3 transfer methods with `lazy_call('boto3.s3.inject...')`
+RUNTIME_IMPORTS = ('s3transfer',)
+# Packages only imported by debugging helpers and command-line tools the function never runs:
+# pydantic's `pretty_print_core_schema` lazily imports rich, which pulls in pygments and markdown_it
+DEVELOPMENT_IMPORTS = ('rich',)
+OPTIONAL_IMPORT_ERRORS = {'ImportError', 'ModuleNotFoundError'}
+
+
+def _module_file(root, module):
+    """Path of the module's source in the bundle, or None if it is not bundled (stdlib or missing)."""
+    base = os.path.join(root, *module.split('.'))
+    for candidate in (base + '.py', os.path.join(base, '__init__.py')):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _optional_imports(tree):
+    """Import statements guarded by `except ImportError`, whose module the code can do without."""
+    optional = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Try):
+            continue
+        caught = set()
+        for handler in node.handlers:
+            types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+            caught.update(t.id for t in types if isinstance(t, ast.Name))
+        if caught & OPTIONAL_IMPORT_ERRORS:
+            optional.update(id(child) for statement in node.body for child in ast.walk(statement))
+    return optional
+
+
+def _imported_modules(path, module, is_package):
+    """Names of the modules a source file requires, lazy imports included and optional imports left out."""
+    with open(path, 'rb') as f:
+        try:
+            tree = ast.parse(f.read(), filename=path)
+        except SyntaxError:
+            return
+    package = module if is_package else module.rpartition('.')[0]
+    optional = _optional_imports(tree)
+    for node in ast.walk(tree):
+        if id(node) in optional:
+            continue
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split('.')
+                base = '.'.join(parts[:len(parts) - node.level + 1])
+                base = f"{base}.{node.module}" if node.module else base
+            else:
+                base = node.module
+            yield base
+            # `from package import name` imports the submodule when `name` is one
+            for alias in node.names:
+                yield f"{base}.{alias.name}"
+
+
+def trace_imports(root, entry_modules, excluded=()):
+    """Every bundled module reachable through import statements from the entry modules.
+
+    The trace does not enter the top-level packages in `excluded`.
+    """
+    reached = set()
+    pending = list(entry_modules)
+    while pending:
+        module = pending.pop()
+        if module in reached or module.split('.')[0] in excluded:
+            continue
+        path = _module_file(root, module)
+        if path is None:
+            continue
+        reached.add(module)
+        # Importing a submodule runs the __init__ of every parent package
+        parts = module.split('.')
+        pending.extend('.'.join(parts[:i]) for i in range(1, len(parts)))
+        is_package = os.path.basename(path) == '__init__.py'
+        pending.extend(_imported_modules(path, module, is_package))
+    return reached
+
+
+@functools.lru_cache(maxsize=None)
+def reached_packages(root, entry_modules, excluded=()):
+    """Top-level packages of the modules `trace_imports` reaches; cached, since every synth of a stack traces again."""
+    return frozenset(module.split('.')[0] for module in trace_imports(root, entry_modules, excluded))
+
+
+def _vendored_modules(root):
+    """Top-level modules installed into the bundle by pip, as listed in the RECORD of each package's metadata."""
+    vendored = set()
+    for name in os.listdir(root):
+        record = os.path.join(root, name, 'RECORD')
+        if not name.endswith('.dist-info') or not os.path.isfile(record):
+            continue
+        with open(record) as f:
+            for line in f:
+                path = line.split(',', 1)[0]
+                if path and not path.startswith('..'):
+                    vendored.add(path.split('/', 1)[0].rsplit('.py', 1)[0])
+    return vendored
+
+
+def _is_bundled(root, names, module):
+    """Whether a top-level module is in the bundle, as Python sources or as a compiled extension."""
+    return (_module_file(root, module) is not None or os.path.isdir(os.path.join(root, module))
+            or any(name.split('.')[0] == module and name.endswith(('.so', '.pyd')) for name in names))
+
+
+def _is_stdlib(module):
+    stdlib = getattr(sys, 'stdlib_module_names', None)
+    if stdlib is not None:
+        return module in stdlib
+    # Before Python 3.10, settle for modules the synth interpreter can import
+    return module in sys.builtin_module_names or importlib.util.find_spec(module) is not None
+
+
+def missing_imports(root, app_modules):
+    """Top-level modules the app modules require that are neither bundled nor in the standard library.
+
+    Only the app's own modules are checked: vendored packages import plenty of optional dependencies
+    outside `except ImportError` guards, from code paths the function never takes.
+    """
+    names = os.listdir(root)
+    missing = set()
+    for module in app_modules:
+        path = _module_file(root, module)
+        for imported in _imported_modules(path, module, os.path.basename(path) == '__init__.py'):
+            top = imported.split('.')[0]
+            if top not in missing and not _is_bundled(root, names, top) and not _is_stdlib(top):
+                missing.add(top)
+    return sorted(missing)
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for directory, _, names in os.walk(path) for name in names)
+
+
+def _top_level_modules(root):
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name.endswith('.py'):
+            yield name[:-3], path
+        elif os.path.isfile(os.path.join(path, '__init__.py')):
+            yield name, path
+
+
+def slim_bundle(source, output, entry_modules=None, keep=RUNTIME_IMPORTS, drop=DEVELOPMENT_IMPORTS,
+                runtime_version=(3, 9)):
+    """Copy the Lambda asset to `output` without the packages and files the function cannot use.
+
+    Top-level packages that no required import reaches from the entry modules (by default, the app
+    modules at the root of the asset) are dropped, as are package metadata, tests, scripts and stale
+    bytecode. Packages in `keep` are always bundled, for modules imported by name at runtime, and packages
+    in `drop` never are, for imports only debugging and command-line code makes. When the
+    running interpreter matches the Lambda runtime, the sources are precompiled, since the function
+    cannot write bytecode to its read-only code directory and would otherwise compile on every cold start;
+    otherwise `precompile_in_image` can compile them with the runtime's own interpreter.
+
+    Raises RuntimeError if the app's own modules import a package that is not vendored into the asset,
+    since the function would fail to import it once deployed.
+
+    Returns a report of the bundle sizes and the dropped packages.
+    """
+    top_level = dict(_top_level_modules(source))
+    if entry_modules is None:
+        entry_modules = [name for name in top_level if os.path.isfile(os.path.join(source, name + '.py'))]
+    vendored = _vendored_modules(source)
+    missing = missing_imports(source, [name for name in entry_modules if name not in vendored])
+    if missing:
+        raise RuntimeError(f"The Lambda asset does not bundle {', '.join(missing)}, which the function imports; "
+                           f"install them into {source} with pip (see README)")
+    reached = reached_packages(source, tuple(sorted(entry_modules)), tuple(drop))
+    dropped = sorted(name for name in top_level if name not in reached and name not in keep)
+
+    def ignore(directory, names):
+        ignored = set()
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                if name in STRIPPED_DIRS or name.endswith(STRIPPED_SUFFIXES):
+                    ignored.add(name)
+                elif directory == source and name in dropped:
+                    ignored.add(name)
+            elif name.endswith(STRIPPED_FILE_SUFFIXES) or (directory == source and name[:-3] in dropped
+                                                           and name.endswith('.py')):
+                ignored.add(name)
+        return ignored
+
+    shutil.copytree(source, output, ignore=ignore, dirs_exist_ok=True)
+
+    precompiled = tuple(sys.version_info[:2]) == tuple(runtime_version)
+    if precompiled:
+        # Hash-based bytecode stays valid although the asset zip does not keep the source timestamps
+        compileall.compile_dir(output, quiet=1, workers=0,
+                               invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+    return {
+        'size_before': directory_size(source),
+        'size_after': directory_size(output),
+        'dropped': dropped,
+        'precompiled': precompiled,
+    }
+
+
+def precompile_in_image(output, image):
+    """Precompile the bundle with `python` in a Docker image of the Lambda runtime, such as its bundling image.
+
+    Returns whether the bundle was precompiled, which it is not if Docker is unavailable.
+    """
+    if shutil.which('docker') is None:
+        return False
+    # Run as the current user, as CDK runs bundling images, so the bytecode is not owned by root
+    user = [f"--user={os.getuid()}:{os.getgid()}"] if hasattr(os, 'getuid') else []
+    subprocess.run(['docker', 'run', '--rm', *user, '-v', f"{os.path.abspath(output)}:/asset-output", image,
+                    'python', '-m', 'compileall', '-q', '-j', '0', '--invalidation-mode', 'unchecked-hash',
+                    '/asset-output'], check=True, stdout=subprocess.DEVNULL)
+    return True
+
+
+def format_report(report, runtime_version=(3, 9)):
+    lines = [f"Lambda bundle: {report['size_before'] / 2 ** 20:.1f} MiB -> {report['size_after'] / 2 ** 20:.1f} MiB"]
+    lines.append(f"  dropped packages: {', '.join(report['dropped']) or 'none'}")
+    if not report['precompiled']:
+        lines.append(f"  bytecode not precompiled: synth runs Python {sys.version_info[0]}.{sys.version_info[1]}, "
+                     f"the function runs Python {runtime_version[0]}.{runtime_version[1]} and Docker is unavailable")
+    return '\n'.join(lines)
+
+
+@jsii.implements(ILocalBundling)
+class SlimLambdaBundling:
+    """Local bundling step for `lambda_.Code.from_asset` that slims the asset with `slim_bundle`.
+
+    When synth runs another Python version than the function, the bundle is precompiled in `image`.
+    """
+
+    def __init__(self, source, keep=RUNTIME_IMPORTS, drop=DEVELOPMENT_IMPORTS, runtime_version=(3, 9), image=None):
+        self.source = source
+        self.keep = keep
+        self.drop = drop
+        self.runtime_version = runtime_version
+        self.image = image
+
+    def try_bundle(self, output_dir, options=None):
+        report = slim_bundle(self.source, output_dir, keep=self.keep, drop=self.drop,
+                             runtime_version=self.runtime_version)
+        if not report['precompiled'] and self.image:
+            report['precompiled'] = precompile_in_image(output_dir, self.image)
+        print(format_report(report, self.runtime_version))
+        return True
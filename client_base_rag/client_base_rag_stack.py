@@ -1,8 +1,13 @@
 from aws_cdk import (
+    aws_dynamodb as dynamodb,
+    aws_events as events,
+    aws_events_targets as events_targets,
     aws_lambda as lambda_,
     aws_secretsmanager as secretsmanager,
     aws_iam as iam,
     aws_s3 as s3,
+    aws_s3_notifications as s3_notifications,
+    BundlingOptions,
     Duration,
     Stack,
     CfnOutput,
@@ -10,6 +15,8 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+from client_base_rag.bundling import SlimLambdaBundling
+
 
 class ClientBaseRagStack(Stack):
 
@@ -38,30 +45,113 @@ class ClientBaseRagStack(Stack):
                               # Ensure bucket contents are deleted when the bucket is destroyed
                               )
 
+        # Rate limit counters shared by every container of the function, one item per client and route
+        rate_limit_table = dynamodb.Table(self, "RateLimitTable",
+                                          partition_key=dynamodb.Attribute(name="identity",
+                                                                           type=dynamodb.AttributeType.STRING),
+                                          billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+                                          time_to_live_attribute="expires_at",
+                                          removal_policy=RemovalPolicy.DESTROY)
+
+        environment = {
+            'OPENAI_SECRET_ARN': openai_secret.secret_arn,
+            'SESSION_SECRET_KEY_ARN': session_secret_key.secret_arn,
+            'BUCKET_NAME': s3_bucket.bucket_name,
+            # Added S3 bucket name to the environment
+            'RATE_LIMIT_TABLE': rate_limit_table.table_name
+        }
+        handler = "lambda_function.handler"
+        layers = None
+
+        # Opt in with `cdk deploy -c response_streaming=true` to stream chat answers token by token.
+        # Mangum buffers whole responses, so this runs the app behind the AWS Lambda Web Adapter instead.
+        response_streaming = str(self.node.try_get_context("response_streaming")).lower() == "true"
+        if response_streaming:
+            environment.update({
+                'AWS_LAMBDA_EXEC_WRAPPER': '/opt/bootstrap',
+                'AWS_LWA_INVOKE_MODE': 'response_stream',
+                'PORT': '8080',
+                # Tells the page to ask for answers as server-sent events
+                'STREAM_RESPONSES': 'true',
+            })
+            handler = "run.sh"
+            layers = [lambda_.LayerVersion.from_layer_version_arn(
+                self, "LambdaWebAdapter",
+                f"arn:aws:lambda:{self.region}:753240598075:layer:LambdaAdapterLayerX86:23"
+            )]
+
+        # Ship the bundled dependencies without the packages the function never imports, their metadata and tests.
+        # Opt out with `cdk deploy -c slim_bundle=false` to package the lambda directory as is.
+        slim_bundle = str(self.node.try_get_context("slim_bundle")).lower() != "false"
+        bundling = None
+        if slim_bundle:
+            bundling = BundlingOptions(
+                image=lambda_.Runtime.PYTHON_3_9.bundling_image,
+                local=SlimLambdaBundling("lambda", image=lambda_.Runtime.PYTHON_3_9.bundling_image.image),
+                # Only used if local bundling is unavailable: package the directory unchanged
+                command=["bash", "-c", "cp -R /asset-input/. /asset-output/"],
+            )
+
+        code = lambda_.Code.from_asset("lambda", bundling=bundling)
+
         # Create a Lambda function to run a Flask app
         lambda_function = lambda_.Function(self, "FlaskLambda",
                                            runtime=lambda_.Runtime.PYTHON_3_9,
-                                           handler="lambda_function.handler",
-                                           code=lambda_.Code.from_asset("lambda"),  # Bundled dependencies
+                                           handler=handler,
+                                           code=code,
                                            timeout=Duration.seconds(60),  # Increased timeout to 60 seconds
                                            memory_size=256,  # Optionally increased memory allocation
-                                           environment={
-                                               'OPENAI_SECRET_ARN': openai_secret.secret_arn,
-                                               'SESSION_SECRET_KEY_ARN': session_secret_key.secret_arn,
-                                               'BUCKET_NAME': s3_bucket.bucket_name
-                                               # Added S3 bucket name to the environment
-                                           })
+                                           environment=environment,
+                                           layers=layers)
 
         # Grant Lambda function permissions to read the secrets
         openai_secret.grant_read(lambda_function)
         session_secret_key.grant_read(lambda_function)
+        # The function fetches both secrets in one BatchGetSecretValue call, which IAM only scopes by resource
+        # through the GetSecretValue permission on each secret
+        lambda_function.add_to_role_policy(iam.PolicyStatement(actions=["secretsmanager:BatchGetSecretValue"],
+                                                               resources=["*"]))
 
         # Grant Lambda function permissions to interact with the S3 bucket
         s3_bucket.grant_read_write(lambda_function)
 
+        rate_limit_table.grant_read_write_data(lambda_function)
+
+        # Index each document the app stores in the background, so uploads return as soon as the document is stored
+        indexer_function = lambda_.Function(self, "IndexerLambda",
+                                            runtime=lambda_.Runtime.PYTHON_3_9,
+                                            handler="index_function.handler",
+                                            code=code,
+                                            timeout=Duration.minutes(5),  # Embedding a large document takes a while
+                                            memory_size=512,
+                                            environment={
+                                                'OPENAI_SECRET_ARN': openai_secret.secret_arn,
+                                                'BUCKET_NAME': s3_bucket.bucket_name
+                                            })
+        openai_secret.grant_read(indexer_function)
+        s3_bucket.grant_read_write(indexer_function)
+
+        # Only new objects trigger indexing: the app copies reused documents onto themselves to keep them from expiring
+        for event_type in (s3.EventType.OBJECT_CREATED_PUT, s3.EventType.OBJECT_CREATED_COMPLETE_MULTIPART_UPLOAD):
+            for suffix in (".csv", ".txt"):
+                s3_bucket.add_event_notification(event_type,
+                                                 s3_notifications.LambdaDestination(indexer_function),
+                                                 s3.NotificationKeyFilter(prefix="documents/", suffix=suffix))
+
+        # Opt in with `cdk deploy -c warmup_minutes=5` to send the function a warm-up event every 5 minutes: it opens
+        # its connections, refreshes its secrets and loads recent document artifacts ahead of user requests.
+        # The response-streaming deployment serves HTTP requests only, so it is not warmed up.
+        warmup_minutes = self.node.try_get_context("warmup_minutes")
+        if warmup_minutes and not response_streaming:
+            events.Rule(self, "WarmUpSchedule",
+                        schedule=events.Schedule.rate(Duration.minutes(int(warmup_minutes))),
+                        targets=[events_targets.LambdaFunction(
+                            lambda_function, event=events.RuleTargetInput.from_object({"warmup": True}))])
+
         # Enable function URL for the Lambda function
         function_url = lambda_function.add_function_url(
             auth_type=lambda_.FunctionUrlAuthType.NONE,
+            invoke_mode=lambda_.InvokeMode.RESPONSE_STREAM if response_streaming else lambda_.InvokeMode.BUFFERED,
         )
 
         # Output the Lambda Function URL for the Flask app
@@ -26,12 +26,28 @@ def ensure_venv():
 ensure_venv()
 
 # Imports
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, jsonify, session
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-import boto3
-from openai import OpenAI
 import re
+import time
+from config import (OPENAI_SECRET_ID, SESSION_SECRET_ID, Lazy, secrets, session_secret_key, build_openai_client,
+                    build_s3_client, build_dynamodb_client)
+from indexing import index_document
+from artifact import save_local_artifact, load_local_artifact, save_s3_artifact, load_s3_artifact, artifact_path_for
+from cache import TTLCache, S3CacheTier, TieredCache, AnswerCache, S3ObjectCache, retrieval_cache_key
+from retrieval import (RETRIEVAL_MODE, DEFAULT_TOP_K, DEFAULT_TOKEN_BUDGET, retrieve,
+                       retrieve_semantic, retrieve_hybrid)
+from history import estimate_prompt_tokens, fit_history
+from ranged_reads import chunk_text_fetcher
+from index_jobs import (ARTIFACT_INLINE_TEXT_MAX_BYTES, INDEX_FAILED, INDEX_PENDING, INDEX_READY, LocalIndexer,
+                        failure_key_for, s3_index_status)
+from upload import (LocalFileSink, S3MultipartSink, UploadTooLarge, document_name_for, reuse_s3_document,
+                    stream_upload)
+from session_store import ServerSideSessionInterface, SQLiteSessionStore, S3SessionStore
+from completions import ASYNC_COMPLETION, format_sources, hand_off_completion, sse_event
+import rate_limits  # Registers the sqlite://, dynamodb:// and heap-memory:// rate limit storages
+from embeddings import get_embedder
 
 # Constants
 if RUNNING_LOCALLY:
@@ -40,66 +56,112 @@ if RUNNING_LOCALLY:
 
 app = Flask(__name__, static_url_path='/static')
 
+# Rate limit counters are shared by every container through the stack's DynamoDB table (a SQLite file locally),
+# so limits hold across concurrent containers and cold starts; without a table they stay in this process's memory
+RATE_LIMIT_TABLE = os.getenv("RATE_LIMIT_TABLE")
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI") or (
+    f"sqlite:///{os.path.join(LOCAL_STORAGE_PATH, 'rate_limits.sqlite3')}" if RUNNING_LOCALLY
+    else f"dynamodb://{RATE_LIMIT_TABLE}" if RATE_LIMIT_TABLE else "heap-memory://"
+)
+
+# Keep limiting requests from memory while the shared storage is unreachable; the counter table storages do it
+# themselves, in a HeapMemoryStorage expired lazily on access rather than by a timer thread started every 10 ms
+COUNTER_TABLE_STORAGE = RATE_LIMIT_STORAGE_URI.startswith(("sqlite://", "dynamodb://"))
+rate_limit_storage_options = {'in_memory_fallback': True} if COUNTER_TABLE_STORAGE else {}
+if RATE_LIMIT_STORAGE_URI.startswith("dynamodb://"):
+    rate_limit_storage_options['dynamodb_client'] = Lazy(build_dynamodb_client)
+
 # Initialize Limiter
 limiter = Limiter(
     get_remote_address,
     app=app,
-    default_limits=["100 per day", "10 per hour"]
+    default_limits=["100 per day", "10 per hour"],
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    storage_options=rate_limit_storage_options,
+    in_memory_fallback_enabled=not COUNTER_TABLE_STORAGE and not RATE_LIMIT_STORAGE_URI.startswith(
+        ("memory://", "heap-memory://"))
 )
+rate_limits.require_fixed_windows(limiter)
 
-def get_secret(secret_name):
-    # Fetch OpenAI API key from AWS Secrets Manager
-    region_name = "us-east-1"  # Replace with your AWS region
-
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(service_name='secretsmanager', region_name=region_name)
-
-    try:
-        get_secret_value_response = client.get_secret_value(SecretId=secret_name)
-    except Exception as e:
-        print(f"Error fetching secret: {e}")
-        return None
-
-    secret = get_secret_value_response['SecretString']
-    return secret
-
+# Messages are also limited by the OpenAI tokens they spend, so a prompt full of snippets counts for more than a
+# short one; an empty value turns the token limits off
+TOKEN_RATE_LIMITS = os.getenv("TOKEN_RATE_LIMITS", "40000 per hour;120000 per day")
+# Answer tokens charged with the prompt before the completion, corrected from the usage the API reports
+COMPLETION_TOKENS_ESTIMATE = int(os.getenv("COMPLETION_TOKENS_ESTIMATE", "400"))
+token_limits = rate_limits.TokenLimits(lambda: limiter.limiter, TOKEN_RATE_LIMITS) if TOKEN_RATE_LIMITS else None
 
-# Fetch secrets
-OPENAI_API_KEY = get_secret("openai-api-key")
-session_secret_key = get_secret("app-session-secret-key")
+# Fetch both secrets in a single round trip; the session key is needed before any request can open its session
+secrets.prefetch([OPENAI_SECRET_ID, SESSION_SECRET_ID])
+app.secret_key = session_secret_key()
 
-if not OPENAI_API_KEY:
-    raise RuntimeError("Failed to fetch OpenAI API key")
-if not session_secret_key:
-    raise RuntimeError("Failed to fetch session secret key")
+# Initialize OpenAI client on first use, keeping the openai and pydantic imports out of the cold start
+client = Lazy(build_openai_client)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
-app.secret_key = session_secret_key
+# Embeds chunks at upload time and queries at message time when semantic retrieval is enabled
+embedder = get_embedder(client=client) if RETRIEVAL_MODE != 'keyword' else None
 
 # S3 bucket environment variable
 BUCKET_NAME = os.getenv("BUCKET_NAME")
 if not RUNNING_LOCALLY and BUCKET_NAME is None:
     raise RuntimeError("S3 BUCKET_NAME environment variable is not set in non-local environment")
 
-s3_client = boto3.client('s3') if not RUNNING_LOCALLY else None
-
-
-def save_and_parse_file(file):
-    """Save the uploaded file locally and parse its contents."""
-    filename = file.filename
-    local_path = os.path.join(LOCAL_STORAGE_PATH, filename)
-    file.save(local_path)
+s3_client = Lazy(build_s3_client) if not RUNNING_LOCALLY else None
+
+# Documents and artifacts this container has fetched, kept in /tmp and revalidated by ETag on every use
+document_cache = S3ObjectCache(
+    s3_client, BUCKET_NAME,
+    os.getenv("DOCUMENT_CACHE_DIR", "/tmp/document_cache"),
+    max_bytes=int(os.getenv("DOCUMENT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+) if not RUNNING_LOCALLY else None
+
+# Uploads return once the document is stored; its artifact is built in the background, by a thread pool locally
+# and by the stack's S3-triggered indexer function in the cloud. Until it is ready, messages scan the document.
+ASYNC_INDEXING = os.getenv("ASYNC_INDEXING", "true").lower() == "true"
+local_indexer = LocalIndexer(embedder) if RUNNING_LOCALLY and ASYNC_INDEXING else None
+
+# Fold turns that fall out of the prompt window into a rolling summary instead of dropping them
+SUMMARIZE_HISTORY = os.getenv("SUMMARIZE_HISTORY", "false").lower() == "true"
+
+# Keep session data server-side so only an opaque session id travels in the cookie ('cookie' restores Flask's default)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "sqlite" if RUNNING_LOCALLY else "s3")
+if SESSION_BACKEND == "sqlite":
+    SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", os.path.join(LOCAL_STORAGE_PATH if RUNNING_LOCALLY else "/tmp",
+                                                                "sessions.sqlite3"))
+    app.session_interface = ServerSideSessionInterface(SQLiteSessionStore(SESSION_DB_PATH))
+elif SESSION_BACKEND == "s3":
+    app.session_interface = ServerSideSessionInterface(S3SessionStore(s3_client, BUCKET_NAME))
+
+# The page only asks for server-sent events where they reach it as they are sent: on the local development server
+# and behind the Lambda Web Adapter (the stack sets STREAM_RESPONSES). Cookie sessions are written with the response
+# headers, before a streamed answer exists, so they get the JSON response.
+STREAM_RESPONSES = (os.getenv("STREAM_RESPONSES", str(RUNNING_LOCALLY)).lower() == "true"
+                    and SESSION_BACKEND != "cookie")
+
+# Retrieval results per document version and keyword set; the shared tier is visible to every container
+RETRIEVAL_CACHE_TTL = int(os.getenv("RETRIEVAL_CACHE_TTL", "3600"))
+retrieval_cache = TieredCache(
+    TTLCache(maxsize=int(os.getenv("RETRIEVAL_CACHE_SIZE", "256")), ttl=RETRIEVAL_CACHE_TTL),
+    S3CacheTier(s3_client, BUCKET_NAME, "cache/retrieval/", ttl=RETRIEVAL_CACHE_TTL)
+    if not RUNNING_LOCALLY and os.getenv("RETRIEVAL_CACHE_SHARED", "false").lower() == "true" else None
+)
 
-    with open(local_path, 'r', encoding='utf-8') as f:
-        file_contents = f.read()
+# Opt-in reuse of answers to equivalent questions about the same document and snippets. Questions are
+# compared by keyword sets, or by embeddings with ANSWER_CACHE_SIMILARITY=embedding.
+ANSWER_CACHE = os.getenv("ANSWER_CACHE", "false").lower() == "true"
+answer_cache = AnswerCache(
+    lambda question: extract_keywords(question),
+    embed=(embedder or get_embedder()).embed if os.getenv("ANSWER_CACHE_SIMILARITY") == "embedding" else None,
+    threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.8")),
+    maxsize=int(os.getenv("ANSWER_CACHE_SIZE", "256")),
+    ttl=int(os.getenv("ANSWER_CACHE_TTL", "3600"))
+) if ANSWER_CACHE else None
 
-    print(f'Saved file at: {local_path}')
-    print(f'File length: {len(file_contents)}')
-    print(f'File contents: {file_contents[:100]}')  # Printing only first 100 characters for brevity
+NO_RELEVANT_INFORMATION = "No relevant information found in the document."
 
-    return local_path, file_contents
+MAX_UPLOAD_BYTES = 1 * 1024 * 1024  # Limiting file size to 1MB
+# Werkzeug parses the whole multipart body before the upload is read, so it enforces the limit first;
+# the margin leaves room for the form's boundaries and part headers
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES + 16 * 1024
 
 
 def extract_keywords(query):
@@ -112,38 +174,185 @@ def extract_keywords(query):
 
 
 def process_s3_file(file_key, query):
-    """Fetch file from S3 and process it in chunks to search for query."""
+    """Fetch file from S3, chunk it and rank its chunks for the query."""
     if RUNNING_LOCALLY:
         raise RuntimeError("S3 operations are not allowed in local environment")
 
-    response = s3_client.get_object(Bucket=BUCKET_NAME, Key=file_key)
-    content = response['Body'].iter_lines()
+    with document_cache.open(file_key) as f:
+        content = f.read().decode('utf-8')
+    print(f"Document cache: {document_cache.stats()}")
 
-    keywords = extract_keywords(query)
-    snippets = []
+    index = index_document(content, file_key)
+    snippets = retrieve(index, extract_keywords(query))
+
+    return snippets if snippets else [NO_RELEVANT_INFORMATION]
+
+
+def search_prebuilt_index(index, query, load_embeddings, fetch_texts=None):
+    """Rank the chunks of a prebuilt index with the configured retrieval mode.
+
+    Semantic and hybrid modes fall back to keyword ranking for documents uploaded before their embeddings existed.
+    """
+    matrix = load_embeddings() if embedder is not None else None
+    if matrix is not None and matrix.shape[1] == embedder.dim:
+        query_vector = embedder.embed([query])[0]
+        if RETRIEVAL_MODE == 'hybrid':
+            snippets = retrieve_hybrid(index, matrix, extract_keywords(query), query_vector, fetch_texts=fetch_texts)
+        else:
+            snippets = retrieve_semantic(index, matrix, query_vector, fetch_texts=fetch_texts)
+    else:
+        snippets = retrieve(index, extract_keywords(query), fetch_texts=fetch_texts)
+    return snippets if snippets else [NO_RELEVANT_INFORMATION]
 
-    for line in content:
-        decoded_line = line.decode('utf-8')
-        if any(keyword in decoded_line.lower() for keyword in keywords):
-            snippets.append(decoded_line.strip())
 
-    return snippets if snippets else ["No relevant information found in the document."]
+def search_s3_document(file_key, query):
+    """Search the S3 document through its prebuilt artifact, scanning the object while there is none.
 
+    Returns the snippets and whether the artifact was used.
+    """
+    artifact = load_s3_artifact(s3_client, BUCKET_NAME, file_key, document_cache)
+    print(f"Document cache: {document_cache.stats()}")
+    if artifact is None:
+        return process_s3_file(file_key, query), False
 
-def search_document(document, query):
+    fetch_texts = None if artifact.inline_texts else chunk_text_fetcher(s3_client, BUCKET_NAME, file_key, artifact)
+    return search_prebuilt_index(artifact, query, lambda: artifact.embeddings, fetch_texts), True
+
+
+def search_local_document(document_path, query):
+    """Search the local document through its prebuilt artifact, scanning the file while there is none.
+
+    Returns the snippets and whether the artifact was used.
+    """
+    artifact = load_local_artifact(document_path)
+    if artifact is None:
+        with open(document_path, 'r', encoding='utf-8') as f:
+            document = f.read()
+        return search_document(document, query, document_path), False
+
+    return search_prebuilt_index(artifact, query, lambda: artifact.embeddings), True
+
+
+def cached_search(document_hash, query, search):
+    """Return the cached snippets for this document version and query keywords, running the search on a miss.
+
+    Snippets found by scanning a document whose index is still pending are not cached, so the indexed
+    ranking replaces them as soon as it is available.
+    """
+    if document_hash is None:
+        return search()[0]
+
+    retrieval_settings = f"{RETRIEVAL_MODE}:{DEFAULT_TOP_K}:{DEFAULT_TOKEN_BUDGET}"
+    key = retrieval_cache_key(document_hash, extract_keywords(query), retrieval_settings)
+    snippets = retrieval_cache.get(key)
+    if snippets is None:
+        snippets, indexed = search()
+        if indexed:
+            retrieval_cache.set(key, snippets)
+
+    print(f"Retrieval cache: {retrieval_cache.stats()}")
+    return snippets
+
+
+def search_document(document, query, filename=''):
     """Search for relevant snippets in the document based on the query."""
     keywords = extract_keywords(query)
-    lines = document.split('\n')
 
-    snippets = [line.strip() for line in lines if any(keyword in line.lower() for keyword in keywords)]
+    snippets = retrieve(index_document(document, filename), keywords)
     print(f"Document length: {len(document)}")
     print(f"Keywords: {keywords}\nSnippets: {snippets}")  # Debugging output
-    return snippets if snippets else ["No relevant information found in the document."]
+    return snippets if snippets else [NO_RELEVANT_INFORMATION]
+
+
+def summarize_history(summary, messages):
+    """Fold messages leaving the prompt window into the rolling conversation summary."""
+    transcript = "\n".join(f"{message['role']}: {message['content']}" for message in messages)
+    completion = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "Update the summary of a conversation with the new messages. "
+                                          "Keep it short, and keep any fact the user may refer back to."},
+            {"role": "user", "content": f"Current summary:\n{summary or '(empty)'}\n\nNew messages:\n{transcript}"}
+        ]
+    )
+    return completion.choices[0].message.content.strip()
+
+
+def stream_chat_completion(messages, snippets_text, on_complete=None, on_usage=None):
+    """Relay the completion as server-sent events: one per token, then the sources, then done."""
+    tokens = []
+    usage_reported = False
+    try:
+        stream = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            stream=True,
+            # The last chunk then reports the tokens the completion used
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                tokens.append(chunk.choices[0].delta.content)
+                yield sse_event({'type': 'token', 'content': tokens[-1]})
+            if chunk.usage and on_usage is not None:
+                on_usage(chunk.usage.total_tokens)
+                usage_reported = True
+    except Exception as e:
+        print(f"Error streaming completion: {e}")
+        # A failed completion reports no usage: give back the tokens charged for it
+        if on_usage is not None and not usage_reported:
+            on_usage(0)
+        yield sse_event({'type': 'error', 'content': 'An error occurred while processing your message.'})
+        return
+
+    if on_complete is not None:
+        on_complete("".join(tokens).strip())
+
+    yield sse_event({'type': 'sources', 'content': format_sources(snippets_text)})
+    yield sse_event({'type': 'done'})
+
+
+def stream_answer(bot_response, snippets_text):
+    """Send an answer that is already known with the same events as a streamed completion."""
+    yield sse_event({'type': 'token', 'content': bot_response})
+    yield sse_event({'type': 'sources', 'content': format_sources(snippets_text)})
+    yield sse_event({'type': 'done'})
+
+
+def streamed_answer_recorder(current_session, cache_answer=None):
+    """Return a callback recording a streamed answer in the chat history, if the session can still be written,
+    and in the answer cache.
+
+    A cookie session is sent with the response headers, before the answer exists; a server-side one can
+    be saved again once the stream has finished.
+    """
+    server_side = isinstance(app.session_interface, ServerSideSessionInterface)
+    if not server_side and cache_answer is None:
+        return None
+
+    def record(bot_response):
+        if cache_answer is not None:
+            cache_answer(bot_response)
+        if server_side:
+            current_session['chat_history'].append({"role": "assistant", "content": bot_response})
+            app.session_interface.save(current_session)
+
+    return record
+
+
+def answer_cache_writer(document_hash, snippets_text, user_message, started):
+    """Return a callback storing a generated answer in the answer cache and logging how long it took."""
+    def cache_answer(bot_response):
+        answer_cache.set(document_hash, snippets_text, user_message, bot_response)
+        print(f"Answer cache miss: answered in {(time.perf_counter() - started) * 1000:.1f} ms, "
+              f"stats: {answer_cache.stats()}")
+
+    return cache_answer
 
 
 @app.route('/')
 def home():
-    return render_template('index.html')
+    return render_template('index.html', stream_responses=STREAM_RESPONSES)
 
 
 @app.route('/api/clear_session', methods=['POST'])
@@ -169,16 +378,17 @@ def process_message():
     if not RUNNING_LOCALLY and 'uploaded_document_s3_key' in session:
         # Retrieve document from S3
         s3_key = session['uploaded_document_s3_key']
-        snippets = process_s3_file(s3_key, user_message)
+        snippets = cached_search(session.get('uploaded_document_sha256'), user_message,
+                                 lambda: search_s3_document(s3_key, user_message))
         snippets_text = "\n".join(snippets)
         print(f's3_key: {s3_key}')
     elif 'uploaded_document_path' in session:
         # Retrieve document from local storage
-        with open(session['uploaded_document_path'], 'r', encoding='utf-8') as f:
-            document = f.read()
-        snippets = search_document(document, user_message)
+        document_path = session['uploaded_document_path']
+        snippets = cached_search(session.get('uploaded_document_sha256'), user_message,
+                                 lambda: search_local_document(document_path, user_message))
         snippets_text = "\n".join(snippets)
-        print(f'document: {document}')
+        print(f'document_path: {document_path}')
 
     if not snippets_text:
         augmented_message = (
@@ -193,24 +403,117 @@ def process_message():
             f"{snippets_text}\n"
         )
 
-    session['chat_history'].append({"role": "user", "content": augmented_message})
+    session['chat_history'].append({"role": "user", "content": augmented_message, "question": user_message})
+
+    # Answers are only reused for questions about the same uploaded document, with the same snippets
+    document_hash = session.get('uploaded_document_sha256')
+    cache_answer = None
+    if answer_cache is not None and document_hash is not None and snippets_text:
+        started = time.perf_counter()
+        bot_response = answer_cache.get(document_hash, snippets_text, user_message)
+        if bot_response is not None:
+            print(f"Answer cache hit: answered in {(time.perf_counter() - started) * 1000:.1f} ms, "
+                  f"stats: {answer_cache.stats()}")
+            session['chat_history'].append({"role": "assistant", "content": bot_response})
+            session.modified = True
+            if data.get('stream'):
+                return Response(stream_answer(bot_response, snippets_text), mimetype='text/event-stream',
+                                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+            return jsonify({'response': f"{bot_response}{format_sources(snippets_text)}"})
+        cache_answer = answer_cache_writer(document_hash, snippets_text, user_message, started)
+
+    # Only messages answered by a completion spend tokens; the estimate is corrected from the reported usage.
+    # It is charged before the history is fitted, so a refused message does not have the history summarized
+    on_usage = None
+    if token_limits is not None:
+        identity = get_remote_address()
+        estimate = (estimate_prompt_tokens(session['chat_history'], session.get('history_summary'))
+                    + COMPLETION_TOKENS_ESTIMATE)
+        if not token_limits.charge(identity, estimate):
+            session['chat_history'].pop()
+            session.modified = True
+            return (jsonify({'error': 'Token limit exceeded. Please try again later.'}), 429,
+                    {'Retry-After': str(token_limits.retry_after(identity, estimate))})
+        on_usage = lambda used: token_limits.correct(identity, estimate, used)
 
-    completion = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=session['chat_history']
-    )
+    try:
+        messages, session['chat_history'], session['history_summary'] = fit_history(
+            session['chat_history'],
+            session.get('history_summary'),
+            summarize_history if SUMMARIZE_HISTORY else None
+        )
+    except Exception:
+        # Summarizing failed, so no completion is requested: give back the tokens charged for it
+        if on_usage is not None:
+            on_usage(0)
+        raise
+
+    if ASYNC_COMPLETION in request.environ:
+        # The entry point awaits the completion without holding a thread, then records it like a stream
+        return hand_off_completion(request.environ, session._get_current_object(), messages, snippets_text,
+                                   bool(data.get('stream')),
+                                   streamed_answer_recorder(session._get_current_object(), cache_answer), on_usage)
+
+    if data.get('stream'):
+        session.modified = True
+        on_complete = streamed_answer_recorder(session._get_current_object(), cache_answer)
+        return Response(stream_chat_completion(messages, snippets_text, on_complete, on_usage),
+                        mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+    try:
+        completion = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages
+        )
+    except Exception:
+        # A failed completion reports no usage: give back the tokens charged for it
+        if on_usage is not None:
+            on_usage(0)
+        raise
+    if on_usage is not None and completion.usage:
+        on_usage(completion.usage.total_tokens)
 
     bot_response = completion.choices[0].message.content.strip()
 
+    if cache_answer is not None:
+        cache_answer(bot_response)
+
     session['chat_history'].append({"role": "assistant", "content": bot_response})
 
     session.modified = True
 
-    response = f"{bot_response}\n\nInformation source:\n\n{snippets_text}"
+    response = f"{bot_response}{format_sources(snippets_text)}"
 
     return jsonify({'response': response})
 
 
+@app.route('/api/index_status', methods=['GET'])
+@limiter.limit("300 per hour")
+def index_status():
+    """Report whether the uploaded document's index is ready, polled by the page after an upload."""
+    if not RUNNING_LOCALLY and 'uploaded_document_s3_key' in session:
+        status = s3_index_status(s3_client, BUCKET_NAME, session['uploaded_document_s3_key'])
+    elif 'uploaded_document_path' in session:
+        document_path = session['uploaded_document_path']
+        if local_indexer is None:
+            status = INDEX_READY if os.path.exists(artifact_path_for(document_path)) else INDEX_FAILED
+        else:
+            status = local_indexer.status(document_path)
+            if status is None:
+                # Queued by an earlier process that stopped before indexing it
+                local_indexer.submit(document_path)
+                status = INDEX_PENDING
+    else:
+        return jsonify({'error': 'No document uploaded'}), 404
+    return jsonify({'status': status})
+
+
+@app.errorhandler(413)
+def request_too_large(e):
+    return jsonify({'error': 'File size exceeds limit (1MB)'}), 413
+
+
 @app.route('/api/upload', methods=['POST'])
 @limiter.limit("10 per day")
 def upload_file():
@@ -224,24 +527,61 @@ def upload_file():
     if file.mimetype not in ['text/plain', 'text/csv']:
         return jsonify({'error': 'Unsupported file type'}), 400
 
-    if len(file.read()) > 1 * 1024 * 1024:  # Limiting file size to 1MB
-        return jsonify({'error': 'File size exceeds limit (1MB)'}), 400
-
-    file.seek(0)  # Reset file pointer to beginning after checking size
-
     try:
+        # Documents are stored once per content: the upload is written under a temporary name while it is hashed,
+        # then stored under its hash, unless an identical document and its artifact are stored already
         if RUNNING_LOCALLY:
-            local_path, file_contents = save_and_parse_file(file)
+            documents_path = os.path.join(LOCAL_STORAGE_PATH, "documents")
+            os.makedirs(documents_path, exist_ok=True)
+            with LocalFileSink(documents_path) as sink:
+                # Without a background indexer, the upload is indexed in the same pass
+                index, document_hash, size = stream_upload(file.stream, file.filename, sink, MAX_UPLOAD_BYTES,
+                                                           index=local_indexer is None)
+                local_path = os.path.join(documents_path, document_name_for(document_hash, file.filename))
+                reused = os.path.exists(artifact_path_for(local_path))
+                if not reused:
+                    sink.close(local_path)
+            if not reused:
+                if local_indexer is not None:
+                    local_indexer.submit(local_path)
+                else:
+                    matrix = embedder.embed(index['texts']) if embedder is not None else None
+                    save_local_artifact(local_path, index, matrix)
             session['uploaded_document_path'] = local_path
-            print(f"File parsed contents stored path: {local_path}")
+            print(f"File {file.filename} ({size} bytes) stored at: {local_path}, reused: {reused}")
 
         else:
-            s3_key = f"uploads/{file.filename}"
-            s3_client.upload_fileobj(file, BUCKET_NAME, s3_key)
+            with S3MultipartSink(s3_client, BUCKET_NAME, content_type=file.mimetype) as sink:
+                index, document_hash, size = stream_upload(file.stream, file.filename, sink, MAX_UPLOAD_BYTES,
+                                                           index=not ASYNC_INDEXING)
+                s3_key = f"documents/{document_name_for(document_hash, file.filename)}"
+                reused = reuse_s3_document(s3_client, BUCKET_NAME, s3_key, file.mimetype)
+                if not reused:
+                    if ASYNC_INDEXING:
+                        # Storing the document triggers the indexer; clear the outcome of an earlier failed attempt
+                        s3_client.delete_object(Bucket=BUCKET_NAME, Key=failure_key_for(s3_key))
+                    sink.close(s3_key)
+            if not reused and not ASYNC_INDEXING:
+                matrix = embedder.embed(index['texts']) if embedder is not None else None
+                save_s3_artifact(s3_client, BUCKET_NAME, s3_key, index, matrix, document_cache,
+                                 inline_texts=size <= ARTIFACT_INLINE_TEXT_MAX_BYTES)
             session['uploaded_document_s3_key'] = s3_key
-
-        return jsonify(
-            {'message': f'File {"stored locally" if RUNNING_LOCALLY else "uploaded to S3"} and parsed successfully.'})
+            print(f"File {file.filename} ({size} bytes) stored at: {s3_key}, reused: {reused}")
+
+        session['uploaded_document_sha256'] = document_hash
+        session['uploaded_document_name'] = file.filename
+
+        if reused or not ASYNC_INDEXING:
+            return jsonify({'message': f'File {"stored locally" if RUNNING_LOCALLY else "uploaded to S3"} '
+                                       'and parsed successfully.',
+                            'index_status': INDEX_READY})
+        return jsonify({'message': f'File {"stored locally" if RUNNING_LOCALLY else "uploaded to S3"}. '
+                                   'Indexing it in the background; questions can be asked meanwhile.',
+                        'index_status': INDEX_PENDING})
+    except UploadTooLarge:
+        return request_too_large(None)
+    except UnicodeDecodeError:
+        return jsonify({'error': 'File is not UTF-8 encoded text'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -0,0 +1,296 @@
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+import numpy as np
+from botocore.exceptions import ClientError
+
+# Bump whenever the layout of the artifact or of the index it stores changes, so stale artifacts are rebuilt
+# instead of misread
+ARTIFACT_VERSION = 3
+ARTIFACT_MAGIC = b'RAGART\x00\x00'
+ARTIFACT_SUFFIX = '.artifact'
+
+# Magic, version and section count, then a (name, offset, length) entry per section
+HEADER = struct.Struct('<8sII')
+SECTION = struct.Struct('<16sQQ')
+# Sections start on 8-byte boundaries so every array can be viewed in place
+ALIGNMENT = 8
+
+UINT32 = np.dtype('<u4')
+FLOAT32 = np.dtype('<f4')
+
+
+def _uint32_bytes(values):
+    values = array('I', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_artifact(index, matrix=None, inline_texts=True):
+    """Pack an index and its optional embedding matrix into the binary artifact layout.
+
+    Terms are sorted by their UTF-8 bytes so a lookup is a binary search over the term dictionary, and
+    posting lists, term frequencies, chunk lengths and byte ranges are stored as 32-bit unsigned arrays.
+    Without `inline_texts`, chunk texts are left out and must be read from the document by byte range.
+    """
+    terms = sorted(index['postings'], key=lambda term: term.encode('utf-8'))
+    encoded_terms = [term.encode('utf-8') for term in terms]
+    encoded_texts = [text.encode('utf-8') for text in index['texts']] if inline_texts else []
+
+    def running_offsets(sizes):
+        offsets = [0]
+        for size in sizes:
+            offsets.append(offsets[-1] + size)
+        return offsets
+
+    meta = {
+        'header': index['header'],
+        'avg_length': index['avg_length'],
+        'chunks': len(index['texts']),
+        'terms': len(terms),
+        'inline_texts': inline_texts,
+        'embedding_dim': int(matrix.shape[1]) if matrix is not None else None,
+    }
+    sections = [
+        ('meta', json.dumps(meta).encode('utf-8')),
+        ('terms', b''.join(encoded_terms)),
+        ('term_offsets', _uint32_bytes(running_offsets(len(term) for term in encoded_terms))),
+        ('posting_offsets', _uint32_bytes(running_offsets(len(index['postings'][term]) for term in terms))),
+        ('postings', _uint32_bytes(chunk_id for term in terms for chunk_id in index['postings'][term])),
+        ('frequencies', _uint32_bytes(count for term in terms for count in index['frequencies'][term])),
+        ('lengths', _uint32_bytes(index['lengths'])),
+        ('offsets', _uint32_bytes(offset for start_end in index['offsets'] for offset in start_end)),
+        ('texts', b''.join(encoded_texts)),
+        ('text_offsets', _uint32_bytes(running_offsets(len(text) for text in encoded_texts))),
+    ]
+    if matrix is not None:
+        sections.append(('embeddings', np.ascontiguousarray(matrix, dtype=FLOAT32).tobytes()))
+
+    def aligned(position):
+        return -(-position // ALIGNMENT) * ALIGNMENT
+
+    position = aligned(HEADER.size + SECTION.size * len(sections))
+    table = []
+    for name, payload in sections:
+        table.append(SECTION.pack(name.encode('ascii'), position, len(payload)))
+        position = aligned(position + len(payload))
+
+    parts = [HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, len(sections)), *table]
+    written = HEADER.size + SECTION.size * len(sections)
+    for name, payload in sections:
+        padding = aligned(written) - written
+        parts.append(b'\0' * padding + payload)
+        written += padding + len(payload)
+    # Pad the end too, so even an empty last section starts within the file
+    parts.append(b'\0' * (aligned(written) - written))
+    return b''.join(parts)
+
+
+class _Strings:
+    """Sequence of UTF-8 strings stored back to back, decoded on access."""
+
+    def __init__(self, data, offsets):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position):
+        if not -len(self) <= position < len(self):
+            raise IndexError(position)
+        position %= len(self)
+        return bytes(self._data[self._offsets[position]:self._offsets[position + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        return (self[position] for position in range(len(self)))
+
+
+class _Postings:
+    """Read-only term -> array mapping over the artifact's sorted term dictionary."""
+
+    def __init__(self, terms, term_offsets, posting_offsets, values):
+        self._terms = terms
+        self._term_offsets = term_offsets
+        self._posting_offsets = posting_offsets
+        self._values = values
+
+    def _find(self, term):
+        encoded = term.encode('utf-8')
+        low, high = 0, len(self._term_offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            candidate = bytes(self._terms[self._term_offsets[middle]:self._term_offsets[middle + 1]])
+            if candidate < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._term_offsets) - 1 and bytes(
+                self._terms[self._term_offsets[low]:self._term_offsets[low + 1]]) == encoded:
+            return low
+        return None
+
+    def __contains__(self, term):
+        return self._find(term) is not None
+
+    def __getitem__(self, term):
+        position = self._find(term)
+        if position is None:
+            raise KeyError(term)
+        return self._values[self._posting_offsets[position]:self._posting_offsets[position + 1]]
+
+    def __len__(self):
+        return len(self._term_offsets) - 1
+
+
+class IndexArtifact:
+    """Index and embeddings of a document, read in place from a binary artifact.
+
+    Supports the keys of an index built by `indexing.build_index` that retrieval reads, with every
+    array a view of the underlying buffer, so mapping an artifact file copies nothing until a
+    posting list or chunk is used. Artifacts built without inline texts have no 'texts'.
+    """
+
+    def __init__(self, buffer, sections, meta):
+        self._buffer = buffer
+        data = memoryview(buffer)
+
+        def uint32(name):
+            offset, length = sections[name]
+            return np.frombuffer(buffer, dtype=UINT32, count=length // UINT32.itemsize, offset=offset)
+
+        def raw(name):
+            offset, length = sections[name]
+            return data[offset:offset + length]
+
+        self.meta = meta
+        self.inline_texts = meta['inline_texts']
+        term_offsets = uint32('term_offsets')
+        posting_offsets = uint32('posting_offsets')
+        self._fields = {
+            'header': meta['header'],
+            'avg_length': meta['avg_length'],
+            'lengths': uint32('lengths'),
+            'offsets': uint32('offsets').reshape(-1, 2),
+            'postings': _Postings(raw('terms'), term_offsets, posting_offsets, uint32('postings')),
+            'frequencies': _Postings(raw('terms'), term_offsets, posting_offsets, uint32('frequencies')),
+        }
+        if self.inline_texts:
+            self._fields['texts'] = _Strings(raw('texts'), uint32('text_offsets'))
+
+        self.embeddings = None
+        if meta['embedding_dim'] is not None:
+            offset, length = sections['embeddings']
+            self.embeddings = np.frombuffer(buffer, dtype=FLOAT32, count=length // FLOAT32.itemsize,
+                                            offset=offset).reshape(-1, meta['embedding_dim'])
+
+    def __getitem__(self, key):
+        return self._fields[key]
+
+    def get(self, key, default=None):
+        return self._fields.get(key, default)
+
+
+def read_artifact(buffer):
+    """View a buffer holding an artifact, returning None if it was written by another artifact version."""
+    if len(buffer) < HEADER.size:
+        return None
+    magic, version, section_count = HEADER.unpack_from(buffer, 0)
+    if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+        return None
+
+    sections = {}
+    for position in range(section_count):
+        name, offset, length = SECTION.unpack_from(buffer, HEADER.size + SECTION.size * position)
+        sections[name.rstrip(b'\0').decode('ascii')] = (offset, length)
+    meta_offset, meta_length = sections['meta']
+    meta = json.loads(bytes(buffer[meta_offset:meta_offset + meta_length]))
+    return IndexArtifact(buffer, sections, meta)
+
+
+def map_artifact(f):
+    """Map an open artifact file read-only; in-memory files are read instead."""
+    try:
+        fileno = f.fileno()
+    except io.UnsupportedOperation:
+        return read_artifact(f.read())
+    return read_artifact(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
+
+def open_artifact(path):
+    """Map an artifact file read-only, or return None if it does not exist or is stale."""
+    try:
+        with open(path, 'rb') as f:
+            return map_artifact(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_artifact_file(path, payload):
+    """Write an artifact atomically, so a concurrent reader never maps a partial file."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(dir=directory, suffix='.partial')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+    return path
+
+
+def artifact_path_for(document_path):
+    return document_path + ARTIFACT_SUFFIX
+
+
+def artifact_key_for(document_key):
+    return document_key + ARTIFACT_SUFFIX
+
+
+def save_local_artifact(document_path, index, matrix=None):
+    """Persist the artifact as a sidecar file next to the local document."""
+    return write_artifact_file(artifact_path_for(document_path), build_artifact(index, matrix))
+
+
+def load_local_artifact(document_path):
+    """Map the sidecar artifact of a local document, or return None if it has not been built."""
+    return open_artifact(artifact_path_for(document_path))
+
+
+def save_s3_artifact(s3_client, bucket, document_key, index, matrix=None, cache=None, inline_texts=True):
+    """Persist the artifact as a sidecar object next to the S3 document, keeping a copy in the object cache if given."""
+    payload = build_artifact(index, matrix, inline_texts)
+    artifact_key = artifact_key_for(document_key)
+    response = s3_client.put_object(Bucket=bucket, Key=artifact_key, Body=payload,
+                                    ContentType='application/octet-stream')
+    if cache is not None:
+        cache.put(artifact_key, response.get('ETag'), payload)
+    return artifact_key
+
+
+def load_s3_artifact(s3_client, bucket, document_key, cache=None):
+    """Map the artifact of an S3 document, or return None if it has not been built.
+
+    With an `S3ObjectCache`, warm containers map their local copy once S3 confirms it is current;
+    without one, the artifact is read into memory on every call.
+    """
+    artifact_key = artifact_key_for(document_key)
+    try:
+        if cache is not None:
+            with cache.open(artifact_key) as f:
+                return map_artifact(f)
+        response = s3_client.get_object(Bucket=bucket, Key=artifact_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return None
+        raise
+    return read_artifact(response['Body'].read())
@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi
+
+from completions import format_sources, run_view, sse_event
+from config import Lazy, build_async_openai_client
+from session_store import ServerSideSessionInterface
+from wsgi_lambda import build_environ
+
+MESSAGE_PATH = '/api/message'
+
+# Built on first use; its connection pool is bound to the event loop that Mangum and `run` reuse across warm
+# invocations
+async_client = Lazy(build_async_openai_client)
+
+
+async def stream_chat_completion(client, messages, snippets_text, on_complete, on_usage=None):
+    """Async counterpart of `app.stream_chat_completion`: the same events, with the answer recorded at the end."""
+    tokens = []
+    usage_reported = False
+    try:
+        stream = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                tokens.append(chunk.choices[0].delta.content)
+                yield sse_event({'type': 'token', 'content': tokens[-1]})
+            if chunk.usage and on_usage is not None:
+                await sync_to_async(on_usage)(chunk.usage.total_tokens)
+                usage_reported = True
+    except Exception as e:
+        print(f"Error streaming completion: {e}")
+        if on_usage is not None and not usage_reported:
+            await sync_to_async(on_usage)(0)
+        yield sse_event({'type': 'error', 'content': 'An error occurred while processing your message.'})
+        return
+
+    await sync_to_async(on_complete)("".join(tokens).strip())
+
+    yield sse_event({'type': 'sources', 'content': format_sources(snippets_text)})
+    yield sse_event({'type': 'done'})
+
+
+async def chat_completion(client, messages, snippets_text, on_complete, on_usage=None):
+    try:
+        completion = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages
+        )
+    except Exception:
+        # A failed completion reports no usage: give back the tokens charged for it
+        if on_usage is not None:
+            await sync_to_async(on_usage)(0)
+        raise
+    if on_usage is not None and completion.usage:
+        await sync_to_async(on_usage)(completion.usage.total_tokens)
+    bot_response = completion.choices[0].message.content.strip()
+    await sync_to_async(on_complete)(bot_response)
+    return json.dumps({'response': f"{bot_response}{format_sources(snippets_text)}"})
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def complete(response, completion, client):
+    """Status, headers and body chunks of a message, once the completion its view handed back is awaited.
+
+    A view that answered itself, e.g. from the answer cache or with a 429, is answered with its own response.
+    """
+    if not completion:
+        return response.status_code, list(response.headers.items()), _chunks(response.get_data())
+
+    # Keep the session cookie and rate limit headers of the view's response
+    headers = [(name, value) for name, value in response.headers.items()
+               if name.lower() not in ('content-type', 'content-length')]
+    arguments = (client, completion['messages'], completion['snippets_text'], completion['on_complete'],
+                 completion['on_usage'])
+    if completion['stream']:
+        headers += [('Content-Type', 'text/event-stream'), ('Cache-Control', 'no-cache'),
+                    ('X-Accel-Buffering', 'no')]
+        return 200, headers, (event.encode('utf-8') async for event in stream_chat_completion(*arguments))
+
+    try:
+        payload, status = await chat_completion(*arguments), 200
+    except Exception as e:
+        print(f"Error completing message: {e}")
+        payload, status = json.dumps({'error': 'An error occurred while processing your message.'}), 500
+    return status, headers + [('Content-Type', 'application/json')], _chunks(payload.encode('utf-8'))
+
+
+class AsyncCompletionApp:
+    """ASGI app serving the Flask app, with the chat completions of messages awaited on the event loop.
+
+    A message still goes through the Flask view, in a worker thread or, through `run`, in the invoking one,
+    for the rate limits, session, retrieval and answer cache. When it needs a completion, the view hands it
+    back here instead of calling OpenAI, so no thread waits on the network; the answer is then recorded in
+    the server-side session, as a streamed one is. With cookie sessions, whose answer could not be recorded
+    afterwards, and for every other route, requests go to the Flask app unchanged.
+    """
+
+    def __init__(self, flask_app, client=async_client):
+        self.flask_app = flask_app
+        self.client = client
+        self.wsgi_app = WsgiToAsgi(flask_app)
+
+    def awaits_completion(self, scope):
+        """Whether the request may hand its completion back to the event loop; others run as plain WSGI."""
+        return (scope['type'] == 'http' and scope['method'] == 'POST' and scope['path'] == MESSAGE_PATH
+                and isinstance(self.flask_app.session_interface, ServerSideSessionInterface))
+
+    async def __call__(self, scope, receive, send):
+        if not self.awaits_completion(scope):
+            await self.wsgi_app(scope, receive, send)
+            return
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+
+        # The direct handler's environ, whose CONTENT_LENGTH comes from the body rather than a header
+        response, completion = await sync_to_async(run_view)(self.flask_app, build_environ(scope, bytes(body)))
+        status, headers, chunks = await complete(response, completion, self.client)
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': self._encode(headers)})
+        async for chunk in chunks:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    def run(self, scope, body):
+        """Answer a message in the form Mangum's handlers expect, without Mangum and WsgiToAsgi in between.
+
+        The view runs in the invoking thread, as with the direct WSGI handler; only the completion it hands
+        back is awaited, on the event loop where the async client's connection pool lives.
+        """
+        try:
+            response, completion = run_view(self.flask_app, build_environ(scope, body))
+            status, headers, response_body = asyncio.get_event_loop().run_until_complete(
+                self._collect(response, completion))
+        except Exception as e:
+            print(f"Error running the application: {e}")
+            return {'status': 500, 'headers': [[b"content-type", b"text/plain; charset=utf-8"]],
+                    'body': b"Internal Server Error"}
+        return {'status': status, 'headers': [list(header) for header in self._encode(headers)],
+                'body': response_body}
+
+    async def _collect(self, response, completion):
+        status, headers, chunks = await complete(response, completion, self.client)
+        return status, headers, b"".join([chunk async for chunk in chunks])
+
+    @staticmethod
+    def _encode(headers):
+        return [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers]
@@ -0,0 +1,310 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from botocore.exceptions import ClientError
+
+
+class TTLCache:
+    """Thread-safe in-process LRU cache whose entries also expire after a time to live.
+
+    Module-level instances outlive a single request, so they keep serving warm Lambda invocations.
+    """
+
+    def __init__(self, maxsize=256, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+class S3CacheTier:
+    """Cache tier shared by every container, keeping one JSON object per entry in an S3 bucket.
+
+    Entries expire after their time to live, and with the bucket's lifecycle rule at the latest.
+    """
+
+    def __init__(self, s3_client, bucket, prefix, ttl=3600):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+            record = json.loads(response['Body'].read())
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                print(f"Error reading shared cache: {e}")
+            record = None
+
+        if record is None or record['expires'] < time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record['value']
+
+    def set(self, key, value):
+        record = {'value': value, 'expires': time.time() + self.ttl}
+        try:
+            self.s3_client.put_object(Bucket=self.bucket, Key=self.prefix + key,
+                                      Body=json.dumps(record).encode('utf-8'), ContentType='application/json')
+        except ClientError as e:
+            print(f"Error writing shared cache: {e}")
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class TieredCache:
+    """In-process cache backed by an optional shared tier; shared hits are copied into the local tier."""
+
+    def __init__(self, local, shared=None):
+        self.local = local
+        self.shared = shared
+
+    def get(self, key):
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key, value):
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value)
+
+    def stats(self):
+        stats = {'local': self.local.stats()}
+        if self.shared is not None:
+            stats['shared'] = self.shared.stats()
+        return stats
+
+
+class AnswerCache:
+    """In-process cache of chat answers for questions equivalent to one already answered.
+
+    Answers are grouped by document version and the exact snippets retrieved for the question, so an
+    answer is only reused with the context it was generated from. Within a group, a question matches a
+    previous one when the similarity of their signatures reaches the threshold: the Jaccard index of
+    their keyword sets by default, or the cosine similarity of their embeddings when `embed` is given.
+    """
+
+    def __init__(self, keywords, embed=None, threshold=0.8, maxsize=256, ttl=3600, entries_per_context=16):
+        self.keywords = keywords
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries_per_context = entries_per_context
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _context_key(document_hash, snippets_text):
+        return hashlib.sha256(f"{document_hash}\n{snippets_text}".encode('utf-8')).hexdigest()
+
+    def _signature(self, question):
+        if self.embed is not None:
+            return self.embed([question])[0]
+        return frozenset(self.keywords(question))
+
+    def _similarity(self, first, second):
+        if self.embed is not None:
+            return float(first @ second)
+        if not first and not second:
+            return 1.0
+        return len(first & second) / len(first | second)
+
+    def get(self, document_hash, snippets_text, question):
+        """Return the answer to the most similar cached question, or None if none is similar enough."""
+        signature = self._signature(question)
+        now = time.monotonic()
+
+        with self._lock:
+            key = self._context_key(document_hash, snippets_text)
+            entries = [entry for entry in self._contexts.get(key, []) if entry[0] > now]
+            best_answer, best_similarity = None, self.threshold
+            for _, cached_signature, answer in entries:
+                similarity = self._similarity(signature, cached_signature)
+                if similarity >= best_similarity:
+                    best_answer, best_similarity = answer, similarity
+
+            if entries:
+                self._contexts[key] = entries
+                self._contexts.move_to_end(key)
+            else:
+                self._contexts.pop(key, None)
+
+            if best_answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return best_answer
+
+    def set(self, document_hash, snippets_text, question, answer):
+        entry = (time.monotonic() + self.ttl, self._signature(question), answer)
+
+        with self._lock:
+            key = self._context_key(document_hash, snippets_text)
+            entries = self._contexts.setdefault(key, [])
+            entries.append(entry)
+            del entries[:-self.entries_per_context]
+            self._contexts.move_to_end(key)
+            while len(self._contexts) > self.maxsize:
+                self._contexts.popitem(last=False)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'contexts': len(self._contexts)}
+
+
+class S3ObjectCache:
+    """Bounded on-disk cache of S3 objects, for warm containers serving the same documents again.
+
+    Entries are keyed by object key and ETag, and evicted least recently used first once their total size
+    exceeds `max_bytes`. Every access revalidates the cached copy with a conditional GET (`IfNoneMatch`),
+    so an unchanged object costs a 304 round trip instead of a download and a changed one is replaced.
+    """
+
+    SUFFIX = '.cached'
+
+    def __init__(self, s3_client, bucket, directory, max_bytes=256 * 1024 * 1024):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (etag, path, size)
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+        # Files left by an earlier process in this container are not in the in-memory index
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(self.SUFFIX):
+                os.unlink(os.path.join(directory, name))
+
+    def _path_for(self, key, etag):
+        return os.path.join(self.directory, hashlib.sha256(f"{key}\n{etag}".encode('utf-8')).hexdigest() + self.SUFFIX)
+
+    def _forget(self, key):
+        """Drop an entry, with the lock held."""
+        _, path, size = self._entries.pop(key)
+        self.total_bytes -= size
+        os.unlink(path)
+
+    def put(self, key, etag, body):
+        """Cache an object's body, e.g. one this container has just written; returns the cached file's path."""
+        if etag is None or len(body) > self.max_bytes:
+            return None
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.partial')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+
+        with self._lock:
+            if key in self._entries:
+                self._forget(key)
+            path = self._path_for(key, etag)
+            os.replace(temporary_path, path)
+            self._entries[key] = (etag, path, len(body))
+            self.total_bytes += len(body)
+            while self.total_bytes > self.max_bytes:
+                self._forget(next(iter(self._entries)))
+                self.evictions += 1
+        return path
+
+    def open(self, key):
+        """Return the object's body as a binary file, from the local copy if S3 still has that version.
+
+        Raises ClientError like `get_object` when the object cannot be fetched.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        request = {'Bucket': self.bucket, 'Key': key}
+        if entry is not None:
+            request['IfNoneMatch'] = entry[0]
+
+        try:
+            response = self.s3_client.get_object(**request)
+        except ClientError as e:
+            if entry is None or e.response.get('Error', {}).get('Code') not in ('304', 'NotModified'):
+                raise
+            with self._lock:
+                current = self._entries.get(key)
+                if current is not None and current[0] == entry[0]:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    # An open file stays readable even if the entry is evicted meanwhile
+                    return open(current[1], 'rb')
+            # Evicted by another request since the revalidation started
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
+
+        body = response['Body'].read()
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.refreshes += 1
+        path = self.put(key, response.get('ETag'), body)
+        try:
+            return open(path, 'rb') if path is not None else io.BytesIO(body)
+        except FileNotFoundError:
+            return io.BytesIO(body)
+
+    def stats(self):
+        requests = self.hits + self.misses + self.refreshes
+        return {'hits': self.hits, 'misses': self.misses, 'refreshes': self.refreshes, 'evictions': self.evictions,
+                'hit_rate': round(self.hits / requests, 3) if requests else 0.0, 'entries': len(self._entries),
+                'bytes': self.total_bytes}
+
+
+def retrieval_cache_key(document_hash, keywords, mode):
+    """Key retrieval results by document version, retrieval mode and the set of query keywords.
+
+    Keyword order and repetition do not change retrieval, so "salary of Bob" and "Bob salary" share an entry.
+    """
+    normalized = json.dumps([document_hash, mode, sorted(set(keywords))])
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
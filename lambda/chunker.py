@@ -0,0 +1,231 @@
+import os
+import re
+
+# Sliding window size and overlap, in word tokens
+CHUNK_TOKENS = int(os.getenv('CHUNK_TOKENS', '64'))
+CHUNK_OVERLAP = int(os.getenv('CHUNK_OVERLAP', '16'))
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+WORD_CHARACTER = re.compile(r'\w')
+
+
+def is_csv(filename):
+    return filename.lower().endswith('.csv')
+
+
+def _byte_offsets(text, positions):
+    """Map character positions of text to UTF-8 byte positions, encoding each stretch of text only once."""
+    if text.isascii():
+        return {position: position for position in positions}
+
+    offsets = {}
+    char_position = 0
+    byte_position = 0
+    for position in sorted(set(positions)):
+        byte_position += len(text[char_position:position].encode('utf-8'))
+        char_position = position
+        offsets[position] = byte_position
+    return offsets
+
+
+def _with_byte_offsets(text, spans, render):
+    offsets = _byte_offsets(text, [position for span in spans for position in span])
+    return [{'text': render(text[start:end]), 'start': offsets[start], 'end': offsets[end]}
+            for start, end in spans]
+
+
+def chunk_text(text, window=None, overlap=None):
+    """Split text into overlapping windows of `window` tokens, each overlapping the previous by `overlap` tokens.
+
+    Chunks span from their first token to their last one, and carry the UTF-8 byte range of that span in
+    the document so the snippet can be fetched again without the rest of it.
+    """
+    window = CHUNK_TOKENS if window is None else window
+    overlap = CHUNK_OVERLAP if overlap is None else overlap
+    if window <= 0 or not 0 <= overlap < window:
+        raise ValueError("Chunk window must be positive and larger than the overlap")
+
+    tokens = [match.span() for match in WORD_PATTERN.finditer(text)]
+    step = window - overlap
+    spans = []
+
+    for first in range(0, len(tokens), step):
+        last = min(first + window, len(tokens)) - 1
+        spans.append((tokens[first][0], tokens[last][1]))
+        if last == len(tokens) - 1:
+            break
+
+    return _with_byte_offsets(text, spans, lambda chunk: chunk)
+
+
+def _csv_rows(text):
+    """Yield the (start, end) character span of every CSV record, keeping quoted line breaks inside their record."""
+    start = 0
+    quotes = 0
+    position = 0
+
+    for line in text.splitlines(keepends=True):
+        quotes += line.count('"')
+        position += len(line)
+        if quotes % 2 == 0:
+            record = text[start:position]
+            stripped = record.rstrip('\r\n')
+            if stripped.strip():
+                yield start, start + len(stripped)
+            start = position
+            quotes = 0
+
+    if start < len(text) and text[start:].strip():
+        yield start, len(text)
+
+
+def chunk_csv(text):
+    """Make one chunk per CSV row; the header row is returned separately, to be shown with the rows retrieved."""
+    rows = list(_csv_rows(text))
+    if not rows:
+        return '', []
+
+    header_start, header_end = rows[0]
+    header = text[header_start:header_end]
+    chunks = _with_byte_offsets(text, rows[1:], lambda row: row)
+    return header, chunks
+
+
+def chunk_document(text, filename):
+    """Chunk a document the way its type calls for; returns the CSV header (or None) and the chunks."""
+    if is_csv(filename):
+        return chunk_csv(text)
+    return None, chunk_text(text)
+
+
+class StreamingTextChunker:
+    """Incremental `chunk_text`: fed a text piece by piece, it returns the same chunks as `chunk_text` over the whole.
+
+    Only the text from the first token of the next window on is kept, so memory is bounded by the window size.
+    """
+
+    def __init__(self, window=None, overlap=None):
+        self.window = CHUNK_TOKENS if window is None else window
+        overlap = CHUNK_OVERLAP if overlap is None else overlap
+        if self.window <= 0 or not 0 <= overlap < self.window:
+            raise ValueError("Chunk window must be positive and larger than the overlap")
+        self.step = self.window - overlap
+        self.header = None
+
+        self._buffer = ''        # the stream from character position _base on
+        self._base = 0
+        self._base_byte = 0
+        self._scanned = 0        # tokens are known up to this character position
+        self._tokens = []        # (start, end) of the tokens from the next window's first one on
+        self._first = 0          # index of the next window's first token
+        self._count = 0          # tokens seen
+        self._last_emitted = None
+
+    def _byte_offset(self, position):
+        return self._base_byte + len(self._buffer[:position - self._base].encode('utf-8'))
+
+    def _scan(self, end):
+        for match in WORD_PATTERN.finditer(self._buffer, self._scanned - self._base, end - self._base):
+            self._tokens.append((self._base + match.start(), self._base + match.end()))
+            self._count += 1
+        self._scanned = end
+
+    def _trim(self):
+        keep_from = self._tokens[0][0] if self._tokens else self._scanned
+        self._base_byte = self._byte_offset(keep_from)
+        self._buffer = self._buffer[keep_from - self._base:]
+        self._base = keep_from
+
+    def _emit(self, final):
+        chunks = []
+        while self._first < self._count:
+            # The previous window ended on the last token: chunk_text stops there
+            if final and self._last_emitted == self._count - 1:
+                break
+            last = self._first + self.window - 1
+            if last >= self._count:
+                if not final:
+                    break
+                last = self._count - 1
+            start, end = self._tokens[0][0], self._tokens[last - self._first][1]
+            chunks.append({'text': self._buffer[start - self._base:end - self._base],
+                           'start': self._byte_offset(start), 'end': self._byte_offset(end)})
+            self._last_emitted = last
+            del self._tokens[:self.step]
+            self._first += self.step
+            self._trim()
+        return chunks
+
+    def feed(self, text):
+        self._buffer += text
+        # A run of word characters at the end may go on in the next piece
+        scan_end = len(self._buffer)
+        while scan_end > self._scanned - self._base and WORD_CHARACTER.match(self._buffer, scan_end - 1):
+            scan_end -= 1
+        self._scan(self._base + scan_end)
+        chunks = self._emit(final=False)
+        self._trim()
+        return chunks
+
+    def finish(self):
+        self._scan(self._base + len(self._buffer))
+        return self._emit(final=True)
+
+
+class StreamingCsvChunker:
+    """Incremental `chunk_csv`: fed a text piece by piece, it returns the same chunks as `chunk_csv` over the whole.
+
+    Only the current record is kept; `header` is set once the first record has been read.
+    """
+
+    def __init__(self):
+        self.header = ''
+        self._seen_header = False
+        self._pending = ''       # text not yet split into lines; its last line may be incomplete
+        self._record = []
+        self._quotes = 0
+        self._byte = 0           # byte position of the current record
+
+    def _row(self, row, start):
+        if not self._seen_header:
+            self.header = row
+            self._seen_header = True
+            return []
+        return [{'text': row, 'start': start, 'end': start + len(row.encode('utf-8'))}]
+
+    def _lines(self, lines):
+        chunks = []
+        for line in lines:
+            self._record.append(line)
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0:
+                record = ''.join(self._record)
+                stripped = record.rstrip('\r\n')
+                if stripped.strip():
+                    chunks.extend(self._row(stripped, self._byte))
+                self._byte += len(record.encode('utf-8'))
+                self._record = []
+                self._quotes = 0
+        return chunks
+
+    def feed(self, text):
+        lines = (self._pending + text).splitlines(keepends=True)
+        # Keep the last line back: it may be incomplete, or a '\r' whose '\n' is still to come
+        self._pending = lines.pop() if lines else ''
+        return self._lines(lines)
+
+    def finish(self):
+        chunks = self._lines(self._pending.splitlines(keepends=True))
+        self._pending = ''
+        # A record left open by an unbalanced quote runs to the end of the document
+        record = ''.join(self._record)
+        if record.strip():
+            chunks.extend(self._row(record, self._byte))
+        return chunks
+
+
+def streaming_chunker(filename):
+    """Incremental counterpart of `chunk_document` for the document type."""
+    if is_csv(filename):
+        return StreamingCsvChunker()
+    return StreamingTextChunker()
@@ -0,0 +1,41 @@
+import json
+
+from werkzeug.wrappers import Response
+
+# WSGI environ key holding the dict in which the ASGI entry point takes over the completion of a message
+ASYNC_COMPLETION = 'client_base_rag.async_completion'
+
+
+def format_sources(snippets_text):
+    return f"\n\nInformation source:\n\n{snippets_text}"
+
+
+def sse_event(payload):
+    """Encode one server-sent event."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def hand_off_completion(environ, current_session, messages, snippets_text, stream, on_complete, on_usage=None):
+    """Hand the completion of a message back to the entry point that set ASYNC_COMPLETION in the environ.
+
+    Returns the view's 202 response, which the entry point replaces with the answer. The session is not
+    saved with it: `on_complete` saves it once the answer is known, with both turns of the exchange.
+    """
+    current_session.modified = False
+    environ[ASYNC_COMPLETION].update({
+        'messages': messages,
+        'snippets_text': snippets_text,
+        'stream': stream,
+        'on_complete': on_complete,
+        'on_usage': on_usage,
+    })
+    return Response(status=202)
+
+
+def run_view(flask_app, environ):
+    """Run the Flask app on a request whose view may hand its completion back.
+
+    Returns the buffered response and the handed-off completion, which is empty if the view answered itself.
+    """
+    completion = environ[ASYNC_COMPLETION] = {}
+    return Response.from_app(flask_app, environ, buffered=True), completion
@@ -0,0 +1,169 @@
+import os
+import threading
+import time
+
+from cache import TTLCache
+
+REGION_NAME = "us-east-1"  # Replace with your AWS region
+
+# The deployed function gets the secret ARNs from the stack; local runs fall back to the secret names
+OPENAI_SECRET_ID = os.getenv('OPENAI_SECRET_ARN') or "openai-api-key"
+SESSION_SECRET_ID = os.getenv('SESSION_SECRET_KEY_ARN') or "app-session-secret-key"
+
+# Connections to the OpenAI API are kept open between requests, and between the invocations of a warm container
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', '20'))
+OPENAI_KEEPALIVE_SECONDS = float(os.getenv('OPENAI_KEEPALIVE_SECONDS', '300'))
+
+
+def requested_as(secret, secret_id):
+    """Whether a secret returned by Secrets Manager is the one requested as `secret_id`.
+
+    Secrets can be requested by name, by full ARN, or by partial ARN: the full ARN without the "-" and six
+    random characters Secrets Manager appends to it, which is what the stack's `from_secret_name_v2` gives.
+    """
+    arn = secret['ARN']
+    return secret_id in (arn, secret['Name']) or (arn[-7:-6] == '-' and arn[:-7] == secret_id)
+
+
+class SecretsProvider:
+    """Secrets Manager reader shared by the whole process.
+
+    It creates a single client on first use, caches secret values for `ttl` seconds so warm invocations
+    do not fetch them again, and can fetch several secrets in one BatchGetSecretValue round trip.
+    """
+
+    def __init__(self, region_name=REGION_NAME, ttl=3600):
+        self.region_name = region_name
+        self._cache = TTLCache(maxsize=32, ttl=ttl)
+        self._client = None
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.fetch_seconds = 0.0
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                import boto3
+                self._client = boto3.session.Session().client(service_name='secretsmanager',
+                                                              region_name=self.region_name)
+            return self._client
+
+    def prefetch(self, secret_ids):
+        """Fetch the secrets that are not cached yet in a single round trip."""
+        missing = [secret_id for secret_id in secret_ids if self._cache.get(secret_id) is None]
+        if not missing:
+            return
+
+        started = time.perf_counter()
+        try:
+            response = self._get_client().batch_get_secret_value(SecretIdList=missing)
+        except Exception as e:
+            print(f"Error fetching secrets: {e}")
+            return
+        finally:
+            self.fetches += 1
+            self.fetch_seconds += time.perf_counter() - started
+
+        for secret in response['SecretValues']:
+            # Cache the value under the id it was requested with
+            for secret_id in missing:
+                if requested_as(secret, secret_id):
+                    self._cache.set(secret_id, secret['SecretString'])
+        for error in response.get('Errors', []):
+            print(f"Error fetching secret {error.get('SecretId')}: {error.get('Message')}")
+
+    def get(self, secret_id):
+        """Return the secret value, or None if it cannot be fetched."""
+        secret = self._cache.get(secret_id)
+        if secret is not None:
+            return secret
+
+        started = time.perf_counter()
+        try:
+            secret = self._get_client().get_secret_value(SecretId=secret_id)['SecretString']
+        except Exception as e:
+            print(f"Error fetching secret: {e}")
+            return None
+        finally:
+            self.fetches += 1
+            self.fetch_seconds += time.perf_counter() - started
+
+        self._cache.set(secret_id, secret)
+        return secret
+
+
+class Lazy:
+    """Proxy building the wrapped object on first use, so cold starts do not pay for unused clients."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+        self.build_seconds = None
+
+    def get(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    started = time.perf_counter()
+                    self._instance = self._factory()
+                    self.build_seconds = time.perf_counter() - started
+        return self._instance
+
+    @property
+    def built(self):
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+secrets = SecretsProvider()
+
+
+def openai_api_key():
+    api_key = secrets.get(OPENAI_SECRET_ID)
+    if not api_key:
+        raise RuntimeError("Failed to fetch OpenAI API key")
+    return api_key
+
+
+def session_secret_key():
+    secret_key = secrets.get(SESSION_SECRET_ID)
+    if not secret_key:
+        raise RuntimeError("Failed to fetch session secret key")
+    return secret_key
+
+
+def openai_connection_limits():
+    """Connection pool limits of the OpenAI clients.
+
+    httpx closes connections idle for more than 5 seconds by default, so a warm container whose requests are
+    further apart than that paid a new TCP and TLS handshake to the API on every one of them.
+    """
+    import httpx
+    return httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS, max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+                        keepalive_expiry=OPENAI_KEEPALIVE_SECONDS)
+
+
+def build_openai_client():
+    # Importing openai pulls in pydantic and httpx, the heaviest imports of the bundle
+    from openai import DefaultHttpxClient, OpenAI
+    return OpenAI(api_key=openai_api_key(), http_client=DefaultHttpxClient(limits=openai_connection_limits()))
+
+
+def build_async_openai_client():
+    """AsyncOpenAI client of the ASGI entry point; its pool lives on the event loop Mangum reuses across invocations."""
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+    return AsyncOpenAI(api_key=openai_api_key(),
+                       http_client=DefaultAsyncHttpxClient(limits=openai_connection_limits()))
+
+
+def build_s3_client():
+    import boto3
+    return boto3.client('s3')
+
+
+def build_dynamodb_client():
+    import boto3
+    return boto3.client('dynamodb')
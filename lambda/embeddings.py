@@ -0,0 +1,112 @@
+import hashlib
+import math
+import os
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from indexing import tokenize
+
+# Chunks scoring below this cosine similarity are treated as unrelated to the query
+MIN_SIMILARITY = float(os.getenv('SEMANTIC_MIN_SIMILARITY', '0.05'))
+
+
+@lru_cache(maxsize=65536)
+def _feature_bucket(feature, dim):
+    """Deterministic (bucket, sign) of a feature; Python's own hash() is salted per process."""
+    digest = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+    return digest % dim, 1.0 if digest >> 63 else -1.0
+
+
+def _features(text):
+    """Word tokens plus character trigrams of each word, so inflections of a word land close together."""
+    for token in tokenize(text):
+        yield token
+        padded = f"#{token}#"
+        for start in range(len(padded) - 2):
+            yield padded[start:start + 3]
+
+
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+class HashingEmbedder:
+    """Local embedder hashing words and character trigrams into a fixed number of signed buckets.
+
+    It needs no network and no model download, and gives the same vectors in every process, so
+    vectors built at upload time stay comparable with query vectors built in later invocations.
+    """
+
+    name = 'hashing'
+
+    def __init__(self, dim=512):
+        self.dim = dim
+
+    def embed(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in Counter(_features(text)).items():
+                bucket, sign = _feature_bucket(feature, self.dim)
+                matrix[row, bucket] += sign * (1.0 + math.log(count))
+        return normalize_rows(matrix)
+
+
+class OpenAIEmbedder:
+    """Embedder backed by the OpenAI embeddings endpoint."""
+
+    name = 'openai'
+
+    def __init__(self, client, model='text-embedding-3-small', dim=1536, batch_size=256):
+        self.client = client
+        self.model = model
+        self.dim = dim
+        self.batch_size = batch_size
+
+    def embed(self, texts):
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            response = self.client.embeddings.create(model=self.model, input=texts[start:start + self.batch_size])
+            vectors.extend(item.embedding for item in response.data)
+        return normalize_rows(np.array(vectors, dtype=np.float32).reshape(len(texts), self.dim))
+
+
+def get_embedder(name=None, client=None):
+    """Return the embedder selected by name or by the EMBEDDER environment variable."""
+    name = name or os.getenv('EMBEDDER', HashingEmbedder.name)
+    if name == HashingEmbedder.name:
+        return HashingEmbedder()
+    if name == OpenAIEmbedder.name:
+        if client is None:
+            raise RuntimeError("The openai embedder needs an OpenAI client")
+        return OpenAIEmbedder(client)
+    raise ValueError(f"Unknown embedder: {name}")
+
+
+def top_k_indices(scores, top_k):
+    """Return the indices of the top_k highest scores, best first, without sorting the whole array."""
+    if top_k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def cosine_similarities(matrix, query_vector):
+    """Rows and query are L2-normalised, so one matrix-vector product gives every cosine similarity at once."""
+    return np.asarray(matrix @ query_vector, dtype=np.float32)
+
+
+def top_k_similar(matrix, query_vector, top_k):
+    """Return the (chunk_id, similarity) pairs of the top_k rows most similar to the query, best first."""
+    if len(matrix) == 0:
+        return []
+
+    scores = cosine_similarities(matrix, query_vector)
+    return [(int(chunk_id), float(scores[chunk_id])) for chunk_id in top_k_indices(scores, top_k)
+            if scores[chunk_id] >= MIN_SIMILARITY]
@@ -1,7 +1,13 @@
+import os
+
 from asgiref.wsgi import WsgiToAsgi
 
 # Your Flask app
 from app import app
+from async_app import AsyncCompletionApp
+
+# Chat completions are awaited with AsyncOpenAI unless ASYNC_COMPLETIONS=false, which wraps the Flask app only
+ASYNC_COMPLETIONS = os.getenv("ASYNC_COMPLETIONS", "true").lower() == "true"
 
 # Wrapper
-asgi_app = WsgiToAsgi(app)
+asgi_app = AsyncCompletionApp(app) if ASYNC_COMPLETIONS else WsgiToAsgi(app)
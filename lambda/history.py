@@ -0,0 +1,94 @@
+import os
+
+from retrieval import estimate_tokens
+
+# Prompt tokens the system prompt, summary and past turns may take, on top of the current turn
+HISTORY_TOKEN_BUDGET = int(os.getenv('HISTORY_TOKEN_BUDGET', '3000'))
+# Past turns (a user message and its answer) kept in the prompt at most
+HISTORY_RECENT_TURNS = int(os.getenv('HISTORY_RECENT_TURNS', '4'))
+# Past turns that keep the document context retrieved for them; older ones keep the question only
+HISTORY_CONTEXT_TURNS = int(os.getenv('HISTORY_CONTEXT_TURNS', '1'))
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+def prompt_message(message):
+    """The chat API only accepts role and content."""
+    return {'role': message['role'], 'content': message['content']}
+
+
+def compact(message):
+    """Drop the document context from a user turn, keeping the question it asked."""
+    if message['role'] == 'user' and 'question' in message:
+        return {'role': 'user', 'content': message['question']}
+    return prompt_message(message)
+
+
+def _message_tokens(messages):
+    return sum(estimate_tokens(message['content']) for message in messages)
+
+
+def _group_turns(messages):
+    """Group messages into turns, each starting at a user message."""
+    turns = []
+    for message in messages:
+        if message['role'] == 'user' or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def fit_history(history, summary=None, summarizer=None, token_budget=None, recent_turns=None, context_turns=None):
+    """Fit a chat history into the prompt token budget.
+
+    The history is the system prompt, the past turns and the current user message, last. The system
+    prompt and the current message are always sent. Past turns are added newest first, up to
+    `recent_turns` and while they fit in the budget; all but the newest `context_turns` of them lose
+    their document context. Turns that fall out of the window are folded into the rolling summary when
+    a summarizer is given, and dropped otherwise.
+
+    Returns the messages to send, the history to keep for the next turn and the updated summary.
+    """
+    token_budget = HISTORY_TOKEN_BUDGET if token_budget is None else token_budget
+    recent_turns = HISTORY_RECENT_TURNS if recent_turns is None else recent_turns
+    context_turns = HISTORY_CONTEXT_TURNS if context_turns is None else context_turns
+
+    system, past, current = history[0], history[1:-1], history[-1]
+    spent = estimate_tokens(system['content']) + (estimate_tokens(summary) if summary else 0)
+
+    kept_turns = []
+    prompt_turns = []
+    turns = _group_turns(past)
+    for age, turn in enumerate(reversed(turns)):
+        if age >= recent_turns:
+            break
+        prompt_turn = [prompt_message(m) if age < context_turns else compact(m) for m in turn]
+        cost = _message_tokens(prompt_turn)
+        if spent + cost > token_budget:
+            break
+        spent += cost
+        kept_turns.insert(0, turn)
+        prompt_turns.insert(0, prompt_turn)
+
+    dropped = [message for turn in turns[:len(turns) - len(kept_turns)] for message in turn]
+    if dropped and summarizer is not None:
+        summary = summarizer(summary, [compact(message) for message in dropped])
+
+    messages = [prompt_message(system)]
+    if summary:
+        messages.append({'role': 'system', 'content': SUMMARY_PREFIX + summary})
+    messages.extend(message for turn in prompt_turns for message in turn)
+    messages.append(prompt_message(current))
+
+    kept_history = [system] + [message for turn in kept_turns for message in turn] + [current]
+    return messages, kept_history, summary
+
+
+def estimate_prompt_tokens(history, summary=None, token_budget=None):
+    """Tokens of the prompt `fit_history` would send, estimated without fitting the history or summarizing it.
+
+    Everything but the current message counts up to the token budget.
+    """
+    token_budget = HISTORY_TOKEN_BUDGET if token_budget is None else token_budget
+    context = _message_tokens(history[:-1]) + (estimate_tokens(summary) if summary else 0)
+    return min(context, token_budget) + _message_tokens(history[-1:])
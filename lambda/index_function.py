@@ -0,0 +1,23 @@
+import time
+from urllib.parse import unquote_plus
+
+from config import Lazy, build_openai_client, build_s3_client
+from embeddings import get_embedder
+from index_jobs import index_s3_document
+from retrieval import RETRIEVAL_MODE
+
+# Same embedder selection as the app, so document embeddings match the query embeddings it computes
+embedder = get_embedder(client=Lazy(build_openai_client)) if RETRIEVAL_MODE != 'keyword' else None
+
+s3_client = Lazy(build_s3_client)
+
+
+def handler(event, context):
+    """Index the documents stored by the app, as reported by S3 object created notifications."""
+    for record in event.get('Records', []):
+        bucket = record['s3']['bucket']['name']
+        # Notification keys are URL-encoded
+        document_key = unquote_plus(record['s3']['object']['key'])
+        started = time.perf_counter()
+        index = index_s3_document(s3_client, bucket, document_key, embedder)
+        print(f"Indexed {document_key}: {len(index['texts'])} chunks in {time.perf_counter() - started:.2f} s")
@@ -0,0 +1,107 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from artifact import artifact_key_for, artifact_path_for, save_local_artifact, save_s3_artifact
+from indexing import index_document
+
+INDEX_READY = 'ready'
+INDEX_PENDING = 'pending'
+INDEX_FAILED = 'failed'
+
+# Marker object left next to an S3 document whose indexing failed, holding the error
+FAILURE_SUFFIX = '.failed'
+
+# Artifacts of larger documents leave the chunk texts out; retrieval reads the selected chunks by byte range
+ARTIFACT_INLINE_TEXT_MAX_BYTES = int(os.getenv("ARTIFACT_INLINE_TEXT_MAX_BYTES", str(256 * 1024)))
+# Local documents are indexed on this many background threads
+INDEXING_WORKERS = int(os.getenv("INDEXING_WORKERS", "2"))
+
+
+def failure_key_for(document_key):
+    return document_key + FAILURE_SUFFIX
+
+
+def build_document_index(content, filename, embedder=None):
+    """Index the text of a stored document, embedding its chunks if an embedder is given."""
+    index = index_document(content, filename)
+    matrix = embedder.embed(index['texts']) if embedder is not None else None
+    return index, matrix
+
+
+class LocalIndexer:
+    """Builds the artifacts of local documents on a thread pool, so uploads return before indexing is done.
+
+    Documents are named by their content, so the filename of the stored document selects the chunking mode.
+    """
+
+    def __init__(self, embedder=None, max_workers=INDEXING_WORKERS):
+        self.embedder = embedder
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='indexer')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def _index(self, document_path):
+        with open(document_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        index, matrix = build_document_index(content, document_path, self.embedder)
+        save_local_artifact(document_path, index, matrix)
+        print(f"Indexed {document_path}: {len(index['texts'])} chunks")
+
+    def submit(self, document_path):
+        """Queue the document for indexing, unless a job for it is queued or running already."""
+        with self._lock:
+            job = self._jobs.get(document_path)
+            if job is None or job.done():
+                job = self._jobs[document_path] = self._executor.submit(self._index, document_path)
+            return job
+
+    def status(self, document_path):
+        """Return the index status of the document, or None if it was never queued in this process."""
+        if os.path.exists(artifact_path_for(document_path)):
+            return INDEX_READY
+        job = self._jobs.get(document_path)
+        if job is None:
+            return None
+        if job.done() and job.exception() is not None:
+            return INDEX_FAILED
+        return INDEX_PENDING
+
+
+def _s3_object_exists(s3_client, bucket, key):
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return False
+        raise
+    return True
+
+
+def s3_index_status(s3_client, bucket, document_key):
+    """Return the index status of an S3 document from its artifact and failure marker objects."""
+    if _s3_object_exists(s3_client, bucket, artifact_key_for(document_key)):
+        return INDEX_READY
+    if _s3_object_exists(s3_client, bucket, failure_key_for(document_key)):
+        return INDEX_FAILED
+    return INDEX_PENDING
+
+
+def index_s3_document(s3_client, bucket, document_key, embedder=None,
+                      inline_text_max_bytes=ARTIFACT_INLINE_TEXT_MAX_BYTES):
+    """Build and store the artifact of an S3 document, leaving a failure marker if it cannot be indexed.
+
+    The error is raised again, so the invocation is retried; a later success makes the document ready.
+    """
+    body = s3_client.get_object(Bucket=bucket, Key=document_key)['Body'].read()
+    try:
+        index, matrix = build_document_index(body.decode('utf-8'), document_key, embedder)
+        save_s3_artifact(s3_client, bucket, document_key, index, matrix,
+                         inline_texts=len(body) <= inline_text_max_bytes)
+    except Exception as e:
+        s3_client.put_object(Bucket=bucket, Key=failure_key_for(document_key), Body=str(e).encode('utf-8'),
+                             ContentType='text/plain')
+        raise
+    return index
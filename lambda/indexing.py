@@ -0,0 +1,64 @@
+import re
+from collections import Counter
+
+from chunker import chunk_document
+
+# Stored indexes are only checked against artifact.ARTIFACT_VERSION: bump it whenever the index layout or the
+# tokenisation changes
+TOKEN_PATTERN = re.compile(r'\b\w+\b')
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens, the same way queries are split into keywords."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class IndexBuilder:
+    """Builds an index chunk by chunk, for chunks produced while a document is still being read."""
+
+    def __init__(self):
+        self.texts = []
+        self.offsets = []
+        self.lengths = []
+        self.postings = {}
+        self.frequencies = {}
+
+    def add(self, chunk):
+        chunk_id = len(self.texts)
+        tokens = tokenize(chunk['text'])
+        self.texts.append(chunk['text'])
+        self.offsets.append([chunk['start'], chunk['end']])
+        self.lengths.append(len(tokens))
+        for token, count in Counter(tokens).items():
+            self.postings.setdefault(token, []).append(chunk_id)
+            self.frequencies.setdefault(token, []).append(count)
+
+    def build(self, header=None):
+        return {
+            'header': header,
+            'texts': self.texts,
+            'offsets': self.offsets,
+            'lengths': self.lengths,
+            'avg_length': sum(self.lengths) / len(self.lengths) if self.lengths else 0.0,
+            'postings': self.postings,
+            'frequencies': self.frequencies,
+        }
+
+
+def build_index(chunks, header=None):
+    """Build a token -> chunk postings inverted index over the chunks of a document.
+
+    Besides the postings, the index keeps each posting's term frequency and every chunk's token count,
+    which are the collection statistics BM25 ranking needs at query time, and the byte range of every
+    chunk in the document.
+    """
+    builder = IndexBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    return builder.build(header)
+
+
+def index_document(text, filename):
+    """Chunk a document and index its chunks."""
+    header, chunks = chunk_document(text, filename)
+    return build_index(chunks, header)
@@ -1,41 +1,59 @@
+import asyncio
 import os
-import boto3
+
 from mangum import Mangum
+from config import OPENAI_SECRET_ID, SESSION_SECRET_ID, secrets
+from app import BUCKET_NAME, app, client, document_cache, limiter, s3_client
+from async_app import AsyncCompletionApp, async_client
 from flask_asgi import asgi_app
-
-
-def fetch_secret(secret_arn):
-    # secret_arn = os.getenv('SECRET_ARN')
-    if not secret_arn:
-        raise RuntimeError("Secret ARN not set in environment variables")
-
-    # Create a Secrets Manager client
-    region_name = "us-east-1"
-    session = boto3.session.Session()
-    client = session.client(service_name='secretsmanager', region_name=region_name)
-
-    try:
-        get_secret_value_response = client.get_secret_value(SecretId=secret_arn)
-    except Exception as e:
-        print(f"Error fetching secret: {e}")
-        return None
-
-    secret = get_secret_value_response['SecretString']
-    return secret
-
-
-# Fetch the OpenAI API key
-OPENAI_API_KEY = fetch_secret(os.getenv('OPENAI_SECRET_ARN'))
-
-# Fetch the session secret key
-SESSION_SECRET_KEY = fetch_secret(os.getenv('SESSION_SECRET_KEY_ARN'))
-
-if not OPENAI_API_KEY:
-    raise RuntimeError("Failed to fetch OpenAI API key")
-
-if not SESSION_SECRET_KEY:
-    raise RuntimeError("Failed to fetch session secret key")
-
-asgi_app.secret_key = SESSION_SECRET_KEY
-
-handler = Mangum(asgi_app, lifespan="off")
+from warmup import is_warmup_event, run_steps, warm_documents
+from wsgi_lambda import LambdaWsgiHandler
+
+# Secrets are fetched once, when the app is imported, by the shared provider in config.py
+
+# Requests, messages included, call the Flask app directly unless DIRECT_WSGI=false; Mangum and the ASGI app
+# then serve them all
+DIRECT_WSGI = os.getenv("DIRECT_WSGI", "true").lower() == "true"
+
+asgi_handler = Mangum(asgi_app, lifespan="off")
+wsgi_handler = LambdaWsgiHandler(app)
+
+
+def warm_up(context=None):
+    """Refresh the secrets, open the connections of every client and load recent document artifacts, so the
+    requests that follow do not pay for them."""
+    steps = [
+        # Re-fetched once their cache expires, so a warm container never fetches them during a request
+        ('secrets', lambda: secrets.prefetch([OPENAI_SECRET_ID, SESSION_SECRET_ID])),
+        # A first call builds each client and opens the TLS connection its pool keeps alive; copies made by
+        # with_options share that pool, and do not retry a warm-up that fails
+        ('openai', lambda: client.with_options(max_retries=0).models.list()),
+        ('rate limits', lambda: limiter.storage.check()),
+    ]
+    if isinstance(asgi_app, AsyncCompletionApp):
+        # Mangum runs every invocation on this loop, where the async client's pool lives
+        steps.append(('async openai',
+                      lambda: asyncio.get_event_loop().run_until_complete(
+                          async_client.with_options(max_retries=0).models.list())))
+    if s3_client is not None:
+        steps.append(('s3', lambda: s3_client.head_bucket(Bucket=BUCKET_NAME)))
+        steps.append(('documents', lambda: warm_documents(s3_client, BUCKET_NAME, document_cache, context=context)))
+    return run_steps(steps)
+
+
+# Warm up in the init phase too, e.g. with provisioned concurrency; otherwise a scheduled warm-up event does it
+if os.getenv("WARM_UP_ON_INIT", "false").lower() == "true":
+    warm_up()
+
+
+def handler(event, context):
+    if is_warmup_event(event):
+        return {'warmed_up': warm_up(context)}
+    if not DIRECT_WSGI:
+        return asgi_handler(event, context)
+    event_handler = wsgi_handler.infer(event, context)
+    scope = event_handler.scope
+    # Messages run their view directly too, and only await the completion it hands back on the event loop
+    if isinstance(asgi_app, AsyncCompletionApp) and asgi_app.awaits_completion(scope):
+        return event_handler(asgi_app.run(scope, event_handler.body))
+    return event_handler(wsgi_handler.run(scope, event_handler.body))
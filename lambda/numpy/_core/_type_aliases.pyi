@@ -0,0 +1,3 @@
+from numpy import generic
+
+sctypeDict: dict[int | str, type[generic]]
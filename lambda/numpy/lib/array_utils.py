@@ -0,0 +1,7 @@
+from ._array_utils_impl import (
+    __all__,
+    __doc__,
+    byte_bounds,
+    normalize_axis_index,
+    normalize_axis_tuple,
+)
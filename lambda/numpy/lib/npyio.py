@@ -0,0 +1,3 @@
+from ._npyio_impl import (
+    __doc__, DataSource, NpzFile
+)
@@ -0,0 +1,4 @@
+from numpy.lib._npyio_impl import (
+    DataSource as DataSource,
+    NpzFile as NpzFile,
+)
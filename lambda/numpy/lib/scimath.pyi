@@ -0,0 +1,12 @@
+from ._scimath_impl import (
+    __all__ as __all__,
+    sqrt as sqrt, 
+    log as log, 
+    log2 as log2, 
+    logn as logn, 
+    log10 as log10, 
+    power as power, 
+    arccos as arccos, 
+    arcsin as arcsin, 
+    arctanh as arctanh,
+)
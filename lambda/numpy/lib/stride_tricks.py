@@ -0,0 +1,3 @@
+from ._stride_tricks_impl import (
+    __doc__, as_strided, sliding_window_view
+)
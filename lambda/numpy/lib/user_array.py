@@ -0,0 +1 @@
+from ._user_array_impl import __doc__, container
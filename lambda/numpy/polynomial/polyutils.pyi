@@ -0,0 +1,9 @@
+__all__: list[str]
+
+def trimseq(seq): ...
+def as_series(alist, trim=...): ...
+def trimcoef(c, tol=...): ...
+def getdomain(x): ...
+def mapparms(old, new): ...
+def mapdomain(x, old, new): ...
+def format_float(x, parens=...): ...
@@ -0,0 +1,2 @@
+from numpy._core.records import __all__, __doc__
+from numpy._core.records import *
@@ -0,0 +1,7 @@
+version: str
+__version__: str
+full_version: str
+
+git_revision: str
+release: bool
+short_version: str
@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Ranged GETs of one retrieval run concurrently on this many threads, shared by warm invocations
+RANGED_READ_WORKERS = int(os.getenv('RANGED_READ_WORKERS', '4'))
+# Spans at most this many bytes apart are fetched in one request: the bytes in between cost less than a round trip
+RANGE_COALESCE_GAP = int(os.getenv('RANGE_COALESCE_GAP', '1024'))
+
+executor = ThreadPoolExecutor(max_workers=RANGED_READ_WORKERS, thread_name_prefix='ranged-read')
+
+
+def coalesce_ranges(spans, gap=None):
+    """Merge overlapping, adjacent and nearby (start, end) byte spans into the ranges to request."""
+    gap = RANGE_COALESCE_GAP if gap is None else gap
+    ranges = []
+    for start, end in sorted(spans):
+        if ranges and start <= ranges[-1][1] + gap:
+            ranges[-1][1] = max(ranges[-1][1], end)
+        else:
+            ranges.append([start, end])
+    return [tuple(byte_range) for byte_range in ranges]
+
+
+def _get_range(s3_client, bucket, key, byte_range):
+    start, end = byte_range
+    # HTTP ranges are inclusive, spans end-exclusive
+    response = s3_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}")
+    return response['Body'].read()
+
+
+def fetch_spans(s3_client, bucket, key, spans, gap=None):
+    """Return the bytes of every (start, end) span of the object, in order, with one GET per coalesced range."""
+    spans = [(int(start), int(end)) for start, end in spans]
+    ranges = coalesce_ranges([span for span in spans if span[1] > span[0]], gap)
+    if len(ranges) == 1:
+        bodies = [_get_range(s3_client, bucket, key, ranges[0])]
+    else:
+        bodies = list(executor.map(lambda byte_range: _get_range(s3_client, bucket, key, byte_range), ranges))
+
+    fetched_bytes = sum(len(body) for body in bodies)
+    print(f"Ranged reads: {len(ranges)} requests, {fetched_bytes} bytes for {len(spans)} chunks of {key}")
+
+    results = []
+    for start, end in spans:
+        for (range_start, range_end), body in zip(ranges, bodies):
+            if range_start <= start and end <= range_end:
+                results.append(body[start - range_start:end - range_start])
+                break
+        else:
+            results.append(b'')
+    return results
+
+
+def chunk_text_fetcher(s3_client, bucket, key, index):
+    """Chunk texts resolver for retrieval over an index whose artifact does not carry them.
+
+    Only the byte ranges of the selected chunks are read from the document.
+    """
+    offsets = index['offsets']
+
+    def fetch_texts(chunk_ids):
+        bodies = fetch_spans(s3_client, bucket, key, [offsets[chunk_id] for chunk_id in chunk_ids])
+        return [body.decode('utf-8') for body in bodies]
+
+    return fetch_texts
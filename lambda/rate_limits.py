@@ -0,0 +1,520 @@
+import heapq
+import json
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+from urllib.parse import urlparse
+
+from botocore.exceptions import BotoCoreError, ClientError
+from limits import parse_many
+from limits.storage import MovingWindowSupport, Storage
+from limits.strategies import FixedWindowRateLimiter
+
+# Counts of a request's later limits, added ahead of time by the update of its first one
+Reservation = namedtuple('Reservation', 'amount count end')
+
+# Longest wait before the table is tried again while counting in memory, as Flask-Limiter's own fallback does
+MAX_FALLBACK_SECONDS = 32
+
+
+def _split_key(key):
+    """Split a limits key into the identity it counts for and the limit: 'LIMITER/<ip>/<scope>' and '30/1/day'."""
+    parts = key.rsplit('/', 3)
+    if len(parts) < 4:
+        return key, ''
+    return parts[0], '/'.join(parts[1:])
+
+
+def _window_end(seconds, now):
+    return (int(now) // seconds + 1) * seconds
+
+
+def _count_attribute(window, end):
+    return f"c:{window}@{end}"
+
+
+def _length_attribute(window):
+    return f"w:{window}"
+
+
+def _ended_counts(attributes, now):
+    """Names of the count attributes whose window has ended."""
+    return [name for name in attributes if name.startswith('c:') and int(name.rsplit('@', 1)[1]) <= now]
+
+
+class SQLiteCounterTable:
+    """Counter table in a local SQLite file, standing in for the DynamoDB table; updates are IMMEDIATE transactions."""
+
+    exceptions = (sqlite3.Error,)
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS counters "
+                               "(identity TEXT PRIMARY KEY, attributes TEXT NOT NULL, expires_at REAL NOT NULL)")
+
+    def _connect(self):
+        # sqlite3 connections are bound to their thread, and the limits are checked in each request's thread
+        return sqlite3.connect(self.path, timeout=10)
+
+    def update(self, identity, increments, values, removals, expires_at):
+        """Atomically add to, set and remove attributes of an item, returning all of its attributes."""
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM counters WHERE expires_at < ?", (time.time(),))
+            row = connection.execute("SELECT attributes FROM counters WHERE identity = ?", (identity,)).fetchone()
+            attributes = json.loads(row[0]) if row else {}
+            for name in removals:
+                attributes.pop(name, None)
+            for name, amount in increments.items():
+                attributes[name] = attributes.get(name, 0) + amount
+            attributes.update(values)
+            connection.execute("INSERT OR REPLACE INTO counters (identity, attributes, expires_at) VALUES (?, ?, ?)",
+                               (identity, json.dumps(attributes), expires_at))
+        return attributes
+
+    def get(self, identity):
+        with self._connect() as connection:
+            row = connection.execute("SELECT attributes, expires_at FROM counters WHERE identity = ?",
+                                     (identity,)).fetchone()
+        if row is None or row[1] < time.time():
+            return {}
+        return json.loads(row[0])
+
+    def remove(self, identity, names):
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute("SELECT attributes FROM counters WHERE identity = ?", (identity,)).fetchone()
+            if row is None:
+                return
+            attributes = {name: value for name, value in json.loads(row[0]).items() if name not in names}
+            connection.execute("UPDATE counters SET attributes = ? WHERE identity = ?",
+                               (json.dumps(attributes), identity))
+
+    def clear(self):
+        with self._connect() as connection:
+            return connection.execute("DELETE FROM counters").rowcount
+
+    def check(self):
+        with self._connect() as connection:
+            connection.execute("SELECT 1").fetchone()
+        return True
+
+
+class DynamoDBCounterTable:
+    """Counter table in DynamoDB: one item per identity, keyed by 'identity', with a TTL on 'expires_at'."""
+
+    exceptions = (ClientError, BotoCoreError)
+
+    def __init__(self, dynamodb_client, table_name):
+        self.dynamodb_client = dynamodb_client
+        self.table_name = table_name
+
+    def _key(self, identity):
+        return {'identity': {'S': identity}}
+
+    @staticmethod
+    def _numbers(item):
+        return {name: int(value['N']) for name, value in item.items() if 'N' in value}
+
+    def update(self, identity, increments, values, removals, expires_at):
+        """Atomically add to, set and remove attributes of an item in one UpdateItem, returning all of them."""
+        names = {}
+        expression_values = {':expires_at': {'N': str(int(expires_at))}}
+        clauses = {'ADD': [], 'SET': ['expires_at = :expires_at'], 'REMOVE': []}
+
+        def placeholder(name):
+            names[f"#a{len(names)}"] = name
+            return f"#a{len(names) - 1}"
+
+        for position, (name, amount) in enumerate(increments.items()):
+            expression_values[f":i{position}"] = {'N': str(amount)}
+            clauses['ADD'].append(f"{placeholder(name)} :i{position}")
+        for position, (name, value) in enumerate(values.items()):
+            expression_values[f":v{position}"] = {'N': str(value)}
+            clauses['SET'].append(f"{placeholder(name)} = :v{position}")
+        for name in removals:
+            clauses['REMOVE'].append(placeholder(name))
+
+        expression = " ".join(f"{clause} {', '.join(parts)}" for clause, parts in clauses.items() if parts)
+        response = self.dynamodb_client.update_item(
+            TableName=self.table_name, Key=self._key(identity), UpdateExpression=expression,
+            ExpressionAttributeNames=names, ExpressionAttributeValues=expression_values, ReturnValues='ALL_NEW')
+        return self._numbers(response.get('Attributes', {}))
+
+    def get(self, identity):
+        response = self.dynamodb_client.get_item(TableName=self.table_name, Key=self._key(identity),
+                                                 ConsistentRead=True)
+        return self._numbers(response.get('Item', {}))
+
+    def remove(self, identity, names):
+        if not names:
+            return
+        placeholders = {f"#a{position}": name for position, name in enumerate(names)}
+        self.dynamodb_client.update_item(TableName=self.table_name, Key=self._key(identity),
+                                         UpdateExpression="REMOVE " + ", ".join(placeholders),
+                                         ExpressionAttributeNames=placeholders)
+
+    def clear(self):
+        cleared = 0
+        request = {'TableName': self.table_name, 'ProjectionExpression': 'identity'}
+        while True:
+            response = self.dynamodb_client.scan(**request)
+            items = response.get('Items', [])
+            for start in range(0, len(items), 25):
+                self.dynamodb_client.batch_write_item(RequestItems={self.table_name: [
+                    {'DeleteRequest': {'Key': {'identity': item['identity']}}} for item in items[start:start + 25]
+                ]})
+            cleared += len(items)
+            if 'LastEvaluatedKey' not in response:
+                return cleared
+            request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def check(self):
+        self.dynamodb_client.describe_table(TableName=self.table_name)
+        return True
+
+
+class CounterTableStorage(Storage):
+    """limits storage keeping fixed-window counters, aligned on the clock, in a table shared by every container.
+
+    An identity's counts live in one item, one attribute per limit and window end, all incremented by one update.
+    """
+
+    STORAGE_SCHEME = None
+
+    def __init__(self, uri=None, table=None, wrap_exceptions=False, in_memory_fallback=False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.table = table
+        self.fallback = HeapMemoryStorage() if in_memory_fallback else None
+        self._failures = 0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._reservations = {}
+        self._ended = {}
+        self._locks = {}
+        self.round_trips = 0
+
+    @property
+    def base_exceptions(self):
+        return self.table.exceptions
+
+    def _lock_for(self, identity):
+        with self._lock:
+            return self._locks.setdefault(identity, threading.Lock())
+
+    def _counted(self, operation, *args, **kwargs):
+        """Run a counter operation on the table, or on the in-memory fallback while the table is unreachable."""
+        if self.fallback is None:
+            return getattr(self, f"_{operation}")(*args, **kwargs)
+        if time.time() >= self._retry_at:
+            try:
+                result = getattr(self, f"_{operation}")(*args, **kwargs)
+            except self.base_exceptions as e:
+                self._failures += 1
+                self._retry_at = time.time() + min(2 ** (self._failures - 1), MAX_FALLBACK_SECONDS)
+                print(f"Rate limit table unreachable, counting in memory: {e}")
+            else:
+                self._failures = 0
+                return result
+        return getattr(self.fallback, operation)(*args, **kwargs)
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        if elastic_expiry:
+            raise NotImplementedError("Elastic expiry is not supported by the counter table storage")
+        return self._counted('incr', key, expiry, amount=amount)
+
+    def get(self, key):
+        return self._counted('get', key)
+
+    def get_expiry(self, key):
+        return self._counted('get_expiry', key)
+
+    def clear(self, key):
+        return self._counted('clear', key)
+
+    def _incr(self, key, expiry, amount=1):
+        identity, window = _split_key(key)
+        now = time.time()
+
+        with self._lock_for(identity):
+            # The first check of a request counts every limit of the identity; the others return its reservations
+            reservation = self._reservations.pop(key, None)
+            if reservation is not None and reservation.amount == amount and reservation.end > now:
+                return reservation.count
+
+            windows = self._windows.setdefault(identity, {})
+            windows[window] = expiry
+            increments, values, ends = {}, {}, {}
+            # Drop the previous window's count, and every other ended one the last update returned
+            removals = set(self._ended.pop(identity, ()))
+            for name, seconds in windows.items():
+                end = ends[name] = _window_end(seconds, now)
+                previous = reservation if name == window else self._reservations.pop(f"{identity}/{name}", None)
+                taken_back = previous.amount if previous is not None and previous.end == end else 0
+                increments[_count_attribute(name, end)] = amount - taken_back
+                values[_length_attribute(name)] = seconds
+                removals.add(_count_attribute(name, end - seconds))
+
+            attributes = self.table.update(identity, increments, values, sorted(removals), max(ends.values()))
+            self.round_trips += 1
+            self._ended[identity] = _ended_counts(attributes, now)
+
+            for name, end in ends.items():
+                if name != window:
+                    self._reservations[f"{identity}/{name}"] = Reservation(
+                        amount, attributes.get(_count_attribute(name, end), 0), end)
+            # Limits another container checked for this identity are batched from its next request on
+            for name, seconds in attributes.items():
+                if name.startswith('w:'):
+                    windows.setdefault(name[len('w:'):], seconds)
+            return attributes.get(_count_attribute(window, ends[window]), 0)
+
+    def _get(self, key):
+        identity, window = _split_key(key)
+        attributes = self.table.get(identity)
+        seconds = attributes.get(_length_attribute(window))
+        if seconds is None:
+            return 0
+        end = _window_end(seconds, time.time())
+        count = attributes.get(_count_attribute(window, end), 0)
+        with self._lock_for(identity):
+            reservation = self._reservations.get(key)
+        if reservation is not None and reservation.end == end:
+            count -= reservation.amount
+        return count
+
+    def _get_expiry(self, key):
+        identity, window = _split_key(key)
+        seconds = self.table.get(identity).get(_length_attribute(window))
+        now = time.time()
+        return _window_end(seconds, now) if seconds is not None else int(now)
+
+    def _clear(self, key):
+        identity, window = _split_key(key)
+        with self._lock_for(identity):
+            self._reservations.pop(key, None)
+            self._windows.get(identity, {}).pop(window, None)
+            names = [name for name in self.table.get(identity)
+                     if name == _length_attribute(window) or name.startswith(f"c:{window}@")]
+            self.table.remove(identity, names)
+
+    def reset(self):
+        with self._lock:
+            self._windows.clear()
+            self._reservations.clear()
+            self._ended.clear()
+        if self.fallback is not None:
+            self.fallback.reset()
+        return self.table.clear()
+
+    def check(self):
+        try:
+            return self.table.check()
+        except self.base_exceptions:
+            return False
+
+
+class SQLiteStorage(CounterTableStorage):
+    """Counter table storage in a local SQLite file: ``sqlite:///path/to/rate_limits.sqlite3``."""
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri, wrap_exceptions=False, **options):
+        super().__init__(uri, SQLiteCounterTable(urlparse(uri).path), wrap_exceptions, **options)
+
+
+class DynamoDBStorage(CounterTableStorage):
+    """Counter table storage in a DynamoDB table: ``dynamodb://table-name``, with the client in the options."""
+
+    STORAGE_SCHEME = ["dynamodb"]
+
+    def __init__(self, uri, dynamodb_client=None, wrap_exceptions=False, **options):
+        if dynamodb_client is None:
+            import boto3
+            dynamodb_client = boto3.client('dynamodb')
+        super().__init__(uri, DynamoDBCounterTable(dynamodb_client, urlparse(uri).netloc), wrap_exceptions,
+                         **options)
+
+
+class HeapMemoryStorage(Storage, MovingWindowSupport):
+    """In-memory storage expiring counters and moving windows as they are accessed: ``heap-memory://``.
+
+    limits' MemoryStorage starts a timer thread every 10 ms while it is in use, which walks every key and
+    every moving window entry. Here the expiry times of the keys are kept in a min-heap, and each access pops
+    the ones that are due, so no thread runs and expiring a key costs O(log n). A moving window is a deque of
+    hit times, oldest first, trimmed from the left when it is read; the heap holds one entry per window, for
+    the expiry of its newest hit, which drops windows that are no longer hit.
+    """
+
+    STORAGE_SCHEME = ["heap-memory"]
+
+    def __init__(self, uri=None, wrap_exceptions=False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.expirations = {}
+        self.events = {}
+        # (expiry time, is moving window, key), with entries outdated by an elastic expiry skipped when popped
+        self._expiries = []
+
+    @property
+    def base_exceptions(self):
+        return ValueError
+
+    def _expire(self, now):
+        while self._expiries and self._expiries[0][0] <= now:
+            _, moving, key = heapq.heappop(self._expiries)
+            if not moving:
+                if self.expirations.get(key, now + 1) <= now:
+                    del self.counters[key], self.expirations[key]
+                continue
+            window = self.events.get(key)
+            if window is None:
+                continue
+            hits, expiry = window
+            if hits and hits[-1] + expiry > now:
+                heapq.heappush(self._expiries, (hits[-1] + expiry, True, key))
+            else:
+                del self.events[key]
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            count = self.counters[key] = self.counters.get(key, 0) + amount
+            if elastic_expiry or key not in self.expirations:
+                self.expirations[key] = now + expiry
+                heapq.heappush(self._expiries, (now + expiry, False, key))
+            return count
+
+    def decr(self, key, amount=1):
+        with self._lock:
+            self._expire(time.time())
+            if key not in self.counters:
+                return 0
+            count = self.counters[key] = max(self.counters[key] - amount, 0)
+            return count
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            return self.counters.get(key, 0)
+
+    def get_expiry(self, key):
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            return int(self.expirations.get(key, now))
+
+    def clear(self, key):
+        with self._lock:
+            self.counters.pop(key, None)
+            self.expirations.pop(key, None)
+            self.events.pop(key, None)
+
+    def _window(self, key, expiry, now):
+        """Hits of the key's moving window still within `expiry` seconds of now, or None."""
+        window = self.events.get(key)
+        if window is None:
+            return None
+        hits = window[0]
+        while hits and hits[0] < now - expiry:
+            hits.popleft()
+        return hits
+
+    def acquire_entry(self, key, limit, expiry, amount=1):
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            hits = self._window(key, expiry, now)
+            if hits is None:
+                hits = deque()
+                self.events[key] = (hits, expiry)
+                heapq.heappush(self._expiries, (now + expiry, True, key))
+            if len(hits) + amount > limit:
+                return False
+            hits.extend([now] * amount)
+            return True
+
+    def get_moving_window(self, key, limit, expiry):
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            hits = self._window(key, expiry, now)
+            if not hits:
+                return int(now), 0
+            return int(hits[0]), len(hits)
+
+    def check(self):
+        return True
+
+    def reset(self):
+        with self._lock:
+            cleared = max(len(self.counters), len(self.events))
+            self.counters.clear()
+            self.expirations.clear()
+            self.events.clear()
+            self._expiries.clear()
+            return cleared
+
+
+class TokenLimits:
+    """Rate limits counted in OpenAI tokens rather than requests, through `RateLimiter.hit(cost=...)`.
+
+    A message is charged an estimate of its prompt and completion tokens before the completion is requested,
+    so a client past its limits is refused before spending any. Once the API reports the tokens it used, the
+    difference is charged, or given back, so each client is limited by the load it actually generates.
+    Given back tokens only count with the fixed-window strategies; a moving window ignores negative costs.
+    """
+
+    def __init__(self, rate_limiter, limits, scope='openai-tokens'):
+        # A callable, so Flask-Limiter's in-memory fallback is charged while its storage is unreachable
+        self.rate_limiter = rate_limiter
+        self.items = sorted(parse_many(limits))
+        self.scope = scope
+
+    def charge(self, identity, tokens):
+        """Charge `tokens` to every limit of the identity; False, charging nothing, if one would be exceeded."""
+        rate_limiter = self.rate_limiter()
+        try:
+            for position, item in enumerate(self.items):
+                if not rate_limiter.hit(item, identity, self.scope, cost=tokens):
+                    # A refused message spends no tokens, so give back what the limits checked so far counted
+                    for charged in self.items[:position + 1]:
+                        rate_limiter.hit(charged, identity, self.scope, cost=-tokens)
+                    return False
+        except Exception as e:
+            # Like Flask-Limiter's request limits, an unreachable storage lets the request through
+            print(f"Error charging token limits: {e}")
+        return True
+
+    def correct(self, identity, charged, used):
+        """Charge the tokens used beyond the `charged` estimate, or give back those it overestimated."""
+        if used == charged:
+            return
+        rate_limiter = self.rate_limiter()
+        try:
+            for item in self.items:
+                rate_limiter.hit(item, identity, self.scope, cost=used - charged)
+        except Exception as e:
+            print(f"Error correcting token limits: {e}")
+
+    def retry_after(self, identity, tokens):
+        """Seconds until every limit of the identity has room for `tokens` again."""
+        rate_limiter = self.rate_limiter()
+        resets = [stats.reset_time for stats in (rate_limiter.get_window_stats(item, identity, self.scope)
+                                                 for item in self.items) if stats.remaining < tokens]
+        return max(int(max(resets) - time.time()), 1) if resets else 1
+
+
+def require_fixed_windows(limiter):
+    """Refuse up front a strategy other than 'fixed-window' over a counter table storage."""
+    if isinstance(limiter.storage, CounterTableStorage) and type(limiter.limiter) is not FixedWindowRateLimiter:
+        raise NotImplementedError(f"{type(limiter.limiter).__name__} is not supported by the counter table storage, "
+                                  f"which only counts fixed windows aligned on the clock")
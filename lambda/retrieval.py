@@ -0,0 +1,142 @@
+import math
+import os
+
+import numpy as np
+
+from embeddings import MIN_SIMILARITY, cosine_similarities, top_k_indices, top_k_similar
+
+# BM25 parameters: term frequency saturation and document length normalisation
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# 'keyword' ranks chunks with BM25, 'semantic' with the cosine similarity of their embeddings and
+# 'hybrid' with both, fused per HYBRID_FUSION
+RETRIEVAL_MODE = os.getenv('RETRIEVAL_MODE', 'keyword')
+
+# 'rrf' sums reciprocal ranks, 'weighted' mixes normalised scores with HYBRID_ALPHA on the vector side
+HYBRID_FUSION = os.getenv('HYBRID_FUSION', 'rrf')
+HYBRID_ALPHA = float(os.getenv('HYBRID_ALPHA', '0.5'))
+RRF_K = 60
+
+# Keep the prompt bounded whatever the document size
+DEFAULT_TOP_K = int(os.getenv('RETRIEVAL_TOP_K', '8'))
+DEFAULT_TOKEN_BUDGET = int(os.getenv('RETRIEVAL_TOKEN_BUDGET', '1500'))
+
+# Rough characters-per-token ratio of OpenAI tokenizers on English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text):
+    """Cheap prompt token estimate that does not need a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def bm25_scores(index, keywords):
+    """Okapi BM25 score of every chunk, as an array; chunks without any keyword score 0.
+
+    Only the posting lists of the query keywords are touched, each in one vectorised update.
+    """
+    lengths = np.asarray(index['lengths'], dtype=np.float32)
+    scores = np.zeros(len(lengths), dtype=np.float32)
+    if not len(lengths):
+        return scores
+
+    norms = BM25_K1 * (1 - BM25_B + BM25_B * lengths / (index['avg_length'] or 1.0))
+    postings = index['postings']
+    frequencies = index['frequencies']
+
+    for keyword in set(keywords):
+        if keyword not in postings:
+            continue
+        chunk_ids = np.asarray(postings[keyword], dtype=np.int64)
+        term_frequencies = np.asarray(frequencies[keyword], dtype=np.float32)
+        document_frequency = len(chunk_ids)
+        idf = math.log(1 + (len(lengths) - document_frequency + 0.5) / (document_frequency + 0.5))
+        scores[chunk_ids] += idf * term_frequencies * (BM25_K1 + 1) / (term_frequencies + norms[chunk_ids])
+
+    return scores
+
+
+def rank_chunks(index, keywords, top_k=None):
+    """Return the (chunk_id, score) pairs of the top_k best scoring chunks, best first."""
+    top_k = DEFAULT_TOP_K if top_k is None else top_k
+    scores = bm25_scores(index, keywords)
+    return [(int(chunk_id), float(scores[chunk_id])) for chunk_id in top_k_indices(scores, top_k)
+            if scores[chunk_id] > 0]
+
+
+def _reciprocal_ranks(scores, relevant):
+    """1 / (RRF_K + rank) for every relevant chunk, 0 for the others."""
+    ranks = np.empty(len(scores), dtype=np.float32)
+    ranks[np.argsort(-scores, kind='stable')] = np.arange(1, len(scores) + 1, dtype=np.float32)
+    return np.where(relevant, 1.0 / (RRF_K + ranks), 0.0)
+
+
+def fuse_scores(keyword_scores, vector_scores, fusion=None, alpha=None):
+    """Fuse per-chunk keyword and vector scores into one array; chunks relevant to neither score 0."""
+    fusion = HYBRID_FUSION if fusion is None else fusion
+    alpha = HYBRID_ALPHA if alpha is None else alpha
+    keyword_relevant = keyword_scores > 0
+    vector_relevant = vector_scores >= MIN_SIMILARITY
+
+    if fusion == 'rrf':
+        return (_reciprocal_ranks(keyword_scores, keyword_relevant)
+                + _reciprocal_ranks(vector_scores, vector_relevant))
+    if fusion == 'weighted':
+        top_keyword_score = keyword_scores.max(initial=0.0) or 1.0
+        return ((1 - alpha) * keyword_scores / top_keyword_score
+                + alpha * np.where(vector_relevant, vector_scores, 0.0))
+    raise ValueError(f"Unknown hybrid fusion: {fusion}")
+
+
+def apply_token_budget(snippets, token_budget=None):
+    """Keep snippets in rank order until the token budget is spent, truncating the first if it alone exceeds it."""
+    token_budget = DEFAULT_TOKEN_BUDGET if token_budget is None else token_budget
+    kept = []
+    spent = 0
+
+    for snippet in snippets:
+        cost = estimate_tokens(snippet)
+        if spent + cost > token_budget:
+            if not kept:
+                kept.append(snippet[:token_budget * CHARS_PER_TOKEN])
+            break
+        kept.append(snippet)
+        spent += cost
+
+    return kept
+
+
+def chunk_texts(index, chunk_ids, fetch_texts=None):
+    """Texts of the ranked chunks, from the index or, for indexes without them, from `fetch_texts`.
+
+    CSV rows are indexed without the header, so column names do not match every row; it leads the rows instead.
+    """
+    if fetch_texts is not None:
+        texts = fetch_texts(chunk_ids)
+    else:
+        texts = [index['texts'][chunk_id] for chunk_id in chunk_ids]
+    header = index.get('header')
+    return [header, *texts] if header and texts else texts
+
+
+def retrieve(index, keywords, top_k=None, token_budget=None, fetch_texts=None):
+    """Return the best matching chunks for the keywords, bounded by top_k and the token budget."""
+    ranked = rank_chunks(index, keywords, top_k)
+    return apply_token_budget(chunk_texts(index, [chunk_id for chunk_id, _ in ranked], fetch_texts), token_budget)
+
+
+def retrieve_semantic(index, matrix, query_vector, top_k=None, token_budget=None, fetch_texts=None):
+    """Return the chunks whose embeddings are most similar to the query, bounded by top_k and the token budget."""
+    top_k = DEFAULT_TOP_K if top_k is None else top_k
+    ranked = top_k_similar(matrix, query_vector, top_k)
+    return apply_token_budget(chunk_texts(index, [chunk_id for chunk_id, _ in ranked], fetch_texts), token_budget)
+
+
+def retrieve_hybrid(index, matrix, keywords, query_vector, top_k=None, token_budget=None, fusion=None, alpha=None,
+                    fetch_texts=None):
+    """Return the best chunks by fused keyword and vector scores, bounded by top_k and the token budget."""
+    top_k = DEFAULT_TOP_K if top_k is None else top_k
+    scores = fuse_scores(bm25_scores(index, keywords), cosine_similarities(matrix, query_vector), fusion, alpha)
+    ranked = [int(chunk_id) for chunk_id in top_k_indices(scores, top_k) if scores[chunk_id] > 0]
+    return apply_token_budget(chunk_texts(index, ranked, fetch_texts), token_budget)
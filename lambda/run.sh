@@ -0,0 +1,3 @@
+#!/bin/bash
+# Handler of the response-streaming deployment, started by the AWS Lambda Web Adapter
+exec python3 streaming_server.py
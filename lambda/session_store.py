@@ -0,0 +1,194 @@
+import functools
+import json
+import secrets
+import sqlite3
+import time
+from datetime import timedelta
+
+from botocore.exceptions import ClientError
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session whose data lives in a store; only its id travels in the cookie.
+
+    With a `loader`, the data is loaded on first access, so requests that never use the session, such as
+    those for static files, do not read the store.
+    """
+
+    def __init__(self, initial=None, sid=None, new=False, loader=None):
+        def on_update(self):
+            self.modified = True
+
+        CallbackDict.__init__(self, initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self._loader = loader
+
+    @property
+    def loaded(self):
+        return self._loader is None
+
+    def _load(self):
+        if self._loader is None:
+            return
+        loader, self._loader = self._loader, None
+        data = loader()
+        if data is None:
+            # Expired or unknown: start a new session rather than recreating the old one
+            self.sid = secrets.token_urlsafe(32)
+            self.new = True
+        else:
+            dict.update(self, data)
+
+
+def _loading_first(name):
+    method = getattr(CallbackDict, name)
+
+    @functools.wraps(method)
+    def load_first(self, *args, **kwargs):
+        self._load()
+        return method(self, *args, **kwargs)
+
+    return load_first
+
+
+for _name in ('__getitem__', '__setitem__', '__delitem__', '__contains__', '__iter__', '__len__', '__eq__',
+              '__repr__', 'get', 'keys', 'values', 'items', 'copy', 'setdefault', 'pop', 'popitem', 'update',
+              'clear'):
+    setattr(ServerSideSession, _name, _loading_first(_name))
+
+
+class SQLiteSessionStore:
+    """Session store in a local SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        # One connection per operation, as Flask may serve requests from several threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def load(self, sid):
+        with self._connect() as connection:
+            row = connection.execute("SELECT data, expires FROM sessions WHERE sid = ?", (sid,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def save(self, sid, data, ttl):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sessions (sid, data, expires) VALUES (?, ?, ?)",
+                (sid, json.dumps(data), time.time() + ttl.total_seconds())
+            )
+
+    def delete(self, sid):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+
+class S3SessionStore:
+    """Session store keeping one JSON object per session in an S3 bucket."""
+
+    def __init__(self, s3_client, bucket, prefix='sessions/'):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, sid):
+        return f"{self.prefix}{sid}.json"
+
+    def load(self, sid):
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(sid))
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+                return None
+            raise
+        record = json.loads(response['Body'].read())
+        if record['expires'] < time.time():
+            return None
+        return record['data']
+
+    def save(self, sid, data, ttl):
+        record = {'data': data, 'expires': time.time() + ttl.total_seconds()}
+        self.s3_client.put_object(Bucket=self.bucket, Key=self._key(sid), Body=json.dumps(record).encode('utf-8'),
+                                  ContentType='application/json')
+
+    def delete(self, sid):
+        self.s3_client.delete_object(Bucket=self.bucket, Key=self._key(sid))
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface keeping session data in a store, keyed by an opaque, signed session id.
+
+    The cookie stays a few dozen bytes however long the chat history grows, and is only set when a
+    session is created.
+    """
+
+    salt = 'server-side-session'
+
+    def __init__(self, store, ttl=timedelta(days=1)):
+        self.store = store
+        self.ttl = ttl
+
+    def _signer(self, app):
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt=self.salt)
+
+    def open_session(self, app, request):
+        signer = self._signer(app)
+        if signer is None:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = signer.unsign(cookie).decode('utf-8')
+            except BadSignature:
+                sid = None
+            if sid:
+                return ServerSideSession(sid=sid, loader=lambda: self.store.load(sid))
+
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save(self, session):
+        """Write the session to the store now, e.g. once a streamed response has finished."""
+        self.store.save(session.sid, dict(session), self.ttl)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session.loaded:
+            return
+        if not session:
+            if session.modified:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.modified:
+            self.save(session)
+
+        if session.new:
+            response.set_cookie(
+                name,
+                self._signer(app).sign(session.sid.encode('utf-8')).decode('utf-8'),
+                max_age=int(self.ttl.total_seconds()),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
@@ -15,14 +15,15 @@ async function sendMessage() {
         appendMessage('user', message);
         userInput.value = ''; // Clear the input field
 
-        // Send the message to the server
+        // Send the message to the server, and render the answer as it is generated where the deployment streams it
+        const stream = document.body.dataset.streamResponses === 'true';
         try {
             const response = await fetch('/api/message', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
-                body: JSON.stringify({ message: message })
+                body: JSON.stringify({ message: message, stream: stream })
             });
 
             if (!response.ok) {
@@ -30,8 +31,12 @@ async function sendMessage() {
                 throw new Error(errorData.error || 'Failed to fetch response from server.');
             }
 
-            const data = await response.json();
-            appendMessage('bot', data.response);
+            if (stream) {
+                await renderStream(response, appendMessage('bot', ''));
+            } else {
+                const data = await response.json();
+                appendMessage('bot', data.response);
+            }
 
         } catch (error) {
             console.error('Error:', error);
@@ -40,6 +45,41 @@ async function sendMessage() {
     }
 }
 
+// Read server-sent events from the response and append their text to the message as they arrive
+async function renderStream(response, messageDiv) {
+    const output = document.getElementById('output');
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+
+        // Events are separated by a blank line; keep the last, possibly partial, one for the next read
+        const events = buffer.split('\n\n');
+        buffer = events.pop();
+
+        for (const event of events) {
+            if (!event.startsWith('data: ')) {
+                continue;
+            }
+            const payload = JSON.parse(event.slice('data: '.length));
+            if (payload.type === 'error') {
+                text = payload.content;
+            } else if (payload.type !== 'done') {
+                text += payload.content;
+            }
+            messageDiv.innerText = text;
+            output.scrollTop = output.scrollHeight; // Auto scroll to the bottom
+        }
+    }
+}
+
 function appendMessage(type, message) {
     const output = document.getElementById('output');
     const messageDiv = document.createElement('div');
@@ -47,6 +87,7 @@ function appendMessage(type, message) {
     messageDiv.innerText = message;
     output.appendChild(messageDiv);
     output.scrollTop = output.scrollHeight; // Auto scroll to the bottom
+    return messageDiv;
 }
 
 async function handleFileUpload(event) {
@@ -74,6 +115,9 @@ async function handleFileUpload(event) {
 
             const data = await response.json();
             appendMessage('bot', data.message || 'File uploaded and parsed successfully.');
+            if (data.index_status === 'pending') {
+                await waitForIndex();
+            }
 
         } catch (error) {
             console.error('Error:', error);
@@ -82,6 +126,37 @@ async function handleFileUpload(event) {
     }
 }
 
+// Poll the index status after an upload, backing off from 1 to 5 seconds, and report when it is ready.
+// Until then, answers are based on a plain scan of the document.
+async function waitForIndex() {
+    let delay = 1000;
+    const deadline = Date.now() + 2 * 60 * 1000;
+
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, delay));
+        delay = Math.min(delay * 1.5, 5000);
+
+        try {
+            const response = await fetch('/api/index_status');
+            if (!response.ok) {
+                return;
+            }
+            const data = await response.json();
+            if (data.status === 'ready') {
+                appendMessage('bot', 'The document is indexed.');
+                return;
+            }
+            if (data.status === 'failed') {
+                appendMessage('bot', 'The document could not be indexed; answers will use a plain search of it.');
+                return;
+            }
+        } catch (error) {
+            console.error('Error:', error);
+            return;
+        }
+    }
+}
+
 // Function to refresh the page
 function refreshPage() {
     location.reload();
@@ -0,0 +1,11 @@
+import os
+
+from werkzeug.serving import run_simple
+
+# Your Flask app
+from app import app
+
+# Entry point of the response-streaming deployment: the AWS Lambda Web Adapter forwards function URL
+# requests to this server and streams its responses back as they are written, which Mangum cannot do.
+if __name__ == "__main__":
+    run_simple('0.0.0.0', int(os.getenv('PORT', '8080')), app, threaded=True)
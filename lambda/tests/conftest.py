@@ -0,0 +1,6 @@
+# lambda/tests/conftest.py
+import os
+import sys
+
+# The Lambda runtime imports handler modules from the package root, so do the same for tests
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
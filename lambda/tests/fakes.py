@@ -0,0 +1,47 @@
+import hashlib
+import io
+
+from botocore.exceptions import ClientError
+
+
+class FakeS3:
+    """Local stand-in for the S3 object calls the session store, cache tiers and uploads make."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+        return {'Body': io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+
+class VersionedFakeS3(FakeS3):
+    """Stand-in that also returns ETags and honours conditional GETs, counting the bodies it sends."""
+
+    def __init__(self):
+        super().__init__()
+        self.downloads = 0
+
+    @staticmethod
+    def etag(body):
+        return f'"{hashlib.md5(body).hexdigest()}"'
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+        etag = self.etag(self.objects[Key])
+        if IfNoneMatch == etag:
+            raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+        self.downloads += 1
+        return {'Body': io.BytesIO(self.objects[Key]), 'ETag': etag}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        super().put_object(Bucket, Key, Body)
+        return {'ETag': self.etag(Body)}
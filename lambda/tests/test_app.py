@@ -1,6 +1,9 @@
 import io
+from types import SimpleNamespace
+
 import pytest
-from ..app import app
+from .. import app as app_module
+from ..app import MAX_UPLOAD_BYTES, app
 
 
 @pytest.fixture
@@ -20,3 +23,38 @@ def test_clear_session(client):
     assert rv.status_code == 200
     assert 'Session cleared successfully' in rv.get_json().get('message', '')  # Updated expected message
 
+
+
+@pytest.mark.parametrize('size', [MAX_UPLOAD_BYTES + 1, app.config['MAX_CONTENT_LENGTH'] + 1])
+def test_upload_too_large(client, size):
+    # Past MAX_CONTENT_LENGTH Werkzeug refuses the request before the view counts the upload's bytes
+    rv = client.post('/api/upload', data={'file': (io.BytesIO(b'a' * size), 'big.txt', 'text/plain')})
+    assert rv.status_code == 413
+    assert rv.get_json() == {'error': 'File size exceeds limit (1MB)'}
+
+
+def test_upload_not_utf8(client):
+    rv = client.post('/api/upload', data={'file': (io.BytesIO(b'caf\xe9\n'), 'latin1.txt', 'text/plain')})
+    assert rv.status_code == 400
+    assert rv.get_json() == {'error': 'File is not UTF-8 encoded text'}
+
+
+def failing_create(**kwargs):
+    raise RuntimeError("completion failed")
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_failed_completion_gives_back_its_tokens(client, monkeypatch, stream):
+    corrections = []
+    monkeypatch.setattr(app_module, 'client',
+                        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=failing_create))))
+    monkeypatch.setattr(app_module.token_limits, 'correct',
+                        lambda identity, charged, used: corrections.append(used))
+
+    if stream:
+        rv = client.post('/api/message', json={'message': 'hi', 'stream': True})
+        assert '"type": "error"' in rv.get_data(as_text=True)
+    else:
+        with pytest.raises(RuntimeError):
+            client.post('/api/message', json={'message': 'hi'})
+    assert corrections == [0]
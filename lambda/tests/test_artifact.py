@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from .. import artifact as artifact_module
+from ..artifact import (build_artifact, read_artifact, save_local_artifact, load_local_artifact, artifact_path_for,
+                        save_s3_artifact, load_s3_artifact)
+from ..cache import S3ObjectCache
+from ..embeddings import HashingEmbedder
+from ..indexing import index_document
+from ..retrieval import retrieve, retrieve_hybrid, bm25_scores
+from .fakes import VersionedFakeS3
+
+
+@pytest.fixture
+def index():
+    return index_document("name,role\nAlice,engineer\nBob,manager\nCarol,engineer manager\nDan,café owner\n",
+                          "team.csv")
+
+
+def test_artifact_reads_back_the_index(index):
+    artifact = read_artifact(build_artifact(index))
+
+    assert artifact['header'] == index['header']
+    assert list(artifact['texts']) == index['texts']
+    assert artifact['offsets'].tolist() == index['offsets']
+    assert artifact['lengths'].tolist() == index['lengths']
+    assert artifact['avg_length'] == index['avg_length']
+    for term in index['postings']:
+        assert artifact['postings'][term].tolist() == index['postings'][term]
+        assert artifact['frequencies'][term].tolist() == index['frequencies'][term]
+    assert 'café' in artifact['postings']
+    assert 'nobody' not in artifact['postings']
+    assert artifact.embeddings is None
+
+
+def test_retrieval_over_artifact_matches_the_index(index):
+    embedder = HashingEmbedder(dim=64)
+    matrix = embedder.embed(index['texts'])
+    artifact = read_artifact(build_artifact(index, matrix))
+    keywords = ['engineer', 'manager', 'zebra']
+
+    assert np.array_equal(bm25_scores(artifact, keywords), bm25_scores(index, keywords))
+    assert retrieve(artifact, keywords) == retrieve(index, keywords)
+    assert np.array_equal(artifact.embeddings, matrix)
+    query_vector = embedder.embed(["engineer manager"])[0]
+    assert (retrieve_hybrid(artifact, artifact.embeddings, keywords, query_vector)
+            == retrieve_hybrid(index, matrix, keywords, query_vector))
+
+
+def test_read_artifact_rejects_other_versions(index, monkeypatch):
+    payload = build_artifact(index)
+    monkeypatch.setattr(artifact_module, 'ARTIFACT_VERSION', artifact_module.ARTIFACT_VERSION + 1)
+    assert read_artifact(payload) is None
+    assert read_artifact(b'') is None
+
+
+def test_local_artifact_is_memory_mapped(tmp_path, index):
+    document_path = str(tmp_path / "team.csv")
+    assert load_local_artifact(document_path) is None
+
+    assert save_local_artifact(document_path, index) == artifact_path_for(document_path)
+    artifact = load_local_artifact(document_path)
+    assert retrieve(artifact, ['engineer']) == retrieve(index, ['engineer'])
+    assert not artifact['lengths'].flags.writeable
+
+
+def test_s3_artifact_is_mapped_from_the_object_cache(tmp_path, index):
+    s3_client = VersionedFakeS3()
+    cache = S3ObjectCache(s3_client, 'bucket', str(tmp_path))
+    assert load_s3_artifact(s3_client, 'bucket', "uploads/team.csv", cache) is None
+
+    save_s3_artifact(s3_client, 'bucket', "uploads/team.csv", index, cache=cache)
+    assert list(load_s3_artifact(s3_client, 'bucket', "uploads/team.csv")['texts']) == index['texts']
+
+    artifact = load_s3_artifact(s3_client, 'bucket', "uploads/team.csv", cache)
+    assert list(artifact['texts']) == index['texts']
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,165 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, jsonify, request, session
+from mangum import Mangum
+
+from .test_wsgi_lambda import function_url_event
+
+# Imported as the Lambda runtime imports them, like async_app imports its siblings, so the session interface
+# and environ key the test uses are the ones it checks
+from async_app import AsyncCompletionApp
+from completions import hand_off_completion
+from session_store import ServerSideSessionInterface
+from wsgi_lambda import LambdaWsgiHandler
+
+
+class CountingStore:
+    def __init__(self):
+        self.sessions = {}
+        self.saves = 0
+
+    def load(self, sid):
+        return self.sessions.get(sid)
+
+    def save(self, sid, data, ttl):
+        self.saves += 1
+        self.sessions[sid] = json.loads(json.dumps(data))
+
+    def delete(self, sid):
+        self.sessions.pop(sid, None)
+
+
+class FakeAsyncOpenAI:
+    """Async OpenAI client answering every completion with the same tokens, or failing."""
+
+    def __init__(self, tokens=('Hello', ' there'), fail=False):
+        self.tokens = tokens
+        self.fail = fail
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.fail:
+            raise RuntimeError("completion failed")
+        if kwargs.get('stream'):
+            return self.stream()
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=7),
+                               choices=[SimpleNamespace(message=SimpleNamespace(content="".join(self.tokens)))])
+
+    async def stream(self):
+        for token in self.tokens:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))], usage=None)
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=7))
+
+
+@pytest.fixture
+def store():
+    return CountingStore()
+
+
+@pytest.fixture
+def usage():
+    return []
+
+
+@pytest.fixture
+def flask_app(store, usage):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.session_interface = ServerSideSessionInterface(store)
+
+    @app.route('/api/message', methods=['POST'])
+    def message():
+        data = request.get_json()
+        if data['message'] == 'too many':
+            return jsonify({'error': 'Rate limit exceeded'}), 429
+        session['chat_history'] = [{'role': 'user', 'content': data['message']}]
+        current_session = session._get_current_object()
+
+        def record(bot_response):
+            current_session['chat_history'].append({'role': 'assistant', 'content': bot_response})
+            app.session_interface.save(current_session)
+
+        return hand_off_completion(request.environ, current_session, current_session['chat_history'], 'snippets',
+                                   bool(data.get('stream')), record, usage.append)
+
+    return app
+
+
+def send(flask_app, client, payload, content_length=True):
+    handler = Mangum(AsyncCompletionApp(flask_app, client=client), lifespan="off")
+    event = function_url_event('POST', '/api/message', json.dumps(payload).encode(), content_length=content_length)
+    return handler(event, None)
+
+
+@pytest.mark.parametrize('content_length', [True, False])
+def test_answer_is_recorded_with_a_single_session_save(flask_app, store, usage, content_length):
+    response = send(flask_app, FakeAsyncOpenAI(), {'message': 'hi'}, content_length=content_length)
+
+    assert response['statusCode'] == 200
+    assert response['cookies'][0].startswith('session=')
+    assert json.loads(response['body']) == {'response': "Hello there\n\nInformation source:\n\nsnippets"}
+    assert store.saves == 1
+    assert list(store.sessions.values()) == [{'chat_history': [{'role': 'user', 'content': 'hi'},
+                                                               {'role': 'assistant', 'content': 'Hello there'}]}]
+    assert usage == [7]
+
+
+def test_streamed_answer_is_recorded_with_a_single_session_save(flask_app, store, usage):
+    response = send(flask_app, FakeAsyncOpenAI(), {'message': 'hi', 'stream': True})
+
+    assert response['statusCode'] == 200
+    assert response['headers']['content-type'] == 'text/event-stream'
+    events = [json.loads(line[len('data: '):]) for line in response['body'].split('\n\n') if line]
+    assert [event['type'] for event in events] == ['token', 'token', 'sources', 'done']
+    assert store.saves == 1
+    assert list(store.sessions.values())[0]['chat_history'][-1] == {'role': 'assistant', 'content': 'Hello there'}
+    assert usage == [7]
+
+
+def test_responses_of_the_view_pass_through(flask_app, store):
+    client = FakeAsyncOpenAI()
+    response = send(flask_app, client, {'message': 'too many'})
+
+    assert response['statusCode'] == 429
+    assert json.loads(response['body']) == {'error': 'Rate limit exceeded'}
+    assert client.requests == []
+    assert store.saves == 0
+
+
+def test_failed_completion_is_not_recorded_and_spends_no_tokens(flask_app, store, usage):
+    response = send(flask_app, FakeAsyncOpenAI(fail=True), {'message': 'hi'})
+
+    assert response['statusCode'] == 500
+    assert json.loads(response['body']) == {'error': 'An error occurred while processing your message.'}
+    assert store.saves == 0
+    assert usage == [0]
+
+
+def test_failed_stream_ends_with_an_error_event(flask_app, store, usage):
+    response = send(flask_app, FakeAsyncOpenAI(fail=True), {'message': 'hi', 'stream': True})
+
+    assert response['statusCode'] == 200
+    assert json.loads(response['body'][len('data: '):]) == {
+        'type': 'error', 'content': 'An error occurred while processing your message.'}
+    assert store.saves == 0
+    assert usage == [0]
+
+
+@pytest.mark.parametrize('payload', [{'message': 'hi'}, {'message': 'hi', 'stream': True}, {'message': 'too many'}])
+def test_direct_run_answers_like_mangum(flask_app, store, payload):
+    app = AsyncCompletionApp(flask_app, client=FakeAsyncOpenAI())
+    event = function_url_event('POST', '/api/message', json.dumps(payload).encode(), content_length=False)
+    expected = Mangum(app, lifespan="off")(event, None)
+    mangum_saves = store.saves
+
+    handler = LambdaWsgiHandler(flask_app).infer(event, None)
+    response = handler(app.run(handler.scope, handler.body))
+
+    assert store.saves == 2 * mangum_saves
+    # Each request starts a new session, whose id is random
+    assert len(response.pop('cookies', [])) == len(expected.pop('cookies', []))
+    assert response == expected
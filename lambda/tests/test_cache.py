@@ -0,0 +1,126 @@
+import os
+
+import pytest
+from botocore.exceptions import ClientError
+from ..cache import TTLCache, S3CacheTier, TieredCache, AnswerCache, S3ObjectCache, retrieval_cache_key
+from ..embeddings import HashingEmbedder
+from .fakes import FakeS3, VersionedFakeS3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'size': 2}
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(ttl=-1)
+    cache.set('a', 1)
+    assert cache.get('a') is None
+    assert cache.stats()['size'] == 0
+
+
+def test_tiered_cache_fills_local_tier_from_shared_tier():
+    s3 = FakeS3()
+    TieredCache(TTLCache(), S3CacheTier(s3, 'bucket', 'cache/')).set('key', ['snippet'])
+
+    cold = TieredCache(TTLCache(), S3CacheTier(s3, 'bucket', 'cache/'))
+    assert cold.get('key') == ['snippet']
+    assert cold.get('key') == ['snippet']
+    assert cold.stats() == {'local': {'hits': 1, 'misses': 1, 'size': 1}, 'shared': {'hits': 1, 'misses': 0}}
+
+
+def test_retrieval_cache_key_normalizes_keywords():
+    assert retrieval_cache_key('doc', ['bob', 'salary'], 'keyword') == \
+        retrieval_cache_key('doc', ['salary', 'bob', 'bob'], 'keyword')
+    assert retrieval_cache_key('doc', ['bob'], 'keyword') != retrieval_cache_key('other', ['bob'], 'keyword')
+    assert retrieval_cache_key('doc', ['bob'], 'keyword') != retrieval_cache_key('doc', ['bob'], 'hybrid')
+
+
+def keyword_set(question):
+    return [word for word in question.lower().split() if word not in {'the', 'is', 'who'}]
+
+
+def test_answer_cache_matches_equivalent_questions():
+    cache = AnswerCache(keyword_set, threshold=0.5)
+    cache.set('doc', 'snippets', "who is the engineer", "Alice")
+    assert cache.get('doc', 'snippets', "the engineer") == "Alice"
+    assert cache.get('doc', 'snippets', "manager salary") is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'contexts': 1}
+
+
+def test_answer_cache_requires_same_document_and_snippets():
+    cache = AnswerCache(keyword_set)
+    cache.set('doc', 'snippets', "engineer", "Alice")
+    assert cache.get('doc', 'other snippets', "engineer") is None
+    assert cache.get('other', 'snippets', "engineer") is None
+
+
+def test_answer_cache_expires_entries():
+    cache = AnswerCache(keyword_set, ttl=-1)
+    cache.set('doc', 'snippets', "engineer", "Alice")
+    assert cache.get('doc', 'snippets', "engineer") is None
+    assert cache.stats()['contexts'] == 0
+
+
+def test_answer_cache_compares_embeddings_when_given():
+    embedder = HashingEmbedder()
+    cache = AnswerCache(keyword_set, embed=embedder.embed, threshold=0.6)
+    cache.set('doc', 'snippets', "which engineers work here", "Alice")
+    assert cache.get('doc', 'snippets', "which engineer works here") == "Alice"
+
+
+def test_object_cache_revalidates_with_etag(tmp_path):
+    s3_client = VersionedFakeS3()
+    s3_client.put_object('bucket', 'doc.txt', b"first version")
+    cache = S3ObjectCache(s3_client, 'bucket', str(tmp_path))
+
+    for _ in range(3):
+        with cache.open('doc.txt') as f:
+            assert f.read() == b"first version"
+    assert s3_client.downloads == 1
+
+    s3_client.put_object('bucket', 'doc.txt', b"second version")
+    with cache.open('doc.txt') as f:
+        assert f.read() == b"second version"
+    assert s3_client.downloads == 2
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'refreshes': 1, 'evictions': 0, 'hit_rate': 0.5,
+                             'entries': 1, 'bytes': len(b"second version")}
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_object_cache_evicts_least_recently_used_by_bytes(tmp_path):
+    s3_client = VersionedFakeS3()
+    for key in 'abc':
+        s3_client.put_object('bucket', key, key.encode() * 10)
+    cache = S3ObjectCache(s3_client, 'bucket', str(tmp_path), max_bytes=25)
+
+    for key in 'aba':
+        cache.open(key).close()
+    cache.open('c').close()
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] == 20
+
+    downloads = s3_client.downloads
+    cache.open('a').close()
+    assert s3_client.downloads == downloads
+    cache.open('b').close()
+    assert s3_client.downloads == downloads + 1
+
+
+def test_object_cache_caches_written_objects_and_raises_for_missing_ones(tmp_path):
+    s3_client = VersionedFakeS3()
+    cache = S3ObjectCache(s3_client, 'bucket', str(tmp_path))
+    response = s3_client.put_object('bucket', 'doc.txt', b"written")
+    cache.put('doc.txt', response['ETag'], b"written")
+
+    with cache.open('doc.txt') as f:
+        assert f.read() == b"written"
+    assert s3_client.downloads == 0
+    with pytest.raises(ClientError):
+        cache.open('missing.txt')
@@ -0,0 +1,55 @@
+import pytest
+from ..chunker import chunk_text, chunk_csv, chunk_document, StreamingTextChunker, streaming_chunker
+
+
+def test_chunk_text_windows_overlap():
+    text = " ".join(f"w{i}" for i in range(10))
+    chunks = chunk_text(text, window=4, overlap=2)
+    assert [chunk['text'] for chunk in chunks] == ["w0 w1 w2 w3", "w2 w3 w4 w5", "w4 w5 w6 w7", "w6 w7 w8 w9"]
+
+
+def test_chunk_offsets_are_utf8_byte_ranges():
+    text = "café au lait\nnaïve résumé here"
+    data = text.encode('utf-8')
+    for chunk in chunk_text(text, window=2, overlap=1):
+        assert data[chunk['start']:chunk['end']].decode('utf-8') == chunk['text']
+
+
+def test_chunk_text_rejects_overlap_not_smaller_than_window():
+    with pytest.raises(ValueError):
+        chunk_text("a b c", window=2, overlap=2)
+
+
+def test_chunk_csv_separates_header_and_keeps_quoted_newlines():
+    text = 'id,note\r\n1,"first\nline"\r\n\r\n2,second\r\n'
+    header, chunks = chunk_csv(text)
+    assert header == "id,note"
+    assert [chunk['text'] for chunk in chunks] == ['1,"first\nline"', "2,second"]
+    assert text[chunks[1]['start']:chunks[1]['end']] == "2,second"
+
+
+def test_chunk_document_picks_mode_from_filename():
+    assert chunk_document("a,b\n1,2", "data.CSV")[0] == "a,b"
+    assert chunk_document("a,b\n1,2", "notes.txt")[0] is None
+
+
+def feed_in_pieces(chunker, text, size):
+    chunks = []
+    for start in range(0, len(text), size):
+        chunks.extend(chunker.feed(text[start:start + size]))
+    return chunks + chunker.finish()
+
+
+@pytest.mark.parametrize('size', [1, 3, 16, 10_000])
+@pytest.mark.parametrize('window, overlap', [(1, 0), (4, 2), (5, 1), (64, 16)])
+def test_streaming_text_chunker_matches_chunk_text(size, window, overlap):
+    text = "Ünïcode wörds_and 42 numbers,\r\nspread   over lines; " * 7 + "tail"
+    assert feed_in_pieces(StreamingTextChunker(window, overlap), text, size) == chunk_text(text, window, overlap)
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 10_000])
+def test_streaming_csv_chunker_matches_chunk_csv(size):
+    text = 'name,notes\r\nAlice,"line one\r\nline two"\r\n\r\nBöb,plain\rCarol,"unclosed\nrow'
+    chunker = streaming_chunker("data.csv")
+    chunks = feed_in_pieces(chunker, text, size)
+    assert (chunker.header, chunks) == chunk_csv(text)
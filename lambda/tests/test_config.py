@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+from ..config import Lazy, SecretsProvider, requested_as
+
+ARN_PREFIX = "arn:aws:secretsmanager:us-east-1:123456789012:secret:"
+SECRETS = {'openai-api-key': 'sk-test', 'app-session-secret-key': 'session-test'}
+
+
+class FakeSecretsManager:
+    """Stand-in describing secrets as Secrets Manager does: by name and by full ARN, random suffix included."""
+
+    def __init__(self, batch_allowed=True):
+        self.batch_allowed = batch_allowed
+        self.calls = []
+
+    @staticmethod
+    def describe(name):
+        return {'ARN': f"{ARN_PREFIX}{name}-AbCdEf", 'Name': name, 'SecretString': SECRETS[name]}
+
+    @staticmethod
+    def name_of(secret_id):
+        name = secret_id[len(ARN_PREFIX):] if secret_id.startswith(ARN_PREFIX) else secret_id
+        return name[:-len("-AbCdEf")] if name.endswith("-AbCdEf") else name
+
+    def batch_get_secret_value(self, SecretIdList):
+        self.calls.append(('batch', SecretIdList))
+        if not self.batch_allowed:
+            raise ClientError({'Error': {'Code': 'AccessDeniedException'}}, 'BatchGetSecretValue')
+        return {'SecretValues': [self.describe(self.name_of(secret_id)) for secret_id in SecretIdList], 'Errors': []}
+
+    def get_secret_value(self, SecretId):
+        self.calls.append(('get', SecretId))
+        return self.describe(self.name_of(SecretId))
+
+
+def provider(client):
+    secrets = SecretsProvider()
+    secrets._client = client
+    return secrets
+
+
+@pytest.mark.parametrize('secret_id', [
+    'openai-api-key',
+    f"{ARN_PREFIX}openai-api-key",
+    f"{ARN_PREFIX}openai-api-key-AbCdEf",
+])
+def test_prefetch_caches_secrets_under_the_requested_id(secret_id):
+    client = FakeSecretsManager()
+    secrets = provider(client)
+
+    secrets.prefetch([secret_id, f"{ARN_PREFIX}app-session-secret-key"])
+
+    assert secrets.get(secret_id) == 'sk-test'
+    assert secrets.get(f"{ARN_PREFIX}app-session-secret-key") == 'session-test'
+    assert client.calls == [('batch', [secret_id, f"{ARN_PREFIX}app-session-secret-key"])]
+    assert secrets.fetches == 1
+
+
+def test_partial_arns_do_not_match_secrets_sharing_their_prefix():
+    secret = {'ARN': f"{ARN_PREFIX}openai-api-key-2-AbCdEf", 'Name': 'openai-api-key-2'}
+    assert requested_as(secret, f"{ARN_PREFIX}openai-api-key-2")
+    assert not requested_as(secret, f"{ARN_PREFIX}openai-api-key")
+
+
+def test_secrets_are_fetched_one_by_one_when_the_batch_call_fails():
+    client = FakeSecretsManager(batch_allowed=False)
+    secrets = provider(client)
+
+    secrets.prefetch(['openai-api-key'])
+
+    assert secrets.get('openai-api-key') == 'sk-test'
+    assert secrets.get('openai-api-key') == 'sk-test'
+    assert client.calls == [('batch', ['openai-api-key']), ('get', 'openai-api-key')]
+
+
+def test_prefetch_skips_cached_secrets():
+    client = FakeSecretsManager()
+    secrets = provider(client)
+    secrets.get('openai-api-key')
+
+    secrets.prefetch(['openai-api-key'])
+
+    assert client.calls == [('get', 'openai-api-key')]
+
+
+def test_lazy_builds_once_on_first_use():
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {'name': 'client'}
+
+    client = Lazy(build)
+    assert not client.built and client.build_seconds is None
+
+    threads = [threading.Thread(target=client.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.built and client.build_seconds is not None
+    assert list(client.keys()) == ['name']  # attributes are those of the built object
+    assert builds == [1]
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from ..embeddings import HashingEmbedder, get_embedder, top_k_similar
+from ..indexing import index_document
+from ..retrieval import retrieve_semantic
+
+
+def test_hashing_embedder_is_deterministic_and_normalised():
+    matrix = HashingEmbedder(dim=64).embed(["the quick brown fox", "", "the quick brown fox"])
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (3, 64)
+    assert np.allclose(np.linalg.norm(matrix[0]), 1.0)
+    assert not matrix[1].any()
+    assert np.array_equal(matrix[0], matrix[2])
+
+
+def test_hashing_embedder_matches_inflections():
+    embedder = HashingEmbedder()
+    matrix = embedder.embed(["engineers in the platform team", "quarterly revenue figures"])
+    ranked = top_k_similar(matrix, embedder.embed(["which engineer"])[0], top_k=2)
+    assert ranked[0][0] == 0
+
+
+def test_top_k_similar_orders_by_similarity():
+    matrix = np.eye(4, dtype=np.float32)
+    query = np.array([0.1, 0.9, 0.4, 0.0], dtype=np.float32)
+    assert [chunk_id for chunk_id, _ in top_k_similar(matrix, query, top_k=2)] == [1, 2]
+    assert [chunk_id for chunk_id, _ in top_k_similar(matrix, query, top_k=10)] == [1, 2, 0]
+
+
+def test_retrieve_semantic_returns_chunk_texts():
+    index = index_document("name,job\nAna,software engineering\nBen,accounting", "people.csv")
+    embedder = HashingEmbedder()
+
+    matrix = embedder.embed(index['texts'])
+    snippets = retrieve_semantic(index, matrix, embedder.embed(["engineer"])[0], top_k=1)
+    assert snippets == ["name,job", "Ana,software engineering"]
+
+
+def test_get_embedder_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_embedder("nope")
+    with pytest.raises(RuntimeError):
+        get_embedder("openai")
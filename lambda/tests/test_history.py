@@ -0,0 +1,66 @@
+from ..history import estimate_prompt_tokens, fit_history, SUMMARY_PREFIX
+from ..retrieval import estimate_tokens
+
+SYSTEM = {"role": "system", "content": "You are a helpful assistant."}
+
+
+def user(question, context="x" * 400):
+    return {"role": "user", "content": f"{question}\n{context}", "question": question}
+
+
+def assistant(answer):
+    return {"role": "assistant", "content": answer}
+
+
+def conversation(turns):
+    history = [SYSTEM]
+    for i in range(turns):
+        history += [user(f"q{i}"), assistant(f"a{i}")]
+    return history + [user("now")]
+
+
+def test_fit_history_keeps_recent_turns_and_compacts_old_context():
+    messages, kept, summary = fit_history(conversation(5), token_budget=10_000, recent_turns=2, context_turns=1)
+    assert [m['content'] for m in messages] == [SYSTEM['content'], "q3", "a3", user("q4")['content'], "a4",
+                                                user("now")['content']]
+    assert all(set(m) == {'role', 'content'} for m in messages)
+    assert kept[0] == SYSTEM and kept[1] == user("q3") and kept[-1] == user("now")
+    assert summary is None
+
+
+def test_fit_history_respects_token_budget():
+    history = conversation(10)
+    messages, kept, _ = fit_history(history, token_budget=14, recent_turns=10, context_turns=0)
+    assert [m['content'] for m in messages[1:-1]] == ["q7", "a7", "q8", "a8", "q9", "a9"]
+    assert len(kept) == 8
+
+
+def test_fit_history_folds_dropped_turns_into_summary():
+    calls = []
+
+    def summarizer(summary, messages):
+        calls.append((summary, [m['content'] for m in messages]))
+        return "they asked q0"
+
+    messages, kept, summary = fit_history(conversation(2), summary="earlier", summarizer=summarizer,
+                                          recent_turns=1)
+    assert calls == [("earlier", ["q0", "a0"])]
+    assert summary == "they asked q0"
+    assert messages[1] == {"role": "system", "content": SUMMARY_PREFIX + "they asked q0"}
+
+
+def test_fit_history_does_not_summarize_when_nothing_drops():
+    def summarizer(summary, messages):
+        raise AssertionError("nothing left the window")
+
+    _, _, summary = fit_history(conversation(1), summary="kept", summarizer=summarizer)
+    assert summary == "kept"
+
+
+def test_estimate_prompt_tokens_bounds_the_fitted_prompt():
+    for turns, budget in [(1, 10_000), (10, 100)]:
+        history = conversation(turns)
+        messages, _, _ = fit_history(history, token_budget=budget)
+        estimate = estimate_prompt_tokens(history, token_budget=budget)
+        assert sum(estimate_tokens(m['content']) for m in messages) <= estimate
+        assert estimate <= budget + estimate_tokens(history[-1]['content'])
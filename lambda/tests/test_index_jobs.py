@@ -0,0 +1,73 @@
+import pytest
+from botocore.exceptions import ClientError
+from ..artifact import artifact_key_for, load_local_artifact, read_artifact
+from ..embeddings import HashingEmbedder
+from ..index_jobs import (INDEX_FAILED, INDEX_PENDING, INDEX_READY, LocalIndexer, failure_key_for,
+                          index_s3_document, s3_index_status)
+from ..indexing import index_document
+from ..retrieval import retrieve
+from .fakes import FakeS3
+
+
+class HeadFakeS3(FakeS3):
+    """Stand-in that also answers HEAD requests."""
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        return {'ContentLength': len(self.objects[Key])}
+
+
+DOCUMENT = "name,role\nAlice,engineer\nBob,manager\n"
+
+
+def test_local_indexer_builds_the_artifact_in_the_background(tmp_path):
+    document_path = str(tmp_path / "team.csv")
+    with open(document_path, 'w', encoding='utf-8') as f:
+        f.write(DOCUMENT)
+    indexer = LocalIndexer(HashingEmbedder(dim=16))
+    assert indexer.status(document_path) is None
+
+    job = indexer.submit(document_path)
+    assert indexer.status(document_path) in (INDEX_PENDING, INDEX_READY)
+    job.result(timeout=10)
+
+    assert indexer.status(document_path) == INDEX_READY
+    artifact = load_local_artifact(document_path)
+    assert retrieve(artifact, ['manager']) == retrieve(index_document(DOCUMENT, "team.csv"), ['manager'])
+    assert artifact.embeddings.shape == (2, 16)
+
+
+def test_local_indexer_reports_failures(tmp_path):
+    document_path = str(tmp_path / "binary.txt")
+    with open(document_path, 'wb') as f:
+        f.write(b'\xff\xfe')
+    indexer = LocalIndexer()
+
+    with pytest.raises(UnicodeDecodeError):
+        indexer.submit(document_path).result(timeout=10)
+    assert indexer.status(document_path) == INDEX_FAILED
+
+
+def test_s3_document_is_pending_until_indexed():
+    s3_client = HeadFakeS3()
+    s3_client.objects["documents/team.csv"] = DOCUMENT.encode('utf-8')
+    assert s3_index_status(s3_client, 'bucket', "documents/team.csv") == INDEX_PENDING
+
+    index_s3_document(s3_client, 'bucket', "documents/team.csv", inline_text_max_bytes=0)
+
+    assert s3_index_status(s3_client, 'bucket', "documents/team.csv") == INDEX_READY
+    artifact = read_artifact(s3_client.objects[artifact_key_for("documents/team.csv")])
+    assert not artifact.inline_texts
+    assert artifact['offsets'].tolist() == index_document(DOCUMENT, "team.csv")['offsets']
+
+
+def test_s3_indexing_failure_leaves_a_marker():
+    s3_client = HeadFakeS3()
+    s3_client.objects["documents/binary.txt"] = b'\xff\xfe'
+
+    with pytest.raises(UnicodeDecodeError):
+        index_s3_document(s3_client, 'bucket', "documents/binary.txt")
+
+    assert s3_index_status(s3_client, 'bucket', "documents/binary.txt") == INDEX_FAILED
+    assert failure_key_for("documents/binary.txt") in s3_client.objects
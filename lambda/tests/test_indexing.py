@@ -0,0 +1,27 @@
+import pytest
+from ..indexing import build_index, index_document
+
+
+@pytest.fixture
+def document():
+    return "name,role\nAlice,engineer\n\nBob,manager\nCarol,engineer manager\n"
+
+
+def test_index_document_indexes_csv_rows(document):
+    index = index_document(document, "team.csv")
+    assert index['header'] == "name,role"
+    assert index['texts'] == ["Alice,engineer", "Bob,manager", "Carol,engineer manager"]
+    assert 'role' not in index['postings']
+    assert index['postings']['engineer'] == [0, 2]
+    assert index['postings']['manager'] == [1, 2]
+
+
+def test_build_index_records_bm25_statistics():
+    chunks = [{'text': "spam spam eggs", 'start': 0, 'end': 14}, {'text': "eggs", 'start': 15, 'end': 19}]
+    index = build_index(chunks)
+    assert index['offsets'] == [[0, 14], [15, 19]]
+    assert index['lengths'] == [3, 1]
+    assert index['avg_length'] == 2.0
+    assert index['postings']['spam'] == [0]
+    assert index['frequencies']['spam'] == [2]
+    assert index['frequencies']['eggs'] == [1, 1]
@@ -0,0 +1,52 @@
+import io
+
+import pytest
+from ..artifact import build_artifact, read_artifact
+from ..indexing import index_document
+from ..ranged_reads import coalesce_ranges, fetch_spans, chunk_text_fetcher
+from ..retrieval import retrieve
+
+
+class RangedFakeS3:
+    """Stand-in serving byte ranges of one object and recording the ranges requested."""
+
+    def __init__(self, body):
+        self.body = body
+        self.ranges = []
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(position) for position in Range[len('bytes='):].split('-'))
+        self.ranges.append((start, end + 1))
+        return {'Body': io.BytesIO(self.body[start:end + 1])}
+
+
+def test_coalesce_ranges_merges_overlapping_adjacent_and_close_spans():
+    spans = [(50, 60), (0, 10), (5, 20), (21, 30), (100, 120)]
+    assert coalesce_ranges(spans, gap=1) == [(0, 30), (50, 60), (100, 120)]
+    assert coalesce_ranges(spans, gap=30) == [(0, 60), (100, 120)]
+    assert coalesce_ranges([], gap=0) == []
+
+
+def test_fetch_spans_requests_each_coalesced_range_once():
+    body = bytes(range(200))
+    s3_client = RangedFakeS3(body)
+    spans = [(150, 160), (0, 10), (10, 20), (100, 110)]
+
+    assert fetch_spans(s3_client, 'bucket', 'doc', spans, gap=0) == [body[start:end] for start, end in spans]
+    assert sorted(s3_client.ranges) == [(0, 20), (100, 110), (150, 160)]
+
+
+@pytest.mark.parametrize('filename, document', [
+    ("team.csv", "name,role\nAlice,engineer\nBob,manager\nZoë,engineer manager\n"),
+    ("notes.txt", " ".join(f"wörd{position % 7} filler{position}" for position in range(300))),
+])
+def test_retrieval_with_ranged_texts_matches_inline_texts(filename, document):
+    index = index_document(document, filename)
+    artifact = read_artifact(build_artifact(index, inline_texts=False))
+    s3_client = RangedFakeS3(document.encode('utf-8'))
+    keywords = ['engineer', 'wörd3']
+
+    fetch_texts = chunk_text_fetcher(s3_client, 'bucket', filename, artifact)
+    assert retrieve(artifact, keywords, fetch_texts=fetch_texts) == retrieve(index, keywords)
+    assert s3_client.ranges
+    assert sum(end - start for start, end in s3_client.ranges) < len(document.encode('utf-8'))
@@ -0,0 +1,237 @@
+import sqlite3
+import threading
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_limiter import Limiter
+from limits import parse_many
+from limits.storage import MemoryStorage, storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+from .. import rate_limits
+from ..rate_limits import (CounterTableStorage, DynamoDBCounterTable, HeapMemoryStorage, SQLiteCounterTable,
+                           SQLiteStorage, TokenLimits, require_fixed_windows)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(rate_limits.time, 'time', lambda: now[0])
+    return now
+
+
+def check(limiter, items, *identifiers):
+    """Check limits the way Flask-Limiter does: in order, stopping at the first breach."""
+    for item in items:
+        if not limiter.hit(item, *identifiers):
+            return False
+    return True
+
+
+def test_counts_match_memory_storage_with_one_round_trip_per_request(tmp_path, clock):
+    items = sorted(parse_many("3 per minute;5 per hour"))
+    storage = storage_from_string(f"sqlite:///{tmp_path / 'limits.sqlite3'}")
+    assert isinstance(storage, SQLiteStorage)
+    memory = FixedWindowRateLimiter(MemoryStorage())
+    shared = FixedWindowRateLimiter(storage)
+
+    results = []
+    for _ in range(6):
+        results.append(check(shared, items, '1.2.3.4', 'home'))
+        assert results[-1] == check(memory, items, '1.2.3.4', 'home')
+        clock[0] += 1
+    assert results == [True, True, True, False, False, False]
+    for item in items:
+        assert shared.get_window_stats(item, '1.2.3.4', 'home').remaining == \
+            memory.get_window_stats(item, '1.2.3.4', 'home').remaining
+    # The first request learns the second limit; every later one takes at most a single update
+    assert storage.round_trips <= len(results) + 1
+
+
+def test_containers_share_counters_and_windows_restart(tmp_path, clock):
+    item = parse_many("2 per minute")[0]
+    uri = f"sqlite:///{tmp_path / 'limits.sqlite3'}"
+    first, second = (FixedWindowRateLimiter(storage_from_string(uri)) for _ in range(2))
+
+    assert first.hit(item, 'client')
+    assert second.hit(item, 'client')
+    assert not first.hit(item, 'client')
+    assert second.hit(item, 'other')
+
+    clock[0] += 60
+    assert second.hit(item, 'client')
+    assert first.get_window_stats(item, 'client').remaining == 1
+
+
+def test_counts_of_ended_windows_are_removed(tmp_path, clock):
+    item = parse_many("2 per minute")[0]
+    storage = storage_from_string(f"sqlite:///{tmp_path / 'limits.sqlite3'}")
+    limiter = FixedWindowRateLimiter(storage)
+
+    assert limiter.hit(item, 'client')
+    # A window without requests, so the next update does not remove the previous window's count
+    clock[0] += 180
+    assert limiter.hit(item, 'client')
+    assert limiter.hit(item, 'client')
+
+    counts = [name for name in storage.table.get('LIMITER/client') if name.startswith('c:')]
+    assert counts == [f"c:2/1/minute@{(int(clock[0]) // 60 + 1) * 60}"]
+
+
+def test_strategies_other_than_fixed_windows_are_refused(tmp_path):
+    class ElasticExpiryRateLimiter(FixedWindowRateLimiter):
+        """Stands in for limits' fixed window strategy with elastic expiry."""
+
+    limiter = Limiter(lambda: 'client', app=Flask(__name__), storage_uri=f"sqlite:///{tmp_path / 'limits.sqlite3'}")
+    require_fixed_windows(limiter)
+
+    elastic = SimpleNamespace(storage=limiter.storage, limiter=ElasticExpiryRateLimiter(limiter.storage))
+    with pytest.raises(NotImplementedError, match="ElasticExpiryRateLimiter"):
+        require_fixed_windows(elastic)
+
+
+def test_flask_limiter_limits_across_instances(tmp_path):
+    uri = f"sqlite:///{tmp_path / 'limits.sqlite3'}"
+
+    def container():
+        app = Flask(__name__)
+        limiter = Limiter(lambda: 'client', app=app, storage_uri=uri)
+
+        @app.route('/ping')
+        @limiter.limit("3 per day")
+        def ping():
+            return 'pong'
+
+        return app.test_client()
+
+    containers = [container(), container()]
+    assert [containers[position % 2].get('/ping').status_code for position in range(4)] == [200, 200, 200, 429]
+
+
+def test_dynamodb_table_updates_every_window_in_one_call():
+    class RecordingDynamoDB:
+        def __init__(self):
+            self.requests = []
+
+        def update_item(self, **request):
+            self.requests.append(request)
+            return {'Attributes': {'identity': {'S': 'LIMITER/client/home'}, 'c:3/1/minute@60': {'N': '2'},
+                                   'w:3/1/minute': {'N': '60'}}}
+
+    client = RecordingDynamoDB()
+    table = DynamoDBCounterTable(client, 'rate-limits')
+
+    attributes = table.update('LIMITER/client/home', {'c:3/1/minute@60': 1, 'c:5/1/hour@3600': 1},
+                              {'w:3/1/minute': 60}, ['c:3/1/minute@0'], 3600)
+
+    assert attributes == {'c:3/1/minute@60': 2, 'w:3/1/minute': 60}
+    request, = client.requests
+    assert request['UpdateExpression'] == ("ADD #a0 :i0, #a1 :i1 SET expires_at = :expires_at, #a2 = :v0 "
+                                           "REMOVE #a3")
+    assert request['ExpressionAttributeNames'] == {'#a0': 'c:3/1/minute@60', '#a1': 'c:5/1/hour@3600',
+                                                   '#a2': 'w:3/1/minute', '#a3': 'c:3/1/minute@0'}
+    assert request['ExpressionAttributeValues'][':i0'] == {'N': '1'}
+    assert request['ReturnValues'] == 'ALL_NEW'
+
+
+@pytest.mark.parametrize('strategy', [FixedWindowRateLimiter, MovingWindowRateLimiter])
+def test_heap_memory_storage_matches_memory_storage(clock, strategy):
+    items = sorted(parse_many("3 per minute;5 per hour"))
+    heap = strategy(storage_from_string("heap-memory://"))
+    memory = strategy(MemoryStorage())
+
+    for step in [0, 10, 10, 10, 5, 30, 20, 600, 3000, 1]:
+        clock[0] += step
+        for identity in ('a', 'b', 'a'):
+            assert check(heap, items, identity) == check(memory, items, identity)
+        for item in items:
+            assert heap.get_window_stats(item, 'a') == memory.get_window_stats(item, 'a')
+
+
+def test_heap_memory_storage_expires_keys_on_access_without_threads(monkeypatch, clock):
+    def no_timers(*args, **kwargs):
+        raise AssertionError("started a timer")
+
+    monkeypatch.setattr(threading, 'Timer', no_timers)
+    storage = HeapMemoryStorage()
+    for identity in range(100):
+        storage.incr(f"counter/{identity}", 60)
+        storage.acquire_entry(f"window/{identity}", 5, 60)
+    clock[0] += 30
+    storage.acquire_entry("window/0", 5, 60)
+
+    clock[0] += 40
+    assert storage.get("counter/0") == 0
+    assert not storage.counters and list(storage.events) == ["window/0"]
+    assert storage.get_moving_window("window/0", 5, 60)[1] == 1
+    clock[0] += 30
+    storage.get("anything")
+    assert not storage.events and not storage._expiries
+
+
+def test_counter_table_storage_counts_in_memory_while_the_table_is_unreachable(tmp_path, clock):
+    class FlakyTable(SQLiteCounterTable):
+        down = False
+
+        def update(self, *args):
+            if self.down:
+                raise sqlite3.OperationalError("database is locked")
+            return super().update(*args)
+
+    table = FlakyTable(str(tmp_path / 'limits.sqlite3'))
+    storage = CounterTableStorage(table=table, in_memory_fallback=True)
+    limiter = FixedWindowRateLimiter(storage)
+    item = parse_many("2 per minute")[0]
+
+    assert limiter.hit(item, 'client')
+    table.down = True
+    assert limiter.hit(item, 'client') and limiter.hit(item, 'client')
+    assert not limiter.hit(item, 'client')
+    assert isinstance(storage.fallback, HeapMemoryStorage) and storage.round_trips == 1
+
+    # The table is tried again once the wait is over, and counts from then on
+    table.down = False
+    clock[0] += 1
+    assert limiter.hit(item, 'client')
+    assert storage.round_trips == 2 and storage.fallback.get(item.key_for('client')) == 3
+
+
+def test_flask_limiter_passes_the_fallback_option_to_counter_table_storages(tmp_path):
+    limiter = Limiter(lambda: 'client', app=Flask(__name__), storage_uri=f"sqlite:///{tmp_path / 'limits.sqlite3'}",
+                      storage_options={'in_memory_fallback': True})
+    assert isinstance(limiter.storage.fallback, HeapMemoryStorage)
+
+
+@pytest.mark.parametrize('uri', ["heap-memory://", "sqlite:///{tmp_path}/limits.sqlite3"])
+def test_token_limits_charge_estimates_and_correct_them_from_usage(tmp_path, clock, uri):
+    rate_limiter = FixedWindowRateLimiter(storage_from_string(uri.format(tmp_path=tmp_path)))
+    limits = TokenLimits(lambda: rate_limiter, "1000 per minute;1500 per hour")
+
+    def remaining(identity):
+        return [rate_limiter.get_window_stats(item, identity, limits.scope).remaining for item in limits.items]
+
+    assert limits.charge('heavy', 600)
+    limits.correct('heavy', 600, 900)
+    assert remaining('heavy') == [100, 600]
+    # Refused without counting the estimate, while a light client is unaffected
+    assert not limits.charge('heavy', 200)
+    assert remaining('heavy') == [100, 600]
+    assert 1 <= limits.retry_after('heavy', 200) <= 60
+    assert limits.charge('light', 200)
+
+    clock[0] += 60
+    assert limits.charge('heavy', 500)
+    limits.correct('heavy', 500, 300)
+    assert remaining('heavy') == [700, 300]
+    assert not limits.charge('heavy', 400)
+    assert limits.charge('heavy', 300)
+
+
+def test_token_limits_let_messages_through_when_the_storage_fails():
+    class FailingLimiter:
+        def hit(self, item, *identifiers, cost=1):
+            raise ConnectionError("storage unreachable")
+
+    limits = TokenLimits(FailingLimiter, "1000 per minute")
+    assert limits.charge('client', 5000)
+    limits.correct('client', 5000, 10)
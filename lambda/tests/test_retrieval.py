@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from ..embeddings import HashingEmbedder
+from ..indexing import index_document, tokenize
+from ..retrieval import rank_chunks, retrieve, retrieve_hybrid, fuse_scores, apply_token_budget, estimate_tokens
+
+
+def test_rank_chunks_prefers_rare_terms_and_multiple_matches():
+    index = index_document("id,text\n1,the cat sat\n2,the dog sat\n3,the cat and the dog\n4,the end", "pets.csv")
+    ranked = rank_chunks(index, tokenize("cat dog"), top_k=10)
+    assert ranked[0][0] == 2
+    assert {chunk_id for chunk_id, _ in ranked} == {0, 1, 2}
+
+
+def test_retrieve_honours_top_k():
+    rows = "\n".join(f"{i},common" for i in range(1000))
+    index = index_document(f"id,word\n{rows}", "rows.csv")
+    snippets = retrieve(index, ["common"], top_k=5, token_budget=10_000)
+    assert snippets[0] == "id,word" and len(snippets) == 6
+
+
+def test_column_names_do_not_match_every_row():
+    index = index_document("name,salary\nAlice,5000\nBob,6000\nCarol,7000\n", "salaries.csv")
+    assert retrieve(index, tokenize("what is Bob's salary")) == ["name,salary", "Bob,6000"]
+
+
+def test_retrieve_without_matches_is_empty():
+    assert retrieve(index_document("alpha\nbeta", "notes.txt"), ["gamma"]) == []
+
+
+def test_apply_token_budget_bounds_prompt_size():
+    snippets = ["x" * 40] * 10
+    kept = apply_token_budget(snippets, token_budget=35)
+    assert len(kept) == 3
+    assert sum(estimate_tokens(snippet) for snippet in kept) <= 35
+
+
+def test_apply_token_budget_truncates_oversized_first_snippet():
+    assert apply_token_budget(["y" * 1000], token_budget=10) == ["y" * 40]
+
+
+def test_fuse_scores_rrf_rewards_agreement():
+    keyword_scores = np.array([3.0, 0.0, 1.0, 0.0], dtype=np.float32)
+    vector_scores = np.array([0.2, 0.9, 0.8, 0.0], dtype=np.float32)
+    fused = fuse_scores(keyword_scores, vector_scores, fusion='rrf')
+    assert fused[3] == 0
+    assert fused[0] > fused[1]
+    assert fused[2] > fused[1]
+
+
+def test_fuse_scores_weighted_mixes_normalised_scores():
+    keyword_scores = np.array([4.0, 2.0, 0.0], dtype=np.float32)
+    vector_scores = np.array([0.0, 0.5, 1.0], dtype=np.float32)
+    fused = fuse_scores(keyword_scores, vector_scores, fusion='weighted', alpha=0.25)
+    assert np.allclose(fused, [0.75, 0.5, 0.25])
+
+
+def test_fuse_scores_rejects_unknown_fusion():
+    with pytest.raises(ValueError):
+        fuse_scores(np.zeros(1), np.zeros(1), fusion='nope')
+
+
+def test_retrieve_hybrid_finds_keyword_and_paraphrase_matches():
+    index = index_document("id,text\n1,invoice overdue\n2,payments were late\n3,holiday plans", "notes.csv")
+    embedder = HashingEmbedder()
+    matrix = embedder.embed(index['texts'])
+    snippets = retrieve_hybrid(index, matrix, tokenize("overdue payment"),
+                               embedder.embed(["overdue payment"])[0], top_k=2)
+    assert snippets[0] == "id,text"
+    assert set(snippets[1:]) == {"1,invoice overdue", "2,payments were late"}
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from flask import Flask, session, jsonify
+from ..session_store import ServerSideSessionInterface, SQLiteSessionStore, S3SessionStore
+from .fakes import FakeS3
+
+
+@pytest.fixture(params=['sqlite', 's3'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"))
+    return S3SessionStore(FakeS3(), 'bucket')
+
+
+@pytest.fixture
+def client(store):
+    app = Flask(__name__)
+    app.secret_key = 'test-secret'
+    app.session_interface = ServerSideSessionInterface(store)
+
+    @app.route('/append/<item>', methods=['POST'])
+    def append(item):
+        session.setdefault('items', []).append(item)
+        session.modified = True
+        return jsonify(session['items'])
+
+    @app.route('/ping')
+    def ping():
+        return 'pong'
+
+    @app.route('/clear', methods=['POST'])
+    def clear():
+        session.clear()
+        return jsonify([])
+
+    with app.test_client() as client:
+        yield client
+
+
+def test_session_data_stays_server_side(client, store):
+    first = client.post('/append/a')
+    cookie = first.headers['Set-Cookie']
+    assert len(cookie.split(';')[0]) < 100
+
+    second = client.post('/append/' + 'b' * 5000)
+    assert 'Set-Cookie' not in second.headers
+    assert second.get_json() == ['a', 'b' * 5000]
+
+
+def test_sessions_are_loaded_only_when_used(client, store, monkeypatch):
+    client.post('/append/a')
+    loads = []
+    load = store.load
+    monkeypatch.setattr(store, 'load', lambda sid: loads.append(sid) or load(sid))
+
+    assert client.get('/ping').data == b'pong'
+    assert client.get('/static/missing.js').status_code == 404
+    assert loads == []
+    assert client.post('/append/b').get_json() == ['a', 'b']
+    assert len(loads) == 1
+
+
+def test_unknown_session_ids_start_a_new_session(client, store):
+    client.post('/append/a')
+    store.delete(client.get_cookie('session').value.split('.')[0])
+    response = client.post('/append/b')
+    assert response.get_json() == ['b']
+    assert 'Set-Cookie' in response.headers
+
+
+def test_clear_deletes_the_stored_session(client, store):
+    client.post('/append/a')
+    client.post('/clear')
+    assert client.post('/append/b').get_json() == ['b']
+
+
+def test_forged_cookie_starts_a_new_session(client):
+    client.post('/append/a')
+    client.set_cookie('session', 'forged.signature')
+    assert client.post('/append/b').get_json() == ['b']
+
+
+def test_expired_sessions_are_not_loaded(store):
+    store.save('sid', {'items': ['a']}, timedelta(seconds=-1))
+    assert store.load('sid') is None
+    store.save('sid', {'items': ['a']}, timedelta(hours=1))
+    assert store.load('sid') == {'items': ['a']}
@@ -0,0 +1,131 @@
+import hashlib
+import io
+import os
+
+import pytest
+from ..indexing import index_document
+from ..upload import (LocalFileSink, S3MultipartSink, UploadTooLarge, stream_upload, document_name_for,
+                      reuse_s3_document)
+from .fakes import FakeS3
+
+
+class MultipartFakeS3(FakeS3):
+    """Stand-in that also implements the multipart upload calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.uploads = {}
+        self.aborted = []
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId][PartNumber] = Body
+        return {'ETag': f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b''.join(parts[part['PartNumber']] for part in MultipartUpload['Parts'])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(Key)
+
+    def copy_object(self, Bucket, Key, CopySource, **kwargs):
+        self.objects[Key] = self.get_object(CopySource['Bucket'], CopySource['Key'])['Body'].read()
+
+    def upload_part_copy(self, Bucket, Key, UploadId, PartNumber, CopySource):
+        self.uploads[UploadId][PartNumber] = self.get_object(CopySource['Bucket'], CopySource['Key'])['Body'].read()
+        return {'CopyPartResult': {'ETag': f'"{PartNumber}"'}}
+
+
+DOCUMENT = "name,city\nAlice,Zürich\nBob,Malmö\n" * 50
+
+
+def test_stream_upload_stores_hashes_and_indexes_in_one_pass(tmp_path):
+    data = DOCUMENT.encode('utf-8')
+    path = str(tmp_path / "people.csv")
+
+    with LocalFileSink(str(tmp_path)) as sink:
+        index, document_hash, size = stream_upload(io.BytesIO(data), "people.csv", sink, 10_000, read_size=7)
+        sink.close(path)
+
+    assert index == index_document(DOCUMENT, "people.csv")
+    assert size == len(data)
+    assert document_hash == hashlib.sha256(data).hexdigest()
+    with open(path, 'rb') as f:
+        assert f.read() == data
+    assert os.listdir(tmp_path) == ["people.csv"]
+
+
+def test_stream_upload_without_index_still_rejects_undecodable_documents(tmp_path):
+    data = DOCUMENT.encode('utf-8')
+
+    with LocalFileSink(str(tmp_path)) as sink:
+        index, document_hash, size = stream_upload(io.BytesIO(data), "people.csv", sink, 10_000, read_size=7,
+                                                   index=False)
+        sink.close(str(tmp_path / "people.csv"))
+    assert index is None
+    assert (document_hash, size) == (hashlib.sha256(data).hexdigest(), len(data))
+
+    with pytest.raises(UnicodeDecodeError):
+        stream_upload(io.BytesIO(b'ok\xff'), "bad.txt", LocalFileSink(str(tmp_path)), 10_000, index=False)
+    assert sorted(os.listdir(tmp_path)) == ["people.csv"]
+
+
+def test_sinks_left_open_are_aborted(tmp_path):
+    # An identical document is stored already: the upload is discarded instead of stored
+    with LocalFileSink(str(tmp_path)) as sink:
+        stream_upload(io.BytesIO(DOCUMENT.encode('utf-8')), "people.csv", sink, 10_000)
+    assert os.listdir(tmp_path) == []
+
+    s3_client = MultipartFakeS3()
+    with S3MultipartSink(s3_client, 'bucket', part_size=64) as sink:
+        stream_upload(io.BytesIO(DOCUMENT.encode('utf-8')), "people.csv", sink, 10_000)
+    assert len(s3_client.aborted) == 1
+    assert not s3_client.objects and not s3_client.uploads
+
+
+@pytest.mark.parametrize('part_size', [64, 1_000_000])
+def test_stream_upload_to_s3_in_parts(part_size):
+    data = DOCUMENT.encode('utf-8')
+    s3_client = MultipartFakeS3()
+
+    with S3MultipartSink(s3_client, 'bucket', part_size=part_size) as sink:
+        stream_upload(io.BytesIO(data), "people.csv", sink, 10_000, read_size=100)
+        sink.close("documents/people.csv")
+
+    # Parts written before the key was known are moved to it, and nothing else is left behind
+    assert s3_client.objects == {"documents/people.csv": data}
+    assert not s3_client.uploads and not s3_client.aborted
+
+
+def test_stream_upload_aborts_when_too_large(tmp_path):
+    s3_client = MultipartFakeS3()
+    with pytest.raises(UploadTooLarge):
+        stream_upload(io.BytesIO(DOCUMENT.encode('utf-8')), "people.csv",
+                      S3MultipartSink(s3_client, 'bucket', part_size=64), 500, read_size=100)
+    assert s3_client.aborted[0].startswith("uploads/")
+    assert not s3_client.objects
+
+    with pytest.raises(UnicodeDecodeError):
+        stream_upload(io.BytesIO(b"caf\xe9"), "notes.txt", LocalFileSink(str(tmp_path)), 500)
+    assert os.listdir(tmp_path) == []
+
+
+def test_document_names_are_content_addressed_and_keep_the_chunking_mode():
+    assert document_name_for("abc", "data.CSV") == "abc.csv"
+    assert document_name_for("abc", "notes.md") == "abc.txt"
+
+
+def test_reuse_s3_document_only_when_its_artifact_exists():
+    s3_client = MultipartFakeS3()
+    s3_client.objects["documents/abc.csv"] = b"a,b"
+    assert not reuse_s3_document(s3_client, 'bucket', "documents/abc.csv", 'text/csv')
+
+    s3_client.objects["documents/abc.csv.artifact"] = b"artifact"
+    assert reuse_s3_document(s3_client, 'bucket', "documents/abc.csv", 'text/csv')
+    assert s3_client.objects["documents/abc.csv"] == b"a,b"
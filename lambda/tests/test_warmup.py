@@ -0,0 +1,74 @@
+import datetime
+
+from ..artifact import artifact_key_for, save_s3_artifact
+from ..cache import S3ObjectCache
+from ..indexing import index_document
+from ..warmup import is_warmup_event, recent_document_keys, run_steps, warm_documents
+from .fakes import VersionedFakeS3
+
+
+class ListingFakeS3(VersionedFakeS3):
+    """Stand-in that also lists objects, two per page, with the order they were written in as LastModified."""
+
+    def __init__(self):
+        super().__init__()
+        self.written = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.written[Key] = datetime.datetime(2026, 1, 1) + datetime.timedelta(seconds=len(self.written))
+        return super().put_object(Bucket, Key, Body, **kwargs)
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        response = {'Contents': [{'Key': key, 'LastModified': self.written[key]} for key in keys[start:start + 2]],
+                    'IsTruncated': start + 2 < len(keys)}
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = str(start + 2)
+        return response
+
+
+def store_documents(s3, names):
+    for name in names:
+        document_key = f"documents/{name}.txt"
+        s3.put_object(Bucket='bucket', Key=document_key, Body=b"The manager is Alice.")
+        save_s3_artifact(s3, 'bucket', document_key, index_document("The manager is Alice.", document_key))
+
+
+def test_warmup_events():
+    assert is_warmup_event({'warmup': True})
+    assert is_warmup_event({'source': 'aws.events', 'detail-type': 'Scheduled Event', 'detail': {}})
+    assert not is_warmup_event({'version': '2.0', 'rawPath': '/', 'requestContext': {}})
+    assert not is_warmup_event([])
+
+
+def test_recent_documents_are_those_whose_artifacts_were_written_last():
+    s3 = ListingFakeS3()
+    store_documents(s3, ['a', 'b', 'c'])
+    s3.put_object(Bucket='bucket', Key='sessions/x.json', Body=b"{}")
+    # Reusing a document copies its artifact onto itself
+    s3.put_object(Bucket='bucket', Key=artifact_key_for('documents/a.txt'),
+                  Body=s3.objects[artifact_key_for('documents/a.txt')])
+
+    assert recent_document_keys(s3, 'bucket', 2) == ['documents/a.txt', 'documents/c.txt']
+
+
+def test_warm_documents_fill_the_document_cache(tmp_path):
+    s3 = ListingFakeS3()
+    store_documents(s3, ['a', 'b', 'c'])
+    cache = S3ObjectCache(s3, 'bucket', str(tmp_path))
+
+    assert warm_documents(s3, 'bucket', cache, limit=2) == 2
+    downloads = s3.downloads
+    assert warm_documents(s3, 'bucket', cache, limit=2) == 2
+    # Served from the local copies once S3 confirms they are current
+    assert s3.downloads == downloads
+
+
+def test_warm_up_steps_log_their_errors(capsys):
+    def unreachable():
+        raise ConnectionError("no route to host")
+
+    durations = run_steps([('openai', unreachable), ('s3', lambda: None)])
+    assert list(durations) == ['openai', 's3']
+    assert "Error warming up openai: no route to host" in capsys.readouterr().out
@@ -0,0 +1,108 @@
+import base64
+import io
+import json
+
+import pytest
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask, jsonify, request, session
+from mangum import Mangum
+
+from ..wsgi_lambda import LambdaWsgiHandler, build_environ
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.secret_key = 'test'
+
+    @app.route('/api/echo', methods=['GET', 'POST'])
+    def echo():
+        session['seen'] = True
+        return jsonify({'method': request.method, 'args': request.args.to_dict(flat=False),
+                        'json': request.get_json(silent=True), 'remote_addr': request.remote_addr,
+                        'agent': request.headers.get('User-Agent'), 'cookie': request.cookies.get('theme')})
+
+    @app.route('/image')
+    def image():
+        return b'\x89PNG\x00\xff', 200, {'Content-Type': 'image/png'}
+
+    @app.route('/error')
+    def error():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def function_url_event(method, path, body=None, query='', cookies=None, content_length=True):
+    event = {
+        'version': '2.0', 'rawPath': path, 'rawQueryString': query,
+        'headers': {'host': 'abc.lambda-url.us-east-1.on.aws', 'user-agent': 'pytest', 'x-forwarded-proto': 'https',
+                    'x-forwarded-port': '443', 'content-type': 'application/json'},
+        'requestContext': {'http': {'method': method, 'path': path, 'sourceIp': '203.0.113.7'}},
+        'isBase64Encoded': body is not None,
+    }
+    if body is not None:
+        event['body'] = base64.b64encode(body).decode()
+        if content_length:
+            event['headers']['content-length'] = str(len(body))
+    if cookies:
+        event['cookies'] = cookies
+    return event
+
+
+def api_gateway_event(method, path, query=None):
+    return {
+        'resource': '/{proxy+}', 'path': path, 'httpMethod': method,
+        'headers': {'Host': 'example.execute-api.us-east-1.amazonaws.com', 'User-Agent': 'pytest'},
+        'multiValueHeaders': {'User-Agent': ['pytest']},
+        'queryStringParameters': query, 'multiValueQueryStringParameters': None,
+        'requestContext': {'identity': {'sourceIp': '198.51.100.4'}},
+        'body': None, 'isBase64Encoded': False,
+    }
+
+
+def alb_event(method, path):
+    return {
+        'requestContext': {'elb': {'targetGroupArn': 'arn:aws:elasticloadbalancing:us-east-1:1:targetgroup/t/1'}},
+        'httpMethod': method, 'path': path, 'queryStringParameters': {'q': 'a'},
+        'headers': {'host': 'alb.example.com', 'user-agent': 'pytest', 'x-forwarded-for': '192.0.2.1'},
+        'body': '', 'isBase64Encoded': False,
+    }
+
+
+@pytest.mark.parametrize('event', [
+    function_url_event('POST', '/api/echo', b'{"message": "hi"}', query='a=1&a=2', cookies=['theme=dark']),
+    function_url_event('GET', '/image'),
+    function_url_event('GET', '/missing'),
+    api_gateway_event('GET', '/api/echo', {'q': 'x'}),
+    alb_event('GET', '/api/echo'),
+])
+def test_responses_match_mangum(app, event):
+    expected = Mangum(WsgiToAsgi(app), lifespan="off")(event, None)
+    assert LambdaWsgiHandler(app)(event, None) == expected
+
+
+def test_request_reaches_the_app_as_sent(app):
+    # Without a Content-Length header, WsgiToAsgi would hand Flask an empty body
+    event = function_url_event('POST', '/api/echo', b'{"message": "hi"}', query='a=1&a=2', cookies=['theme=dark'],
+                               content_length=False)
+    response = LambdaWsgiHandler(app)(event, None)
+
+    assert response['statusCode'] == 200
+    assert response['cookies'][0].startswith('session=')
+    assert json.loads(response['body']) == {'method': 'POST', 'args': {'a': ['1', '2']}, 'json': {'message': 'hi'},
+                                            'remote_addr': '203.0.113.7', 'agent': 'pytest', 'cookie': 'dark'}
+
+
+def test_errors_become_internal_server_errors(app):
+    app.config['PROPAGATE_EXCEPTIONS'] = True
+    response = LambdaWsgiHandler(app)(function_url_event('GET', '/error'), None)
+    assert response['statusCode'] == 500
+    assert response['body'] == 'Internal Server Error'
+
+
+def test_environ_logs_errors_as_text():
+    handler = LambdaWsgiHandler(Flask(__name__)).infer(function_url_event('GET', '/'), None)
+    environ = build_environ(handler.scope, handler.body)
+    # Flask's default log handler writes text to the WSGI error stream
+    assert isinstance(environ['wsgi.errors'], io.TextIOBase)
@@ -0,0 +1,191 @@
+import codecs
+import hashlib
+import os
+import tempfile
+import uuid
+
+from botocore.exceptions import ClientError
+
+from chunker import is_csv, streaming_chunker
+from indexing import IndexBuilder
+from artifact import artifact_key_for
+
+# Bytes read from the request per step; with the part buffer of S3 uploads, this bounds upload memory
+READ_SIZE = 64 * 1024
+# S3 rejects multipart parts smaller than 5 MiB, except the last one
+S3_PART_SIZE = 8 * 1024 * 1024
+# Multipart uploads start before their content hash, and so their key, is known; they are written here first
+S3_PARTIAL_PREFIX = "uploads/"
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def document_name_for(document_hash, filename):
+    """Content-addressed name of a document; the extension keeps the chunking mode the filename selected."""
+    return document_hash + ('.csv' if is_csv(filename) else '.txt')
+
+
+def reuse_s3_document(s3_client, bucket, document_key, content_type):
+    """Check whether a content-addressed document and its artifact are stored already, and keep them if so.
+
+    Both objects are copied onto themselves, which restarts their expiration under the bucket's lifecycle
+    rule, so a document shared with an earlier upload lives as long as the latest reference to it.
+    """
+    artifact_key = artifact_key_for(document_key)
+    try:
+        s3_client.copy_object(Bucket=bucket, Key=artifact_key, CopySource={'Bucket': bucket, 'Key': artifact_key},
+                              MetadataDirective='REPLACE', ContentType='application/octet-stream')
+        s3_client.copy_object(Bucket=bucket, Key=document_key, CopySource={'Bucket': bucket, 'Key': document_key},
+                              MetadataDirective='REPLACE', ContentType=content_type)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return False
+        raise
+    return True
+
+
+class _Sink:
+    """Context manager aborting the sink on exit unless it was closed."""
+
+    _finished = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.abort()
+
+    def abort(self):
+        if not self._finished:
+            self._finished = True
+            self._abort()
+
+
+class LocalFileSink(_Sink):
+    """Writes the upload to a temporary file in `directory`, moved to its final path once the upload is hashed."""
+
+    def __init__(self, directory):
+        fd, self._temporary_path = tempfile.mkstemp(dir=directory, suffix='.partial')
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, data):
+        self._file.write(data)
+
+    def close(self, path):
+        self._file.close()
+        os.replace(self._temporary_path, path)
+        self._finished = True
+
+    def _abort(self):
+        self._file.close()
+        os.unlink(self._temporary_path)
+
+
+class S3MultipartSink(_Sink):
+    """Writes the upload to S3 in parts as it arrives; uploads smaller than one part take a single PUT.
+
+    The key is only given to `close`, once the upload is hashed. Until then a small upload stays in the part
+    buffer, and a larger one is written under a temporary key, from which `close` copies it in one
+    multipart upload, so storing it reports the same object created event as an upload in parts.
+    """
+
+    def __init__(self, s3_client, bucket, part_size=S3_PART_SIZE, content_type=None):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.part_size = part_size
+        self.content_type = content_type
+        self._buffer = bytearray()
+        self._partial_key = f"{S3_PARTIAL_PREFIX}{uuid.uuid4().hex}"
+        self._upload_id = None
+        self._parts = []
+
+    def _create_upload(self, key):
+        extra = {'ContentType': self.content_type} if self.content_type else {}
+        return self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=key, **extra)['UploadId']
+
+    def _upload_part(self):
+        if self._upload_id is None:
+            self._upload_id = self._create_upload(self._partial_key)
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(Bucket=self.bucket, Key=self._partial_key, UploadId=self._upload_id,
+                                              PartNumber=part_number, Body=bytes(self._buffer))
+        self._parts.append({'PartNumber': part_number, 'ETag': response['ETag']})
+        self._buffer.clear()
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self.part_size:
+            self._upload_part()
+
+    def close(self, key):
+        if self._upload_id is None:
+            extra = {'ContentType': self.content_type} if self.content_type else {}
+            self.s3_client.put_object(Bucket=self.bucket, Key=key, Body=bytes(self._buffer), **extra)
+            self._finished = True
+            return
+        if self._buffer:
+            self._upload_part()
+        self.s3_client.complete_multipart_upload(Bucket=self.bucket, Key=self._partial_key, UploadId=self._upload_id,
+                                                 MultipartUpload={'Parts': self._parts})
+        self._finished = True
+        try:
+            upload_id = self._create_upload(key)
+            response = self.s3_client.upload_part_copy(Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=1,
+                                                       CopySource={'Bucket': self.bucket, 'Key': self._partial_key})
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id,
+                MultipartUpload={'Parts': [{'PartNumber': 1, 'ETag': response['CopyPartResult']['ETag']}]})
+        finally:
+            self.s3_client.delete_object(Bucket=self.bucket, Key=self._partial_key)
+
+    def _abort(self):
+        if self._upload_id is not None:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self._partial_key, UploadId=self._upload_id)
+
+
+def stream_upload(stream, filename, sink, max_bytes, read_size=READ_SIZE, index=True):
+    """Write, hash and index an uploaded document in a single pass over its bytes.
+
+    Each block read from the stream counts towards the size limit, updates the SHA-256 of the content,
+    goes to the sink, and is decoded and fed to the chunker, whose chunks go to the index builder. On
+    any error, including `UploadTooLarge` and `UnicodeDecodeError`, the sink is aborted. Otherwise it is
+    left open, for the caller to close under the document's content-addressed name or to abort when an
+    identical document is stored already. Without `index`, blocks are still decoded, so a document that
+    is not UTF-8 is rejected at upload, but indexing is left to a background job and the returned index is None.
+
+    Returns the index, the content hash and the size in bytes.
+    """
+    digest = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunker = streaming_chunker(filename) if index else None
+    builder = IndexBuilder()
+    size = 0
+
+    def add(text):
+        if chunker is not None:
+            for chunk in chunker.feed(text):
+                builder.add(chunk)
+
+    try:
+        while True:
+            block = stream.read(read_size)
+            if not block:
+                break
+            size += len(block)
+            if size > max_bytes:
+                raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+            digest.update(block)
+            sink.write(block)
+            add(decoder.decode(block))
+
+        add(decoder.decode(b'', final=True))
+        if chunker is not None:
+            for chunk in chunker.finish():
+                builder.add(chunk)
+    except BaseException:
+        sink.abort()
+        raise
+
+    return builder.build(chunker.header) if chunker is not None else None, digest.hexdigest(), size
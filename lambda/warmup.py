@@ -0,0 +1,56 @@
+import os
+import time
+
+from artifact import ARTIFACT_SUFFIX, load_s3_artifact
+
+# Artifacts of the documents uploaded or reused most recently, loaded into the document cache by a warm-up
+WARMUP_DOCUMENTS = int(os.getenv("WARMUP_DOCUMENTS", "5"))
+# Documents are not loaded when the invocation has less time left than this
+WARMUP_MIN_REMAINING_MS = 2000
+
+DOCUMENTS_PREFIX = "documents/"
+
+
+def is_warmup_event(event):
+    """Whether the invocation is a warm-up: `{"warmup": true}`, or an EventBridge schedule without input."""
+    return isinstance(event, dict) and (event.get('warmup') is True or event.get('detail-type') == 'Scheduled Event')
+
+
+def recent_document_keys(s3_client, bucket, limit=WARMUP_DOCUMENTS):
+    """Keys of the stored documents whose artifacts were written last; reusing a document rewrites its artifact."""
+    artifacts = []
+    request = {'Bucket': bucket, 'Prefix': DOCUMENTS_PREFIX}
+    while True:
+        response = s3_client.list_objects_v2(**request)
+        artifacts.extend(item for item in response.get('Contents', []) if item['Key'].endswith(ARTIFACT_SUFFIX))
+        if not response.get('IsTruncated'):
+            break
+        request['ContinuationToken'] = response['NextContinuationToken']
+    artifacts.sort(key=lambda item: item['LastModified'], reverse=True)
+    return [item['Key'][:-len(ARTIFACT_SUFFIX)] for item in artifacts[:limit]]
+
+
+def warm_documents(s3_client, bucket, cache, limit=WARMUP_DOCUMENTS, context=None):
+    """Load the artifacts of the most recent documents into the container's document cache; return how many."""
+    loaded = 0
+    for document_key in recent_document_keys(s3_client, bucket, limit):
+        if context is not None and context.get_remaining_time_in_millis() < WARMUP_MIN_REMAINING_MS:
+            break
+        if load_s3_artifact(s3_client, bucket, document_key, cache) is not None:
+            loaded += 1
+    print(f"Warm-up loaded {loaded} document artifacts, document cache: {cache.stats()}")
+    return loaded
+
+
+def run_steps(steps):
+    """Run each named warm-up step, logging rather than raising its errors; return their durations in ms."""
+    durations = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"Error warming up {name}: {e}")
+        durations[name] = round((time.perf_counter() - started) * 1000, 1)
+    print(f"Warm-up: {durations} ms")
+    return durations
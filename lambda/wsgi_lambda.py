@@ -0,0 +1,92 @@
+import sys
+from io import BytesIO
+
+from mangum.adapter import DEFAULT_TEXT_MIME_TYPES, HANDLERS
+from mangum.types import LambdaConfig
+
+
+def build_environ(scope, body):
+    """WSGI environ of a request, from the ASGI-style scope Mangum's handlers parse out of a Lambda event.
+
+    ASGI servers may leave the client out of the scope, which Mangum always fills in.
+    """
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': '',
+        'PATH_INFO': scope['path'].encode('utf8').decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('ascii'),
+        'SERVER_NAME': scope['server'][0],
+        'SERVER_PORT': str(scope['server'][1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        # Function URL events do not always carry the header, and Werkzeug reads no body without it
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope['scheme'],
+        'wsgi.input': BytesIO(body),
+        # Flask logs errors to this text stream; stderr reaches CloudWatch
+        'wsgi.errors': sys.stderr,
+        # A Lambda container handles one request at a time
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client') and scope['client'][0] is not None:
+        environ['REMOTE_ADDR'] = scope['client'][0]
+    for name, value in scope['headers']:
+        name = name.decode('latin1')
+        if name == 'content-length':
+            continue
+        key = 'CONTENT_TYPE' if name == 'content-type' else f"HTTP_{name.upper().replace('-', '_')}"
+        value = value.decode('latin1')
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class LambdaWsgiHandler:
+    """Lambda handler calling a WSGI app directly, without an ASGI adapter in between.
+
+    Function URL, API Gateway and ALB events are parsed, and responses shaped, by Mangum's own handlers. The
+    request is then turned straight into a WSGI environ and the app runs in the invoking thread, instead of
+    going through WsgiToAsgi on an event loop and a worker thread, with the body buffered at each layer.
+    """
+
+    def __init__(self, app, api_gateway_base_path="/", text_mime_types=None, exclude_headers=None):
+        self.app = app
+        self.config = LambdaConfig(
+            api_gateway_base_path=api_gateway_base_path or "/",
+            text_mime_types=text_mime_types or [*DEFAULT_TEXT_MIME_TYPES],
+            exclude_headers=[header.lower() for header in exclude_headers or []],
+        )
+
+    def infer(self, event, context):
+        """Mangum's handler for the event's source."""
+        for handler_cls in HANDLERS:
+            if handler_cls.infer(event, context, self.config):
+                return handler_cls(event, context, self.config)
+        raise RuntimeError("The adapter was unable to infer a handler to use for the event.")
+
+    def run(self, scope, body):
+        """Call the app on one request; return the response in the form Mangum's handlers expect."""
+        started = []
+
+        def start_response(status, headers, exc_info=None):
+            started[:] = [int(status.split(' ', 1)[0]),
+                          [[name.lower().encode('latin1'), value.encode('latin1')] for name, value in headers]]
+
+        try:
+            app_iter = self.app(build_environ(scope, body), start_response)
+            try:
+                response_body = b"".join(app_iter)
+            finally:
+                if hasattr(app_iter, 'close'):
+                    app_iter.close()
+        except Exception as e:
+            print(f"Error running the application: {e}")
+            return {'status': 500, 'headers': [[b"content-type", b"text/plain; charset=utf-8"]],
+                    'body': b"Internal Server Error"}
+        status, headers = started
+        return {'status': status, 'headers': headers, 'body': response_body}
+
+    def __call__(self, event, context):
+        handler = self.infer(event, context)
+        return handler(self.run(handler.scope, handler.body))
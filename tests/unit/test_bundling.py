@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from client_base_rag.bundling import slim_bundle, trace_imports
+
+
+def write(root, path, content=''):
+    path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def make_asset(root):
+    write(root, 'app.py', 'import used\nfrom lazy import helper\n\ndef handler():\n    import on_demand\n')
+    write(root, 'used/__init__.py', 'from .core import run\n')
+    write(root, 'used/core.py', 'try:\n    import cli_only\nexcept ImportError:\n    cli_only = None\n')
+    write(root, 'used/data/schema.json', '{}')
+    write(root, 'used/tests/test_core.py')
+    write(root, 'used-1.0.dist-info/METADATA')
+    write(root, 'used-1.0.dist-info/RECORD', 'used/__init__.py,,\nused/core.py,,\n../../bin/tool,,\n')
+    write(root, 'lazy/__init__.py')
+    write(root, 'lazy/helper.py', 'import debug_only\n')
+    write(root, 'on_demand.py')
+    write(root, 'cli_only/__init__.py')
+    write(root, 'debug_only/__init__.py')
+    write(root, 'unused/__init__.py')
+    write(root, 'by_name/__init__.py')
+    write(root, 'bin/tool', '#!/bin/sh\n')
+    write(root, 'templates/index.html', '<html></html>')
+
+
+def test_trace_imports_follows_lazy_relative_and_submodule_imports(tmp_path):
+    make_asset(str(tmp_path))
+
+    reached = trace_imports(str(tmp_path), ['app'])
+
+    assert {'app', 'used', 'used.core', 'lazy', 'lazy.helper', 'on_demand', 'debug_only'} <= reached
+    assert 'cli_only' not in reached  # guarded by `except ImportError`
+    assert 'unused' not in reached
+
+
+def test_slim_bundle_drops_unreached_packages_and_metadata(tmp_path):
+    source, output = str(tmp_path / 'asset'), str(tmp_path / 'bundle')
+    make_asset(source)
+
+    report = slim_bundle(source, output, keep=('by_name',), drop=('debug_only',), runtime_version=(0, 0))
+
+    assert report['dropped'] == ['cli_only', 'debug_only', 'unused']
+    assert report['size_after'] < report['size_before']
+    bundled = {os.path.relpath(os.path.join(directory, name), output)
+               for directory, _, names in os.walk(output) for name in names}
+    assert bundled == {
+        'app.py', 'on_demand.py', 'used/__init__.py', 'used/core.py', 'used/data/schema.json',
+        'lazy/__init__.py', 'lazy/helper.py', 'by_name/__init__.py', 'templates/index.html',
+    }
+
+
+def test_slim_bundle_fails_on_packages_the_app_imports_but_the_asset_lacks(tmp_path):
+    source, output = str(tmp_path / 'asset'), str(tmp_path / 'bundle')
+    make_asset(source)
+    write(source, 'retrieval.py', 'import json\nimport absent\n\ndef search():\n    from used import core\n')
+    # Vendored packages may import what the function never needs
+    write(source, 'vendored.py', 'import optional_extra\n')
+    write(source, 'vendored-1.0.dist-info/RECORD', 'vendored.py,,\n')
+
+    with pytest.raises(RuntimeError, match="does not bundle absent,"):
+        slim_bundle(source, output, keep=('by_name',), drop=('debug_only',), runtime_version=(0, 0))
@@ -1,5 +1,11 @@
+import glob
+import os
+import shutil
+import sys
+
 import aws_cdk as core
 import aws_cdk.assertions as assertions
+import pytest
 from client_base_rag.client_base_rag_stack import ClientBaseRagStack
 
 
@@ -32,7 +38,8 @@ def test_s3_bucket_properties():
 def test_lambda_functions_created():
     """Ensure the correct number of Lambda functions are created."""
     template = get_template()
-    template.resource_count_is("AWS::Lambda::Function", 2)
+    # The app, the indexer, and the providers of the auto-delete and bucket notification custom resources
+    template.resource_count_is("AWS::Lambda::Function", 4)
 
 
 def test_lambda_properties():
@@ -72,13 +79,14 @@ def test_no_secrets_created():
 def test_iam_roles_created():
     """Ensure the correct number of IAM roles are created."""
     template = get_template()
-    template.resource_count_is("AWS::IAM::Role", 2)
+    template.resource_count_is("AWS::IAM::Role", 4)
 
 
 def test_iam_policy_created():
     """Ensure the correct IAM policy is created."""
     template = get_template()
-    template.resource_count_is("AWS::IAM::Policy", 1)
+    # The app, the indexer and the bucket notifications handler
+    template.resource_count_is("AWS::IAM::Policy", 3)
 
 
 def test_iam_policy_properties():
@@ -101,6 +109,11 @@ def test_iam_policy_properties():
                                                    {"Ref": "AWS::Region"}, ":", {"Ref": "AWS::AccountId"},
                                                    ":secret:app-session-secret-key-??????"]]}
                 },
+                {
+                    "Action": "secretsmanager:BatchGetSecretValue",
+                    "Effect": "Allow",
+                    "Resource": "*"
+                },
                 {
                     "Action": [
                         "s3:GetObject*",
@@ -119,6 +132,27 @@ def test_iam_policy_properties():
                         {"Fn::GetAtt": ["ClientBaseRagBucket253728B3", "Arn"]},
                         {"Fn::Join": ["", [{"Fn::GetAtt": ["ClientBaseRagBucket253728B3", "Arn"]}, "/*"]]}
                     ]
+                },
+                {
+                    "Action": [
+                        "dynamodb:BatchGetItem",
+                        "dynamodb:GetRecords",
+                        "dynamodb:GetShardIterator",
+                        "dynamodb:Query",
+                        "dynamodb:GetItem",
+                        "dynamodb:Scan",
+                        "dynamodb:ConditionCheckItem",
+                        "dynamodb:BatchWriteItem",
+                        "dynamodb:PutItem",
+                        "dynamodb:UpdateItem",
+                        "dynamodb:DeleteItem",
+                        "dynamodb:DescribeTable",
+                    ],
+                    "Effect": "Allow",
+                    "Resource": [
+                        {"Fn::GetAtt": ["RateLimitTableFAD921A1", "Arn"]},
+                        {"Ref": "AWS::NoValue"}
+                    ]
                 }
             ],
             "Version": "2012-10-17"
@@ -126,6 +160,23 @@ def test_iam_policy_properties():
     })
 
 
+def test_rate_limit_table_created():
+    """Ensure the shared rate limit table expires its items and is passed to the Flask function."""
+    template = get_template()
+    template.resource_count_is("AWS::DynamoDB::Table", 1)
+    template.has_resource_properties("AWS::DynamoDB::Table", {
+        "KeySchema": [{"AttributeName": "identity", "KeyType": "HASH"}],
+        "BillingMode": "PAY_PER_REQUEST",
+        "TimeToLiveSpecification": {"AttributeName": "expires_at", "Enabled": True}
+    })
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "lambda_function.handler",
+        "Environment": {
+            "Variables": {"RATE_LIMIT_TABLE": {"Ref": "RateLimitTableFAD921A1"}}
+        }
+    })
+
+
 def test_lambda_function_url_output():
     """Ensure the correct output for the Lambda Function URL."""
     template = get_template()
@@ -170,7 +221,8 @@ def test_lambda_environment_variables():
     session_secret_key_arn = matched_lambda.get("SESSION_SECRET_KEY_ARN")
 
     assert openai_secret_arn is not None, f"OPENAI_SECRET_ARN not found in environment variables: {matched_lambda}"
-    assert session_secret_key_arn is not None, f"SESSION_SECRET_KEY_ARN not found in environment variables: {matched_lambda}"
+    assert session_secret_key_arn is not None, \
+        f"SESSION_SECRET_KEY_ARN not found in environment variables: {matched_lambda}"
 
     if isinstance(openai_secret_arn, dict) and 'Fn::Join' in openai_secret_arn:
         assert openai_secret_arn == {
@@ -211,3 +263,71 @@ def test_output_lambda_function_url():
         }
     })
 
+
+def test_response_streaming_deployment():
+    """Ensure the response streaming opt-in runs the app behind the Lambda Web Adapter."""
+    app = core.App(context={"response_streaming": "true"})
+    template = assertions.Template.from_stack(ClientBaseRagStack(app, "ClientBaseRagStack"))
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "run.sh",
+        "Layers": assertions.Match.any_value(),
+        "Environment": {
+            "Variables": assertions.Match.object_like({
+                "AWS_LAMBDA_EXEC_WRAPPER": "/opt/bootstrap",
+                "AWS_LWA_INVOKE_MODE": "response_stream",
+                "STREAM_RESPONSES": "true",
+            })
+        }
+    })
+    template.has_resource_properties("AWS::Lambda::Url", {"InvokeMode": "RESPONSE_STREAM"})
+
+
+def test_indexer_triggered_by_stored_documents():
+    """Ensure new documents, but not copies of them, trigger the indexer function."""
+    template = get_template()
+    template.has_resource_properties("AWS::Lambda::Function", {
+        "Handler": "index_function.handler",
+        "Runtime": "python3.9",
+        "Environment": {
+            "Variables": {"BUCKET_NAME": {"Ref": "ClientBaseRagBucket253728B3"}}
+        }
+    })
+    notifications = template.find_resources("Custom::S3BucketNotifications")
+    configurations = [configuration for resource in notifications.values() for configuration in
+                      resource["Properties"]["NotificationConfiguration"]["LambdaFunctionConfigurations"]]
+    assert sorted(event for configuration in configurations for event in configuration["Events"]) == [
+        "s3:ObjectCreated:CompleteMultipartUpload", "s3:ObjectCreated:CompleteMultipartUpload",
+        "s3:ObjectCreated:Put", "s3:ObjectCreated:Put",
+    ]
+    for configuration in configurations:
+        assert {"Name": "prefix", "Value": "documents/"} in configuration["Filter"]["Key"]["FilterRules"]
+
+
+def test_warm_up_schedule():
+    """Ensure the warm-up opt-in invokes the Flask function on a schedule with a warm-up event."""
+    get_template().resource_count_is("AWS::Events::Rule", 0)
+    app = core.App(context={"warmup_minutes": "5"})
+    template = assertions.Template.from_stack(ClientBaseRagStack(app, "ClientBaseRagStack"))
+    template.has_resource_properties("AWS::Events::Rule", {
+        "ScheduleExpression": "rate(5 minutes)",
+        "Targets": [assertions.Match.object_like({
+            "Arn": {"Fn::GetAtt": ["FlaskLambdaAC2C84A8", "Arn"]},
+            "Input": '{"warmup":true}',
+        })]
+    })
+    template.has_resource_properties("AWS::Lambda::Permission", {
+        "Principal": "events.amazonaws.com",
+        "FunctionName": {"Fn::GetAtt": ["FlaskLambdaAC2C84A8", "Arn"]},
+    })
+
+
+@pytest.mark.skipif(sys.version_info[:2] != (3, 9) and shutil.which("docker") is None,
+                    reason="precompiling for Python 3.9 needs Python 3.9 or Docker")
+def test_lambda_asset_is_precompiled_for_the_runtime():
+    """Ensure the bundled Lambda asset ships bytecode for the function's Python version."""
+    app = core.App()
+    ClientBaseRagStack(app, "ClientBaseRagStack")
+    assembly = app.synth()
+    assets = os.path.join(assembly.directory, "asset.*")
+    assert glob.glob(os.path.join(assets, "__pycache__", "lambda_function.cpython-39.pyc"))
+    assert glob.glob(os.path.join(assets, "flask", "__pycache__", "app.cpython-39.pyc"))
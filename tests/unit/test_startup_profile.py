@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                'benchmarks'))
+
+from startup_profile import aggregate_by_package, bundled_requirements, check_budget, parse_self_times  # noqa: E402
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3000 |       3000 |     numpy._core.multiarray
+import time:     21000 |      24000 |   numpy
+import time:      9000 |       9000 |       pydantic.main
+import time:      1000 |      10000 |     pydantic
+import time:      2500 |      12500 |   openai
+Traceback lines and other output are ignored
+import time:       800 |      37420 | lambda_function
+"""
+
+
+def test_parse_self_times_reads_importtime_output():
+    assert list(parse_self_times(IMPORTTIME_OUTPUT)) == [
+        ('_io', 0.00012), ('numpy._core.multiarray', 0.003), ('numpy', 0.021), ('pydantic.main', 0.009),
+        ('pydantic', 0.001), ('openai', 0.0025), ('lambda_function', 0.0008),
+    ]
+
+
+def test_aggregate_by_package_sums_submodules():
+    packages = aggregate_by_package(parse_self_times(IMPORTTIME_OUTPUT))
+    assert packages['numpy'] == pytest.approx(0.024)
+    assert packages['pydantic'] == pytest.approx(0.010)
+
+
+def test_check_budget_reports_every_exceeded_budget():
+    packages = aggregate_by_package(parse_self_times(IMPORTTIME_OUTPUT))
+
+    assert check_budget(packages, {'total_ms': 100, 'packages_ms': {'numpy': 50, 'httpx': 0}}) == []
+    assert check_budget(packages, {'total_ms': 30, 'packages_ms': {'numpy': 20, 'openai': 0}}) == [
+        "total startup imports take 37.4 ms, budget is 30 ms",
+        "numpy imports take 24.0 ms, budget is 20 ms",
+        "openai is imported at startup (2.5 ms) but must be imported lazily",
+    ]
+
+
+def test_bundled_requirements_pin_the_vendored_versions(tmp_path):
+    for name in ('Flask_Limiter-3.8.0.dist-info', 'python_dateutil-2.9.0.post0.dist-info', 'numpy'):
+        (tmp_path / name).mkdir()
+    (tmp_path / 'six.py').write_text('')
+
+    assert bundled_requirements(str(tmp_path)) == ['Flask_Limiter==3.8.0', 'python_dateutil==2.9.0.post0']